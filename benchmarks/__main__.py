@@ -0,0 +1,76 @@
+"""Run benchmarks and compare them to a baseline.
+
+Usage::
+
+    python -m benchmarks [--suite resolve] [--output results.json]
+        [--baseline baseline.json] [--save-baseline] [--tolerance 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import bench_resolve  # noqa: F401 (register benchmarks)
+from benchmarks._harness import (
+    compare_results,
+    dump_results,
+    get_suites,
+    load_results,
+    run_suites,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=sorted(get_suites()),
+        help="Suite to run, can be repeated. Run all suites by default.",
+    )
+    parser.add_argument("-k", dest="pattern", help="Only run matching benchmarks.")
+    parser.add_argument("--output", type=Path, help="Write results to this file.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store results as the new baseline instead of comparing them.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown allowed before reporting a regression.",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Run fewer and shorter rounds."
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suites(
+        args.suite or sorted(get_suites()), pattern=args.pattern, quick=args.quick
+    )
+    if args.output:
+        dump_results(results, args.output)
+    if args.save_baseline:
+        if args.baseline.exists():
+            results = {**load_results(args.baseline), **results}
+        dump_results(results, args.baseline)
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}")
+        return 0
+
+    print(f"\nCompared to {args.baseline}:")
+    regressions = compare_results(
+        results, load_results(args.baseline), tolerance=args.tolerance
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Minimal benchmark harness based on `timeit`.
+
+Benchmarks are plain functions decorated with `benchmark`. They receive nothing and
+return a callable which is timed. Anything done before returning the callable is
+considered as setup and is not timed.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from typing import TypeAlias
+
+    Setup: TypeAlias = Callable[[], Callable[[], object]]
+
+_BENCHMARKS: dict[str, dict[str, Setup]] = {}
+
+
+def benchmark(suite: str, name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup function in given suite."""
+
+    def decorator(setup: Setup) -> Setup:
+        _BENCHMARKS.setdefault(suite, {})[name] = setup
+        return setup
+
+    return decorator
+
+
+def get_suites() -> dict[str, dict[str, Setup]]:
+    return _BENCHMARKS
+
+
+@dataclass
+class Result:
+    ns_per_op: float
+    """Median time of one call, in nanoseconds"""
+    best_ns_per_op: float
+    """Best time of one call, in nanoseconds"""
+    ops: int
+    """Number of calls per timing round"""
+
+
+def time_callable(
+    function: Callable[[], object], *, repeat: int = 5, min_time: float = 0.2
+) -> Result:
+    """Time given callable, calibrating the number of calls to run for min_time."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    timings = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return Result(
+        ns_per_op=statistics.median(timings), best_ns_per_op=min(timings), ops=number
+    )
+
+
+def run_suites(
+    suites: list[str], *, pattern: str | None = None, quick: bool = False
+) -> dict[str, Result]:
+    results: dict[str, Result] = {}
+    for suite in suites:
+        for name, setup in _BENCHMARKS[suite].items():
+            full_name = f"{suite}.{name}"
+            if pattern and pattern not in full_name:
+                continue
+            function = setup()
+            results[full_name] = time_callable(
+                function, repeat=3 if quick else 5, min_time=0.05 if quick else 0.2
+            )
+            print(f"{full_name:<60} {results[full_name].ns_per_op:>14,.0f} ns/op")
+    return results
+
+
+def dump_results(results: dict[str, Result], path: Path) -> None:
+    path.write_text(
+        json.dumps(
+            {
+                "machine": {
+                    "python": sys.version.split()[0],
+                    "implementation": platform.python_implementation(),
+                    "platform": platform.platform(),
+                },
+                "results": {name: asdict(result) for name, result in results.items()},
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n"
+    )
+
+
+def load_results(path: Path) -> dict[str, Result]:
+    data: dict[str, Any] = json.loads(path.read_text())
+    return {name: Result(**result) for name, result in data["results"].items()}
+
+
+def compare_results(
+    results: dict[str, Result], baseline: dict[str, Result], *, tolerance: float
+) -> list[str]:
+    """Print results compared to baseline and return names of regressed benchmarks."""
+    regressions: list[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result.ns_per_op / baseline[name].ns_per_op
+        status = ""
+        if ratio > 1 + tolerance:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - tolerance:
+            status = "improvement"
+        print(f"{name:<60} {ratio:>7.2f}x {status}")
+    return regressions
@@ -0,0 +1,199 @@
+"""Single-threaded resolution benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator  # noqa: TC003
+from contextlib import contextmanager
+from itertools import cycle
+from typing import TYPE_CHECKING, Protocol
+
+from benchmarks._harness import benchmark
+from benchmarks.graphs import chain, fan_out, layered
+from handless import Container, Scoped, Singleton, Transient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from handless.lifetimes import Lifetime
+
+SUITE = "resolve"
+
+
+class Service:
+    pass
+
+
+class IService(Protocol):
+    pass
+
+
+class Resource:
+    def __init__(self) -> None:
+        self.opened = True
+
+
+# NOTE: handless evaluates annotations when binding, Iterator must exist at runtime
+@contextmanager
+def open_resource() -> Iterator[Resource]:
+    resource = Resource()
+    yield resource
+    resource.opened = False
+
+
+async def create_service() -> Service:
+    return Service()
+
+
+def _resolve_lifetime(lifetime: type[Lifetime]) -> Callable[[], object]:
+    container = Container()
+    container.bind(Service).to_self(lifetime)
+    scope = container.create_scope()
+    return lambda: scope.resolve(Service)
+
+
+@benchmark(SUITE, "transient")
+def transient() -> Callable[[], object]:
+    return _resolve_lifetime(Transient)
+
+
+@benchmark(SUITE, "scoped")
+def scoped() -> Callable[[], object]:
+    return _resolve_lifetime(Scoped)
+
+
+@benchmark(SUITE, "singleton")
+def singleton() -> Callable[[], object]:
+    return _resolve_lifetime(Singleton)
+
+
+@benchmark(SUITE, "to_value")
+def to_value() -> Callable[[], object]:
+    container = Container()
+    container.bind(Service).to_value(Service())
+    scope = container.create_scope()
+    return lambda: scope.resolve(Service)
+
+
+@benchmark(SUITE, "alias")
+def alias() -> Callable[[], object]:
+    container = Container()
+    container.bind(Service).to_self()
+    container.bind(IService).to(Service)  # type: ignore[type-abstract]
+    scope = container.create_scope()
+    return lambda: scope.resolve(IService)  # type: ignore[type-abstract]
+
+
+@benchmark(SUITE, "managed_context_manager")
+def managed_context_manager() -> Callable[[], object]:
+    container = Container()
+    container.bind(Resource).to_factory(open_resource)
+
+    def run() -> None:
+        with container.create_scope() as scope:
+            scope.resolve(Resource)
+
+    return run
+
+
+@benchmark(SUITE, "scope_churn")
+def scope_churn() -> Callable[[], object]:
+    container = Container()
+    container.bind(Service).to_self(Scoped)
+
+    def run() -> None:
+        scope = container.create_scope()
+        scope.resolve(Service)
+        scope.close()
+
+    return run
+
+
+def _resolve_graph_root(
+    graph_root: type[object], container: Container
+) -> Callable[[], object]:
+    scope = container.create_scope()
+    return lambda: scope.resolve(graph_root)
+
+
+@benchmark(SUITE, "depth_10")
+def depth_10() -> Callable[[], object]:
+    graph = chain(10)
+    graph.bind(container := Container())
+    return _resolve_graph_root(graph.roots[0], container)
+
+
+@benchmark(SUITE, "depth_50")
+def depth_50() -> Callable[[], object]:
+    graph = chain(50)
+    graph.bind(container := Container())
+    return _resolve_graph_root(graph.roots[0], container)
+
+
+@benchmark(SUITE, "width_10")
+def width_10() -> Callable[[], object]:
+    graph = fan_out(10)
+    graph.bind(container := Container())
+    return _resolve_graph_root(graph.roots[0], container)
+
+
+@benchmark(SUITE, "width_50")
+def width_50() -> Callable[[], object]:
+    graph = fan_out(50)
+    graph.bind(container := Container())
+    return _resolve_graph_root(graph.roots[0], container)
+
+
+@benchmark(SUITE, "scoped_graph_100")
+def scoped_graph_100() -> Callable[[], object]:
+    """Resolve all roots of a 100 types scoped graph in a new scope."""
+    graph = layered(100, depth=5, width=3)
+    graph.bind(container := Container(), Scoped)
+
+    def run() -> None:
+        with container.create_scope() as scope:
+            for root in graph.roots:
+                scope.resolve(root)
+
+    return run
+
+
+@benchmark(SUITE, "singleton_graph_10k")
+def singleton_graph_10k() -> Callable[[], object]:
+    """Resolve warm singletons from a container holding 10k bindings."""
+    graph = layered(10_000, depth=10, width=3)
+    graph.bind(container := Container(), Singleton)
+    scope = container.create_scope()
+    for root in graph.roots:
+        scope.resolve(root)
+    roots = cycle(graph.roots)
+    return lambda: scope.resolve(next(roots))
+
+
+@benchmark(SUITE, "bind_1k")
+def bind_1k() -> Callable[[], object]:
+    """Bind 1k already introspected types into a new container."""
+    graph = layered(1_000, depth=5, width=3)
+    graph.bind(Container())
+    return lambda: graph.bind(Container())
+
+
+@benchmark(SUITE, "fork_10k")
+def fork_10k() -> Callable[[], object]:
+    graph = layered(10_000, depth=10, width=3)
+    graph.bind(container := Container())
+    return container.fork
+
+
+@benchmark(SUITE, "aresolve_async_factory_x100")
+def aresolve_async_factory() -> Callable[[], object]:
+    container = Container()
+    container.bind(Service).to_factory(create_service)
+    scope = container.create_scope()
+    loop = asyncio.new_event_loop()
+
+    async def run() -> None:
+        for _ in range(100):
+            await scope.aresolve(Service)
+
+    return lambda: loop.run_until_complete(run())
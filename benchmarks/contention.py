@@ -0,0 +1,375 @@
+"""Scalability benchmark of resolution under threads and asyncio tasks contention.
+
+For each level of concurrency, it reports throughput, p50/p99 latency of a single
+resolution and the time spent waiting on lifetime contexts locks (the context shared
+lock and the per-binding registration locks).
+
+Usage::
+
+    python -m benchmarks.contention [--output contention.json] [--quick]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.graphs import layered
+from handless import Container, Scoped, Singleton
+from handless.lifetimes import LifetimeContext
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+    from types import TracebackType
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+TASKS = (1, 10, 100, 1_000, 10_000)
+
+
+@dataclass
+class LockWaits:
+    acquisitions: int = 0
+    contended: int = 0
+    wait_ns: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, wait_ns: int | None) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            if wait_ns is not None:
+                self.contended += 1
+                self.wait_ns += wait_ns
+
+    def reset(self) -> None:
+        with self._lock:
+            self.acquisitions = self.contended = self.wait_ns = 0
+
+
+class TimedLock:
+    """Wrap a threading lock to record time spent waiting for it."""
+
+    def __init__(self, lock: Any, waits: LockWaits) -> None:  # noqa: ANN401
+        self._lock = lock
+        self._waits = waits
+
+    def acquire(self, blocking: bool = True) -> bool:  # noqa: FBT001, FBT002
+        if self._lock.acquire(blocking=False):
+            self._waits.record(None)
+            return True
+        if not blocking:
+            return False
+        start = time.perf_counter_ns()
+        self._lock.acquire()
+        self._waits.record(time.perf_counter_ns() - start)
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+class TimedAsyncLock:
+    """Wrap an asyncio lock to record time spent waiting for it."""
+
+    def __init__(self, waits: LockWaits) -> None:
+        self._lock = asyncio.Lock()
+        self._waits = waits
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    async def acquire(self) -> bool:
+        if not self._lock.locked():
+            await self._lock.acquire()
+            self._waits.record(None)
+            return True
+        start = time.perf_counter_ns()
+        await self._lock.acquire()
+        self._waits.record(time.perf_counter_ns() - start)
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+
+@dataclass
+class Waits:
+    context: LockWaits = field(default_factory=LockWaits)
+    registration: LockWaits = field(default_factory=LockWaits)
+
+    def reset(self) -> None:
+        self.context.reset()
+        self.registration.reset()
+
+
+@contextmanager
+def instrument_locks() -> Iterator[Waits]:
+    """Replace locks of lifetime contexts created within this block by timed ones."""
+    waits = Waits()
+    original_init = LifetimeContext.__init__
+
+    def __init__(self: LifetimeContext, owner: object | None = None) -> None:  # noqa: N807
+        original_init(self, owner)
+        # ruff: noqa: SLF001
+        self._lock = TimedLock(self._lock, waits.context)  # type: ignore[assignment]
+        self._async_lock = TimedAsyncLock(waits.context)  # type: ignore[assignment]
+        registration_locks: defaultdict[int, Any] = defaultdict(
+            lambda: TimedLock(threading.RLock(), waits.registration)
+        )
+        async_registration_locks: defaultdict[int, Any] = defaultdict(
+            lambda: TimedAsyncLock(waits.registration)
+        )
+        self._registration_locks = registration_locks
+        self._async_registration_locks = async_registration_locks
+
+    LifetimeContext.__init__ = __init__  # type: ignore[method-assign]
+    try:
+        yield waits
+    finally:
+        LifetimeContext.__init__ = original_init  # type: ignore[method-assign]
+
+
+@dataclass
+class Measure:
+    scenario: str
+    workers: int
+    ops: int
+    throughput: float
+    """Resolutions per second"""
+    p50_us: float
+    p99_us: float
+    context_lock_wait_ms: float
+    registration_lock_wait_ms: float
+    contended_acquisitions: int
+
+
+def _percentile(latencies: list[int], percentile: int) -> float:
+    if len(latencies) == 1:
+        return latencies[0] / 1000
+    return statistics.quantiles(latencies, n=100)[percentile - 1] / 1000
+
+
+def _measure(
+    scenario: str, workers: int, waits: Waits, latencies: list[int], elapsed: float
+) -> Measure:
+    return Measure(
+        scenario=scenario,
+        workers=workers,
+        ops=len(latencies),
+        throughput=len(latencies) / elapsed,
+        p50_us=_percentile(latencies, 50),
+        p99_us=_percentile(latencies, 99),
+        context_lock_wait_ms=waits.context.wait_ns / 1e6,
+        registration_lock_wait_ms=waits.registration.wait_ns / 1e6,
+        contended_acquisitions=waits.context.contended + waits.registration.contended,
+    )
+
+
+class SlowSingleton:
+    def __init__(self) -> None:
+        time.sleep(0.005)
+
+
+async def create_slow_singleton() -> SlowSingleton:
+    await asyncio.sleep(0.005)
+    return SlowSingleton.__new__(SlowSingleton)
+
+
+def _create_container(*, async_: bool) -> tuple[Container, type[Any]]:
+    container = Container()
+    if async_:
+        container.bind(SlowSingleton).to_factory(create_slow_singleton, Singleton)
+    else:
+        container.bind(SlowSingleton).to_self(Singleton)
+    graph = layered(30, depth=3, width=3)
+    graph.bind(container, Scoped)
+    return container, graph.roots[0]
+
+
+def run_threads(
+    scenario: str, workers: int, ops_per_worker: int, resolve: Callable[[], object]
+) -> tuple[list[int], float]:
+    barrier = threading.Barrier(workers)
+    latencies: list[list[int]] = [[] for _ in range(workers)]
+
+    def work(index: int) -> None:
+        barrier.wait()
+        for _ in range(ops_per_worker):
+            start = time.perf_counter_ns()
+            resolve()
+            latencies[index].append(time.perf_counter_ns() - start)
+
+    threads = [
+        threading.Thread(target=work, args=(i,), name=f"{scenario}-{i}")
+        for i in range(workers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return [lat for worker in latencies for lat in worker], time.perf_counter() - start
+
+
+async def run_tasks(
+    workers: int, ops_per_worker: int, resolve: Callable[[], Awaitable[object]]
+) -> tuple[list[int], float]:
+    latencies: list[int] = []
+    start_event = asyncio.Event()
+
+    async def work() -> None:
+        await start_event.wait()
+        for _ in range(ops_per_worker):
+            start = time.perf_counter_ns()
+            await resolve()
+            latencies.append(time.perf_counter_ns() - start)
+
+    tasks = [asyncio.create_task(work()) for _ in range(workers)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    start_event.set()
+    await asyncio.gather(*tasks)
+    return latencies, time.perf_counter() - start
+
+
+def bench_threads(threads: tuple[int, ...], total_ops: int) -> list[Measure]:
+    measures: list[Measure] = []
+    with instrument_locks() as waits:
+        for workers in threads:
+            ops = max(1, total_ops // workers)
+
+            container, root = _create_container(async_=False)
+
+            def resolve_singleton(container: Container = container) -> object:
+                return container.create_scope().resolve(SlowSingleton)
+
+            def resolve_scoped_graph(
+                container: Container = container, root: type[Any] = root
+            ) -> None:
+                with container.create_scope() as scope:
+                    scope.resolve(root)
+
+            waits.reset()
+            latencies, elapsed = run_threads("cold", workers, 1, resolve_singleton)
+            measures.append(
+                _measure("threads/singleton_cold", workers, waits, latencies, elapsed)
+            )
+            waits.reset()
+            latencies, elapsed = run_threads("warm", workers, ops, resolve_singleton)
+            measures.append(
+                _measure("threads/singleton_warm", workers, waits, latencies, elapsed)
+            )
+            waits.reset()
+            latencies, elapsed = run_threads(
+                "scoped", workers, max(1, ops // 10), resolve_scoped_graph
+            )
+            measures.append(
+                _measure("threads/scoped_graph", workers, waits, latencies, elapsed)
+            )
+            container.close()
+    return measures
+
+
+def bench_tasks(tasks: tuple[int, ...], total_ops: int) -> list[Measure]:
+    measures: list[Measure] = []
+
+    async def main() -> None:
+        for workers in tasks:
+            ops = max(1, total_ops // workers)
+            container, root = _create_container(async_=True)
+
+            async def resolve_singleton(container: Container = container) -> object:
+                return await container.create_scope().aresolve(SlowSingleton)
+
+            async def resolve_scoped_graph(
+                container: Container = container, root: type[Any] = root
+            ) -> None:
+                async with container.create_scope() as scope:
+                    await scope.aresolve(root)
+
+            waits.reset()
+            latencies, elapsed = await run_tasks(workers, 1, resolve_singleton)
+            measures.append(
+                _measure("tasks/singleton_cold", workers, waits, latencies, elapsed)
+            )
+            waits.reset()
+            latencies, elapsed = await run_tasks(workers, ops, resolve_singleton)
+            measures.append(
+                _measure("tasks/singleton_warm", workers, waits, latencies, elapsed)
+            )
+            waits.reset()
+            latencies, elapsed = await run_tasks(
+                workers, max(1, ops // 10), resolve_scoped_graph
+            )
+            measures.append(
+                _measure("tasks/scoped_graph", workers, waits, latencies, elapsed)
+            )
+            await container.aclose()
+
+    with instrument_locks() as waits:
+        asyncio.run(main())
+    return measures
+
+
+def print_measures(measures: list[Measure]) -> None:
+    print(
+        f"{'scenario':<24} {'workers':>7} {'ops':>7} {'ops/s':>11} {'p50 us':>9} "
+        f"{'p99 us':>9} {'ctx wait ms':>12} {'reg wait ms':>12} {'contended':>9}"
+    )
+    for m in measures:
+        print(
+            f"{m.scenario:<24} {m.workers:>7} {m.ops:>7} {m.throughput:>11,.0f} "
+            f"{m.p50_us:>9.1f} {m.p99_us:>9.1f} {m.context_lock_wait_ms:>12.2f} "
+            f"{m.registration_lock_wait_ms:>12.2f} {m.contended_acquisitions:>9}"
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.contention")
+    parser.add_argument("--output", type=Path, help="Write results to this file.")
+    parser.add_argument(
+        "--quick", action="store_true", help="Run less operations per level."
+    )
+    args = parser.parse_args(argv)
+
+    total_ops = 2_000 if args.quick else 20_000
+    measures = bench_threads(THREADS, total_ops) + bench_tasks(TASKS, total_ops)
+    print_measures(measures)
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(m) for m in measures], indent=2) + "\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
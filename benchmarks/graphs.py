@@ -0,0 +1,104 @@
+"""Synthetic dependency graphs generator.
+
+Generated types are plain classes whose constructor declares typed parameters, so
+that handless introspects them exactly like user defined classes.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from inspect import Parameter, Signature
+from typing import TYPE_CHECKING, Any
+
+from handless import Transient
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from handless import Container
+    from handless.lifetimes import Lifetime
+
+
+def create_type(name: str, dependencies: Sequence[type[Any]]) -> type[Any]:
+    """Create a class whose constructor requires given dependencies."""
+
+    def __init__(self: Any, **kwargs: Any) -> None:  # noqa: ANN401, N807
+        self.__dict__.update(kwargs)
+
+    __init__.__signature__ = Signature(  # type: ignore[attr-defined]
+        [
+            Parameter("self", Parameter.POSITIONAL_OR_KEYWORD),
+            *(
+                Parameter(f"dep{i}", Parameter.KEYWORD_ONLY, annotation=dependency)
+                for i, dependency in enumerate(dependencies)
+            ),
+        ]
+    )
+    return type(name, (), {"__init__": __init__})
+
+
+@dataclass
+class Graph:
+    layers: list[list[type[Any]]] = field(default_factory=list)
+    """Generated types by layer, the first layer only contains leaves"""
+
+    @property
+    def types(self) -> list[type[Any]]:
+        return [type_ for layer in self.layers for type_ in layer]
+
+    @property
+    def roots(self) -> list[type[Any]]:
+        return self.layers[-1]
+
+    def bind(
+        self, container: Container, lifetime: Lifetime | type[Lifetime] = Transient
+    ) -> None:
+        for type_ in self.types:
+            container.bind(type_).to_self(lifetime)
+
+
+def generate_graph(
+    layer_sizes: Sequence[int], *, width: int, seed: int = 0, prefix: str = "Node"
+) -> Graph:
+    """Generate a layered acyclic graph of types.
+
+    Each type of a layer depends on ``width`` distinct types picked randomly from the
+    previous layer (or all of them if that layer is smaller).
+
+    :param layer_sizes: Number of types per layer, starting from leaves.
+    :param width: Number of dependencies of each non leaf type.
+    :param seed: Seed used to pick dependencies for reproducible graphs.
+    :param prefix: Prefix of generated types names.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    graph = Graph()
+    for depth, size in enumerate(layer_sizes):
+        previous = graph.layers[-1] if graph.layers else []
+        graph.layers.append(
+            [
+                create_type(
+                    f"{prefix}{depth}_{i}",
+                    rng.sample(previous, min(width, len(previous))),
+                )
+                for i in range(size)
+            ]
+        )
+    return graph
+
+
+def chain(depth: int) -> Graph:
+    """Generate ``depth`` types each depending on the previous one."""
+    return generate_graph([1] * depth, width=1, prefix="Chain")
+
+
+def fan_out(width: int) -> Graph:
+    """Generate a single root type depending on ``width`` leaves."""
+    return generate_graph([width, 1], width=width, prefix="FanOut")
+
+
+def layered(size: int, *, depth: int, width: int) -> Graph:
+    """Generate ``size`` types spread over ``depth`` layers."""
+    sizes = [size // depth] * depth
+    sizes[0] += size - sum(sizes)
+    return generate_graph(sizes, width=width, prefix="Layered")
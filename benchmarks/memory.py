@@ -0,0 +1,284 @@
+"""Memory footprint benchmark of containers, bindings, cached instances and scopes.
+
+Memory is measured with `tracemalloc`, after a full garbage collection, as the net
+number of bytes and memory blocks still allocated after an operation (retained) and
+the peak reached during it.
+
+The churn benchmark repeatedly creates, uses and drops containers over fresh types
+(like factories created at runtime would) and reports how handless internal
+registries grow over rounds to expose leaks.
+
+Usage::
+
+    python -m benchmarks.memory [--output memory.json] [--rounds 50] [--quick]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import handless
+from benchmarks.graphs import Graph, layered
+from handless import Container, Scoped, Singleton
+from handless._utils import get_non_variadic_params, get_return_type
+from handless.lifetimes import LifetimeContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SIZES = (100, 1_000, 10_000)
+HANDLESS_DIR = str(Path(handless.__file__).parent)
+
+
+@dataclass
+class Footprint:
+    name: str
+    count: int
+    """Number of measured items (bindings, instances or cycles)"""
+    retained_bytes: float
+    """Bytes still allocated after the operation, per item"""
+    retained_blocks: float
+    """Memory blocks still allocated after the operation, per item"""
+    peak_bytes: float
+    """Peak of bytes allocated during the operation, per item"""
+
+
+def measure(name: str, count: int, operation: Callable[[], object]) -> Footprint:
+    """Measure memory allocated by given operation, divided among count items.
+
+    The operation result is kept alive until measured so it is accounted as retained.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        result = operation()
+        gc.collect()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return Footprint(
+        name=name,
+        count=count,
+        retained_bytes=sum(stat.size_diff for stat in stats) / count,
+        retained_blocks=sum(stat.count_diff for stat in stats) / count,
+        peak_bytes=(peak - start) / count,
+    )
+
+
+def bench_bindings(size: int) -> Footprint:
+    graph = layered(size, depth=5, width=3)
+
+    def bind() -> Container:
+        graph.bind(container := Container(), Singleton)
+        return container
+
+    bind()  # Warm up introspection caches
+    return measure(f"binding/{size}", size, bind)
+
+
+def bench_cached_instances(size: int) -> Footprint:
+    graph = layered(size, depth=5, width=3)
+    graph.bind(container := Container(), Singleton)
+    scope = container.create_scope()
+
+    def resolve_all() -> None:
+        for type_ in graph.types:
+            scope.resolve(type_)
+
+    footprint = measure(f"cached_instance/{size}", size, resolve_all)
+    container.close()
+    return footprint
+
+
+def bench_scope_cycles(size: int, cycles: int) -> Footprint:
+    graph = layered(size, depth=5, width=3)
+    graph.bind(container := Container(), Scoped)
+    root = graph.roots[0]
+
+    def cycle() -> None:
+        for _ in range(cycles):
+            scope = container.create_scope()
+            scope.resolve(root)
+            scope.close()
+
+    cycle()  # Warm up lifetime context cache list
+    footprint = measure(f"scope_cycle/{size}", cycles, cycle)
+    container.close()
+    return footprint
+
+
+@dataclass
+class ChurnRound:
+    round: int
+    traced_bytes: int
+    open_scopes: int
+    lifetime_contexts: int
+    params_cache_size: int
+    return_type_cache_size: int
+
+
+def _churn_round(round_: int, *, fresh_types: bool, shared: Graph) -> int:
+    graph = layered(50, depth=3, width=3) if fresh_types else shared
+    container = Container()
+    graph.bind(container, Scoped)
+    container.bind(Graph).to_factory(lambda: graph, Singleton)
+    for _ in range(20):
+        with container.create_scope() as scope:
+            scope.resolve(graph.roots[0])
+            scope.resolve(Graph)
+    # Scope never closed nor referenced anymore
+    container.create_scope().resolve(graph.roots[0])
+    container.close()
+    return round_
+
+
+def bench_churn(rounds: int, *, fresh_types: bool) -> list[ChurnRound]:
+    """Create, use and drop containers and report internals size after each round.
+
+    :param rounds: Number of containers created and dropped.
+    :param fresh_types: Whether each round uses newly created types or the same ones.
+    """
+    shared = layered(50, depth=3, width=3)
+    history: list[ChurnRound] = []
+    tracemalloc.start()
+    try:
+        for round_ in range(rounds):
+            _churn_round(round_, fresh_types=fresh_types, shared=shared)
+            gc.collect()
+            history.append(
+                ChurnRound(
+                    round=round_,
+                    traced_bytes=tracemalloc.get_traced_memory()[0],
+                    open_scopes=sum(
+                        len(obj._scopes)  # noqa: SLF001
+                        for obj in LifetimeContext._contexts  # noqa: SLF001
+                        if isinstance(obj, Container)
+                    ),
+                    lifetime_contexts=len(LifetimeContext._contexts),  # noqa: SLF001
+                    params_cache_size=get_non_variadic_params.cache_info().currsize,
+                    return_type_cache_size=get_return_type.cache_info().currsize,
+                )
+            )
+    finally:
+        tracemalloc.stop()
+    return history
+
+
+def top_retainers(rounds: int, limit: int = 10) -> list[tuple[str, int, int]]:
+    """Return handless source lines retaining most memory after churning containers.
+
+    Memory allocated by handless itself is attributed to the line which allocated
+    it, hence memory owned by internal caches or registries is reported here.
+    """
+    shared = layered(50, depth=3, width=3)
+    _churn_round(0, fresh_types=True, shared=shared)
+    gc.collect()
+    tracemalloc.start(5)
+    try:
+        before = tracemalloc.take_snapshot()
+        for round_ in range(rounds):
+            _churn_round(round_, fresh_types=True, shared=shared)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    filters = [tracemalloc.Filter(inclusive=True, filename_pattern=f"{HANDLESS_DIR}/*")]
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    return [
+        (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+        for stat in stats[:limit]
+        if stat.size_diff > 0
+    ]
+
+
+def _growth(history: list[ChurnRound], attribute: str) -> float:
+    """Return average growth per round of given attribute, after the first round."""
+    first, last = history[0], history[-1]
+    rounds = max(1, last.round - first.round)
+    return float(getattr(last, attribute) - getattr(first, attribute)) / rounds
+
+
+def print_report(
+    footprints: list[Footprint],
+    churns: dict[str, list[ChurnRound]],
+    retainers: list[tuple[str, int, int]],
+) -> None:
+    print(
+        f"{'footprint':<24} {'count':>7} {'retained B':>12} {'blocks':>9} "
+        f"{'peak B':>12}"
+    )
+    for f in footprints:
+        print(
+            f"{f.name:<24} {f.count:>7} {f.retained_bytes:>12,.1f} "
+            f"{f.retained_blocks:>9.2f} {f.peak_bytes:>12,.1f}"
+        )
+
+    print(
+        f"\n{'churn growth per round':<24} {'bytes':>12} {'scopes':>9} "
+        f"{'contexts':>9} {'params':>9} {'returns':>9}"
+    )
+    for name, history in churns.items():
+        print(
+            f"{name:<24} {_growth(history, 'traced_bytes'):>12,.0f} "
+            f"{_growth(history, 'open_scopes'):>9.2f} "
+            f"{_growth(history, 'lifetime_contexts'):>9.2f} "
+            f"{_growth(history, 'params_cache_size'):>9.2f} "
+            f"{_growth(history, 'return_type_cache_size'):>9.2f}"
+        )
+
+    print("\nhandless lines retaining memory after churn (fresh types):")
+    for line, size, count in retainers:
+        print(f"  {line:<60} {size:>10,} B {count:>7} blocks")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory")
+    parser.add_argument("--output", type=Path, help="Write results to this file.")
+    parser.add_argument(
+        "--rounds", type=int, default=50, help="Number of churn rounds."
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Skip the largest size and run less."
+    )
+    args = parser.parse_args(argv)
+
+    sizes = SIZES[:-1] if args.quick else SIZES
+    rounds = min(args.rounds, 10) if args.quick else args.rounds
+    footprints = [
+        *(bench_bindings(size) for size in sizes),
+        *(bench_cached_instances(size) for size in sizes),
+        *(bench_scope_cycles(size, cycles=200) for size in sizes),
+    ]
+    churns = {
+        "same_types": bench_churn(rounds, fresh_types=False),
+        "fresh_types": bench_churn(rounds, fresh_types=True),
+    }
+    retainers = top_retainers(rounds)
+    print_report(footprints, churns, retainers)
+    if args.output:
+        data: dict[str, Any] = {
+            "footprints": [asdict(f) for f in footprints],
+            "churn": {
+                name: [asdict(r) for r in history] for name, history in churns.items()
+            },
+            "retainers": retainers,
+        }
+        args.output.write_text(json.dumps(data, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
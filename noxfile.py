@@ -41,3 +41,45 @@ def coverage(session: nox.Session) -> None:
         "coverage", "report", "--skip-covered", "--skip-empty", "--show-missing"
     )
     session.run("coverage", "erase")
+
+
+@nox.session(python=False, default=False)
+def bench(session: nox.Session) -> None:
+    """Run benchmarks and compare results to the stored baseline.
+
+    Extra arguments are forwarded, e.g. `nox -s bench -- --save-baseline`.
+    """
+    session.run(
+        "python",
+        "-m",
+        "benchmarks",
+        "--output",
+        "benchmarks/results.json",
+        *session.posargs,
+    )
+
+
+@nox.session(python=False, default=False)
+def bench_contention(session: nox.Session) -> None:
+    """Run the threads and asyncio tasks contention benchmark."""
+    session.run(
+        "python",
+        "-m",
+        "benchmarks.contention",
+        "--output",
+        "benchmarks/results-contention.json",
+        *session.posargs,
+    )
+
+
+@nox.session(python=False, default=False)
+def bench_memory(session: nox.Session) -> None:
+    """Run the memory footprint and leaks benchmark."""
+    session.run(
+        "python",
+        "-m",
+        "benchmarks.memory",
+        "--output",
+        "benchmarks/results-memory.json",
+        *session.posargs,
+    )
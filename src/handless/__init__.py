@@ -1,5 +1,15 @@
-from handless._container import Container, Scope
+from handless._container import Container, ContainerDiff, Scope, ShutdownReport
 from handless._registry import Binding
-from handless.lifetimes import Scoped, Singleton, Transient
+from handless.lifetimes import Prototype, Scoped, Singleton, Transient
 
-__all__ = ["Binding", "Container", "Scope", "Scoped", "Singleton", "Transient"]
+__all__ = [
+    "Binding",
+    "Container",
+    "ContainerDiff",
+    "Prototype",
+    "Scope",
+    "Scoped",
+    "ShutdownReport",
+    "Singleton",
+    "Transient",
+]
@@ -1,24 +1,63 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import weakref
-from collections.abc import AsyncIterator, Callable, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
     asynccontextmanager,
     contextmanager,
+    suppress,
 )
-from inspect import isasyncgenfunction, isgeneratorfunction
-from typing import TYPE_CHECKING, Any, TypeVar, get_args, overload
-
-from handless._registry import Binder, Registry
-from handless._utils import get_return_type, isasynccontextmanager, iscontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+from queue import Queue
+from threading import Lock, Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypeVar, cast, get_args, get_origin, overload
+
+from handless._registry import Binder, Binding, Registry, SlotAllocator
+from handless._utils import (
+    capture_stack,
+    get_return_type,
+    isasynccontextmanager,
+    iscontextmanager,
+    substitute_type_vars,
+)
+from handless.diagnostics import SlowCallDetector
 from handless.exceptions import BindingError, BindingNotFoundError, ResolutionError
-from handless.lifetimes import Releasable
+from handless.hooks import (
+    Hooks,
+    ResolveEvent,
+    ScopeCloseEvent,
+    ScopeLeakEvent,
+    ScopeOpenEvent,
+)
+from handless.injection import Injector
+from handless.lifetimes import (
+    LifetimeContext,
+    Members,
+    Releasable,
+    Singleton,
+    _created_instances,
+    _resolution_frame,
+)
+from handless.pings import Ping, PingReport
+from handless.profiling import Profiler
+from handless.stats import DEFAULT_BUCKETS, ContainerStats, StatsCollector
 
 if TYPE_CHECKING:
-    from handless._registry import Binding
+    from concurrent.futures import Executor
+    from traceback import StackSummary
+    from types import TracebackType
+
+    from handless._registry import Dependency
+    from handless.diagnostics import SlowCallEvent
     from handless.lifetimes import Lifetime
 
 
@@ -28,6 +67,12 @@ _T2 = TypeVar("_T2")
 _T3 = TypeVar("_T3")
 _T4 = TypeVar("_T4")
 _U = TypeVar("_U", bound=Callable[..., Any])
+_R = TypeVar("_R")
+
+# Generic types resolved to collections of members bound with `bind_member`
+_COLLECTION_TYPES = (list, Sequence)
+# Scope opened by the outermost running call of a function decorated with `inject`
+_injection_scope = ContextVar["Scope | None"]("_injection_scope", default=None)
 
 
 class Container(Releasable["Container"]):
@@ -56,9 +101,344 @@ class Container(Releasable["Container"]):
 
     def __init__(self) -> None:
         super().__init__()
-        self._registry = Registry()
-        self._overrides = Registry(allow_override=True)
+        # NOTE: children and forks share their parent or origin slots so that slots of
+        # all bindings which can be cached together are distinct and compact
+        self._slot_allocator = SlotAllocator()
+        self._registry = Registry(slot_allocator=self._slot_allocator)
+        self._overrides = Registry(
+            allow_override=True, slot_allocator=self._slot_allocator
+        )
         self._scopes = weakref.WeakSet[Scope]()
+        self._parent: Container | None = None
+        self._children = weakref.WeakSet[Container]()
+        self._share_singletons = True
+        self._hooks = Hooks()
+        self._stats: StatsCollector | None = None
+        self._trace_scopes = False
+        self._executor: Executor | None = None
+        self._lock = Lock()
+        self._singletons_scope: Scope | None = None
+        self._parallel_resolution = False
+        self._parallel_teardown = False
+        self._max_workers: int | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._max_deferred_teardowns = 64
+        self._teardown_queue: Queue[LifetimeContext | None] | None = None
+        self._teardown_thread: Thread | None = None
+        self._teardown_tasks: set[asyncio.Task[None]] = set()
+        self._pings: dict[type[Any], list[Ping[Any]]] = {}
+        self._collections: dict[type[Any], Binding[Any]] = {}
+        # Bindings of generic types specializations with the generic binding they use
+        self._specializations: dict[type[Any], tuple[Binding[Any], Binding[Any]]] = {}
+        self._plans = _DependenciesPlans()
+
+    @property
+    def hooks(self) -> Hooks:
+        """Return callbacks called on resolution events of this container.
+
+        Hooks are not inherited by child containers nor copied to forks.
+
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> container.hooks.on_create(lambda event: print(event.binding.type_))
+        <function <lambda> at ...>
+        >>> with container.resolve(str) as value:
+        ...     pass
+        <class 'str'>
+        """
+        return self._hooks
+
+    def enable_stats(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Start collecting resolution statistics returned by :meth:`stats`.
+
+        Statistics are collected using :attr:`hooks` and only cover resolutions from
+        scopes of this container. Calling this function again has no effect.
+
+        :param buckets: Upper bounds, in seconds, of factory durations histograms.
+        """
+        if self._stats is None:
+            self._stats = StatsCollector(buckets)
+            self._stats.register(self._hooks)
+
+    def stats(self) -> ContainerStats:
+        """Return resolution statistics collected since :meth:`enable_stats` call.
+
+        >>> container = Container()
+        >>> container.enable_stats()
+        >>> container.bind(str).to_value("handless")
+        >>> with container.resolve(str) as value:
+        ...     pass
+        >>> container.stats().types[str].resolves
+        1
+        >>> print(container.stats().to_prometheus())
+        # HELP handless_resolves_total Number of resolutions per type.
+        # TYPE handless_resolves_total counter
+        handless_resolves_total{type="builtins.str",lifetime="Singleton"} 1
+        ...
+        handless_open_scopes 0
+        ...
+        handless_scope_teardown_duration_seconds_count 1
+        <BLANKLINE>
+
+        :returns: A snapshot of statistics, per bound type counters are empty if
+            statistics have not been enabled.
+        """
+        self._hooks.flush()
+        open_scopes = sum(not scope.closed for scope in self._scopes)
+        if self._stats is None:
+            return ContainerStats(open_scopes=open_scopes)
+        return self._stats.snapshot(open_scopes)
+
+    @contextmanager
+    def profile(self) -> Iterator[Profiler]:
+        """Record resolution trees of types resolved from this container scopes.
+
+        Profiling stops on context exit. Recorded trees can be exported for flame graph
+        tools, for example to find which branch of an objects graph is slow to create.
+
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> with container.profile() as profiler, container.resolve(str):
+        ...     pass
+        >>> print(profiler.to_collapsed())
+        builtins.str ...
+
+        :yields: The profiler recording resolutions.
+        """
+        profiler = Profiler()
+        profiler.register(self._hooks)
+        try:
+            yield profiler
+        finally:
+            profiler.unregister(self._hooks)
+
+    def detect_slow_calls(
+        self,
+        threshold: float | None,
+        *,
+        thresholds: Mapping[type[Any], float] | None = None,
+        callback: Callable[[SlowCallEvent], object] | None = None,
+    ) -> None:
+        """Report factories and context managers slower than given thresholds.
+
+        Each binding factory call, as well as entering and exiting the context manager
+        it returned, is timed and reported when longer than the threshold of the bound
+        type. Reports include the chain of types being resolved. Only calls are timed,
+        cache hits cost nothing, so detection can be left enabled in production.
+
+        >>> import time
+        >>> container = Container()
+        >>> container.bind(str).to_factory(lambda: time.sleep(0.01) or "handless")
+        >>> container.bind(bytes).to_factory(lambda scope: scope.resolve(str).encode())
+        >>> container.detect_slow_calls(0.005, callback=lambda event: print(event))
+        >>> with container.resolve(bytes) as value:
+        ...     pass
+        Calling factory of <class 'str'> took ...s (threshold: 0.005s). Resolution chain: <class 'bytes'> -> <class 'str'>
+
+        :param threshold: Maximum duration of calls, in seconds, or None to disable
+            detection.
+        :param thresholds: Maximum duration of calls, in seconds, per bound type.
+            Those override the default threshold.
+        :param callback: Function receiving a :class:`SlowCallEvent` for each slow
+            call. By default, a :class:`SlowCallWarning` is emitted instead.
+        """
+        self._hooks.slow_calls = (
+            None
+            if threshold is None
+            else SlowCallDetector(threshold, thresholds=thresholds, callback=callback)
+        )
+
+    @property
+    def executor(self) -> Executor | None:
+        """Return the executor running blocking bindings on async resolutions."""
+        return self._executor
+
+    def use_executor(self, executor: Executor | None) -> None:
+        """Run factories and context managers of blocking bindings on given executor.
+
+        Blocking bindings are only offloaded when resolved asynchronously, by default
+        using :func:`asyncio.to_thread`. The executor is not inherited by child
+        containers nor copied to forks and is never shut down by the container.
+
+        >>> import asyncio
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> container = Container()
+        >>> container.bind(str).to_factory(lambda: "handless", blocking=True)
+        >>> with ThreadPoolExecutor(max_workers=2) as executor:
+        ...     container.use_executor(executor)
+        ...
+        ...     async def main() -> str:
+        ...         async with container.aresolve(str) as value:
+        ...             return value
+        ...
+        ...     asyncio.run(main())
+        'handless'
+
+        :param executor: Executor to use, or None to use :func:`asyncio.to_thread`.
+        """
+        self._executor = executor
+
+    def parallelize(
+        self,
+        *,
+        resolution: bool = True,
+        teardown: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
+        """Resolve dependencies of sync bindings concurrently on a thread pool.
+
+        When enabled, dependencies of bindings having several of them are resolved
+        at the same time, each on a thread of a pool owned by this container, while
+        the calling thread resolves the first one. This speeds up creating objects
+        graphs whose factories release the GIL, for example doing IO, from the sum of
+        their durations down to the slowest chain of dependencies. Async resolutions
+        are not affected.
+
+        Dependencies not picked by a pool thread yet when needed are resolved by the
+        waiting thread itself, so nested parallel resolutions never wait for a busy
+        pool. The pool is created on first use, shut down when the container is
+        closed and neither inherited by child containers nor copied to forks.
+
+        >>> class Greeter:
+        ...     def __init__(self, name: str, times: int) -> None:
+        ...         self.greeting = " ".join([f"Hello {name}!"] * times)
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> container.bind(int).to_value(2)
+        >>> container.bind(Greeter).to_self()
+        >>> container.parallelize(max_workers=4)
+        >>> with container.resolve(Greeter) as greeter:
+        ...     print(greeter.greeting)
+        Hello handless! Hello handless!
+        >>> container.close()
+
+        With ``teardown`` enabled, closing this container or its scopes synchronously
+        exits independent context managers concurrently on the same pool too. A
+        context manager is still exited only after all the ones entered for objects
+        created using it, even indirectly, so dependencies outlive their dependents.
+        Exceptions raised while exiting are logged, just like sequential teardown,
+        and never prevent other context managers from being exited. Teardown must
+        not be triggered from a pool thread, for example by a factory.
+
+        :param resolution: Whether to resolve dependencies concurrently.
+        :param teardown: Whether to exit context managers concurrently on close.
+        :param max_workers: Maximum number of pool threads, defaults to the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default.
+        """
+        with self._lock:
+            self._parallel_resolution = resolution
+            self._parallel_teardown = teardown
+            if max_workers != self._max_workers:
+                self._max_workers = max_workers
+                self._shutdown_thread_pool()
+
+    def limit_deferred_teardowns(self, max_pending: int) -> None:
+        """Set how many scopes teardowns can be deferred at the same time.
+
+        Scopes closed with ``defer=True`` hand their context managers over to a
+        background worker, a thread for sync closes and tasks for async ones. Once
+        ``max_pending`` teardowns are waiting for the worker, further scopes are
+        closed by the caller itself so that cleanup can not fall behind without
+        limit. Defaults to 64.
+
+        :param max_pending: Maximum number of pending deferred teardowns.
+        """
+        if max_pending < 0:
+            msg = "Maximum number of deferred teardowns must be positive"
+            raise ValueError(msg)
+        self._max_deferred_teardowns = max_pending
+
+    def trace_scopes(self, enabled: bool = True) -> None:  # noqa: FBT001, FBT002
+        """Capture the call stack of each scope created from this container.
+
+        Captured stacks are exposed by :attr:`Scope.creation_stack`, included in
+        :class:`ScopeLeakEvent` hooks events and in warnings emitted when a scope is
+        garbage collected with pending resources. This helps finding where leaked
+        scopes come from, at the cost of walking the stack on each scope creation.
+
+        >>> container = Container()
+        >>> container.trace_scopes()
+        >>> scope = container.create_scope()
+        >>> scope.creation_stack[-1].name
+        '<module>'
+
+        :param enabled: Whether to capture stacks of next created scopes.
+        """
+        self._trace_scopes = enabled
+
+    @property
+    def scopes(self) -> tuple[Scope, ...]:
+        """Return scopes created from this container and still referenced.
+
+        Closed scopes are included until garbage collected, use
+        :attr:`Scope.closed` to filter them out.
+        """
+        return tuple(self._scopes)
+
+    def add_ping(
+        self,
+        type_: type[_T],
+        callback: Callable[[_T], object],
+        *,
+        timeout: float | None = 5.0,
+        ttl: float = 0.0,
+    ) -> None:
+        """Register a health check of the singleton bound to given type.
+
+        Pings are run by :meth:`aping`. They receive the singleton, fail by raising
+        or returning ``False`` and can either be sync or async. Pings are not
+        inherited by child containers nor copied to forks.
+
+        :param type_: Type whose singleton to check, bound with a singleton lifetime.
+        :param callback: Function, sync or async, receiving the singleton to check.
+        :param timeout: Maximum duration of the ping, in seconds.
+        :param ttl: Duration, in seconds, during which the ping result is reused
+            rather than pinging again.
+        """
+        self._pings.setdefault(type_, []).append(
+            Ping(type_, callback, timeout=timeout, ttl=ttl)
+        )
+
+    async def aping(self) -> PingReport:
+        """Concurrently run pings of singletons already created.
+
+        Singletons not created yet are skipped rather than created. Async pings run
+        as tasks while sync ones run on the container executor (see
+        :meth:`use_executor`), or :func:`asyncio.to_thread`. Failures are logged and
+        reported, never raised.
+
+        >>> import asyncio
+        >>> from handless import Singleton
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> container.bind(bytes).to_factory(lambda: b"handless", Singleton)
+        >>> container.add_ping(str, lambda value: value == "handless")
+        >>> container.add_ping(bytes, lambda value: value == b"handless")
+        >>> with container.resolve(str) as value:
+        ...     pass
+        >>> report = asyncio.run(container.aping())
+        >>> report.healthy, [result.type_ for result in report.results], report.skipped
+        (True, [<class 'str'>], (<class 'bytes'>,))
+
+        :returns: A report holding results of each ping.
+        """
+        pinged: list[tuple[Ping[Any], Any]] = []
+        skipped: list[type[Any]] = []
+        for type_, pings in self._pings.items():
+            binding = self._get_binding(type_)
+            entry = None
+            if binding is not None and isinstance(binding.lifetime, Singleton):
+                owner = LifetimeContext.get(self.get_owner(binding))
+                entry = owner.get_cached_entry(binding)
+            if entry is None:
+                skipped.append(type_)
+                continue
+            pinged.extend((ping, entry[1]) for ping in pings)
+
+        results = await asyncio.gather(
+            *(ping.arun(instance, self._executor) for ping, instance in pinged)
+        )
+        return PingReport(tuple(results), tuple(skipped))
 
     def bind(self, type_: type[_T]) -> Binder[_T]:
         """Bind given type and define its resolution at runtime.
@@ -75,7 +455,37 @@ class Container(Releasable["Container"]):
         :param type_: Type to bind.
         :returns: A binding builder for configuring value, factory, alias, or self.
         """
-        return Binder(self._registry, type_)
+        return Binder(self._registry, type_, on_bound=self._invalidate)
+
+    def bind_member(self, type_: type[_T]) -> Binder[_T]:
+        """Add a member to the collection of given type.
+
+        Collections are resolved, or injected, using ``list[type_]`` or
+        ``Sequence[type_]`` and hold one instance per member, in binding order. Each
+        member has its own factory and lifetime. Child containers collections also
+        hold members of their parent, first.
+
+        >>> class Plugin:
+        ...     pass
+        >>> class AuthPlugin(Plugin):
+        ...     pass
+        >>> class CachePlugin(Plugin):
+        ...     pass
+        >>> container = Container()
+        >>> container.bind_member(Plugin).to_factory(AuthPlugin)
+        >>> container.bind_member(Plugin).to_factory(CachePlugin)
+        >>> with container.resolve(list[Plugin]) as plugins:
+        ...     print([type(plugin).__name__ for plugin in plugins])
+        ['AuthPlugin', 'CachePlugin']
+
+        Collections bound with :meth:`bind` take precedence over members.
+
+        :param type_: Type of the collection members.
+        :returns: A binding builder for defining the member provider.
+        """
+        return Binder(
+            self._registry, type_, on_bound=self._invalidate_members, member=True
+        )
 
     def override(self, type_: type[_T]) -> Binder[_T]:
         """Temporarily override a type binding (for testing).
@@ -113,7 +523,7 @@ class Container(Releasable["Container"]):
             ...     config = scope.resolve(str)
             ...     assert "production" in config
         """
-        return Binder(self._overrides, type_)
+        return Binder(self._overrides, type_, on_bound=self._invalidate)
 
     def lookup(self, key: type[_T]) -> Binding[_T]:
         """Return binding for given type if any.
@@ -134,17 +544,86 @@ class Container(Releasable["Container"]):
         :returns: Binding bound to ``key``.
         :raises BindingNotFoundError: If the given type is not bound.
         """
-        binding = self._overrides.get_binding(key) or self._registry.get_binding(key)
+        binding = self._find_binding(key)
         if not binding:
             raise BindingNotFoundError(key)
         return binding
 
+    def get_owner(self, binding: Binding[Any]) -> Container:
+        """Return the container responsible for caching singletons of given binding.
+
+        This is the container itself unless the binding is inherited from a parent
+        container sharing its singletons with its children (see :meth:`create_child`).
+
+        :param binding: Binding to get the owner for.
+        :returns: The container caching instances of given binding.
+        """
+        if self._parent is None:
+            return self
+
+        definer: Container = self
+        while not definer._defines(binding):
+            if definer._parent is None:
+                # Not a binding from this container hierarchy (e.g. scope local binding)
+                return self
+            definer = definer._parent
+
+        owner: Container = self
+        while owner is not definer and owner._share_singletons and owner._parent:
+            owner = owner._parent
+        return owner
+
+    def diff(self, other: Container) -> ContainerDiff:
+        """Compare bindings of this container with the ones of another container.
+
+        Overrides are taken into account, meaning that each container is compared using
+        the bindings it would actually use when resolving types. Each binding is compared
+        in constant time using its precomputed fingerprint.
+
+        >>> old = Container()
+        >>> old.bind(str).to_value("handless")
+        >>> old.bind(int).to_value(42)
+        >>> new = Container()
+        >>> new.bind(str).to_value("handless")
+        >>> new.bind(float).to_value(4.2)
+        >>> diff = old.diff(new)
+        >>> list(diff.added), list(diff.removed), list(diff.changed)
+        ([<class 'float'>], [<class 'int'>], [])
+
+        :param other: Container to compare this one with.
+        :returns: Bindings added, removed and changed in ``other`` compared to this container.
+        """
+        bindings = self._get_effective_bindings()
+        other_bindings = other._get_effective_bindings()
+
+        return ContainerDiff(
+            added={
+                type_: binding
+                for type_, binding in other_bindings.items()
+                if type_ not in bindings
+            },
+            removed={
+                type_: binding
+                for type_, binding in bindings.items()
+                if type_ not in other_bindings
+            },
+            changed={
+                type_: (binding, other_bindings[type_])
+                for type_, binding in bindings.items()
+                if type_ in other_bindings and binding != other_bindings[type_]
+            },
+        )
+
     @overload
     def binding(self, factory: _U) -> _U: ...
 
     @overload
     def binding(
-        self, *, managed: bool = ..., lifetime: Lifetime | type[Lifetime] | None = ...
+        self,
+        *,
+        managed: bool = ...,
+        lifetime: Lifetime | type[Lifetime] | None = ...,
+        blocking: bool = ...,
     ) -> Callable[[_U], _U]: ...
 
     def binding(
@@ -153,6 +632,7 @@ class Container(Releasable["Container"]):
         *,
         managed: bool = True,
         lifetime: Lifetime | type[Lifetime] | None = None,
+        blocking: bool = False,
     ) -> Any:
         """Declare a function as a factory binding for its return type annotation.
 
@@ -179,6 +659,8 @@ class Container(Releasable["Container"]):
         :param factory: The decorated factory function (function parameter only used internally)
         :param managed: Whether returned context managers should be entered/exited automatically.
         :param lifetime: The binding lifetime, defaults to `Transient`
+        :param blocking: Whether the function blocks the calling thread and must be run
+            on the container executor when resolved asynchronously.
         :returns: The unmodified decorated function.
         :raises BindingError: If the decorated function has no return type annotation.
         """
@@ -196,7 +678,9 @@ class Container(Releasable["Container"]):
                 msg = f"{factory} has no return type annotation"
                 raise BindingError(msg)
 
-            self.bind(rettype).to_factory(factory, lifetime=lifetime, managed=managed)
+            self.bind(rettype).to_factory(
+                factory, lifetime=lifetime, managed=managed, blocking=blocking
+            )
             # NOTE: return decorated func untouched to ease reuse
             return factory
 
@@ -204,6 +688,120 @@ class Container(Releasable["Container"]):
             return wrapper(factory)
         return wrapper
 
+    def inject(self, function: Callable[..., _R]) -> Callable[..., _R]:
+        """Decorate a function to resolve its parameters when called.
+
+        Parameters having a type annotation, and not given by the caller, are resolved
+        from a new scope opened for the call and closed once it returns. Functions
+        decorated by this container and called while such call is running resolve
+        their parameters from the same scope. Async functions are supported and
+        resolve their parameters with ``aresolve``.
+
+        Parameters to resolve are computed once, when decorating the function. Just
+        like factories parameters, those having a default value are omitted when
+        their type is not bound.
+
+        Example::
+
+            >>> container = Container()
+            >>> container.bind(str).to_value("handless")
+            >>> @container.inject
+            ... def greet(greeting, name: str) -> str:
+            ...     return f"{greeting} {name}!"
+            >>> greet("Hello")
+            'Hello handless!'
+
+        :param function: The decorated function.
+        :returns: A function calling the decorated one with its parameters resolved.
+        :raises TypeError: If a parameter type annotation is not a type.
+        """
+        injector = Injector(function, self._slot_allocator)
+
+        if iscoroutinefunction(function):
+
+            @wraps(function)
+            async def ainjected(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                return await self._acall_injected(injector, args, kwargs)
+
+            return cast("Callable[..., _R]", ainjected)
+
+        @wraps(function)
+        def injected(*args: Any, **kwargs: Any) -> _R:  # noqa: ANN401
+            return cast("_R", self._call_injected(injector, args, kwargs))
+
+        return injected
+
+    def create_child(self, *, share_singletons: bool = True) -> Container:
+        """Create a child container inheriting bindings from this container.
+
+        Child containers look up types in their own bindings and overrides first then
+        fall back to their parent ones. Bindings added to the parent afterwards are
+        visible from its children. This allows, for example, to create one container
+        per tenant holding only tenant specific bindings while sharing all the others,
+        as well as their introspected dependencies, with a single parent container.
+
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> child = container.create_child()
+        >>> child.bind(int).to_value(42)
+        >>> with child.resolve(str, int) as values:
+        ...     print(values)
+        ('handless', 42)
+
+        :param share_singletons: Whether singletons of bindings inherited from the
+            parent are cached by the parent, hence shared among all its children.
+            Shared singletons dependencies are then resolved from the parent
+            bindings. Otherwise the child caches its own instances. Singletons of the child
+            own bindings are always cached by the child.
+        :returns: A new container whose parent is this container.
+        """
+        child = Container()
+        child._slot_allocator = self._slot_allocator
+        child._registry = Registry(slot_allocator=self._slot_allocator)
+        child._overrides = Registry(
+            allow_override=True, slot_allocator=self._slot_allocator
+        )
+        child._parent = self
+        child._share_singletons = share_singletons
+        self._children.add(child)
+        return child
+
+    def fork(self, *, share_singletons: bool = False) -> Container:
+        """Create a copy of this container.
+
+        The forked container starts with the same bindings and overrides than this one.
+        Bindings are shared between both containers until one of them binds or
+        overrides a type, in which case bindings are copied (copy-on-write). This makes
+        forking cheap whatever the number of bindings, for example to create one
+        container per tenant or per test from a fully configured container.
+
+        Bindings added afterwards to either container are not visible from the other.
+
+        >>> container = Container()
+        >>> container.bind(str).to_value("handless")
+        >>> fork = container.fork()
+        >>> fork.override(str).to_value("forked")
+        >>> with fork.resolve(str) as forked, container.resolve(str) as value:
+        ...     print(forked, value)
+        forked handless
+
+        :param share_singletons: Whether singletons already cached by this container
+            should be reused by the fork instead of being created again. Shared
+            singletons are still closed by this container only.
+        :returns: A new container holding the same bindings.
+        """
+        fork = Container()
+        fork._slot_allocator = self._slot_allocator
+        fork._registry = self._registry.fork()
+        fork._overrides = self._overrides.fork()
+        fork._parent = self._parent
+        fork._share_singletons = self._share_singletons
+        if self._parent is not None:
+            self._parent._children.add(fork)  # noqa: SLF001
+        if share_singletons:
+            LifetimeContext.get(fork).share_cached_instances(LifetimeContext.get(self))
+        return fork
+
     def close(self) -> None:
         """Close all cached singletons and opened scopes.
 
@@ -217,8 +815,95 @@ class Container(Releasable["Container"]):
         for scope in self._scopes:
             scope.close()
         self._overrides.clear()
+        self._forget_plans()
         return super().close()
 
+    async def aclose(self) -> None:
+        """Asynchronously close all cached singletons and opened scopes.
+
+        Opened scopes are closed concurrently, before singletons. Just like
+        :meth:`close`, only scopes still referenced are closed.
+
+        This method is idempotent and can safely be called multiple times.
+        Calling it never prevents resolving new values with the same container afterwards.
+        """
+        await asyncio.gather(*(scope.aclose() for scope in list(self._scopes)))
+        self._overrides.clear()
+        self._forget_plans()
+        await super().aclose()
+
+    async def ashutdown(
+        self, timeout: float | None = None, *, resource_timeout: float | None = None
+    ) -> ShutdownReport:
+        """Asynchronously close opened scopes and singletons within a deadline.
+
+        Opened scopes are closed concurrently, then singletons are. Unlike
+        :meth:`aclose`, this gives up once ``timeout`` seconds elapsed and cancels
+        exiting an async context manager taking more than ``resource_timeout``
+        seconds, so that shutting down takes a bounded time, for example within a
+        termination grace period. Sync context managers exits can not be cancelled
+        unless bound as blocking. Resources which did not finish closing are
+        reported rather than raised.
+
+        >>> import asyncio
+        >>> from contextlib import asynccontextmanager
+        >>> from handless import Singleton
+        >>> @asynccontextmanager
+        ... async def slow_client():
+        ...     yield "client"
+        ...     await asyncio.sleep(10)
+        >>> container = Container()
+        >>> container.bind(str).to_factory(slow_client, Singleton)
+        >>> async def main():
+        ...     async with container.aresolve(str):
+        ...         pass
+        ...     return await container.ashutdown(resource_timeout=0.01)
+        >>> report = asyncio.run(main())
+        >>> report.completed, [binding.type_ for binding in report.timed_out]
+        (False, [<class 'str'>])
+
+        :param timeout: Maximum duration of the whole shutdown, in seconds.
+        :param resource_timeout: Maximum duration of each context manager exit, in
+            seconds.
+        :returns: A report of resources which timed out, failed or were not closed.
+        """
+        start = perf_counter()
+        timed_out: list[Binding[Any]] = []
+        failed: list[tuple[Binding[Any], Exception]] = []
+        scopes = list(self._scopes)
+        contexts = [LifetimeContext.get(scope) for scope in scopes]
+        contexts.append(LifetimeContext.get(self))
+        if self._singletons_scope is not None:
+            contexts.append(LifetimeContext.get(self._singletons_scope))
+
+        async def shutdown_scope(scope: Scope, context: LifetimeContext) -> None:
+            scope_start = perf_counter()
+            await context.ashutdown(resource_timeout, timed_out, failed)
+            scope._on_closed(scope_start)  # noqa: SLF001
+
+        async def shutdown() -> None:
+            await asyncio.gather(
+                *map(shutdown_scope, scopes, contexts), *self._teardown_tasks
+            )
+            self._overrides.clear()
+            for context in contexts[len(scopes) :]:
+                await context.ashutdown(resource_timeout, timed_out, failed)
+
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(shutdown(), timeout)
+        with self._lock:
+            self._shutdown_thread_pool()
+        return ShutdownReport(
+            timed_out=tuple(timed_out),
+            failed=tuple(failed),
+            pending=tuple(
+                binding
+                for context in contexts
+                for binding in context.get_pending_bindings()
+            ),
+            duration=perf_counter() - start,
+        )
+
     def create_scope(self) -> Scope:
         """Create and open a new scope for resolving types.
 
@@ -229,6 +914,8 @@ class Container(Releasable["Container"]):
         """
         scope = Scope(self)
         self._scopes.add(scope)
+        if self._hooks.enabled:
+            self._hooks.emit_scope_open(ScopeOpenEvent(scope))
         return scope
 
     @overload
@@ -321,6 +1008,402 @@ class Container(Releasable["Container"]):
                 return
             yield tuple(values)
 
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._stop_teardown_worker()
+        super().__exit__(exc_type, exc_val, exc_tb)
+        if self._singletons_scope is not None:
+            LifetimeContext.get(self._singletons_scope).__exit__(
+                exc_type, exc_val, exc_tb
+            )
+        with self._lock:
+            self._shutdown_thread_pool()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await asyncio.gather(*self._teardown_tasks)
+        self._stop_teardown_worker()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self._singletons_scope is not None:
+            await LifetimeContext.get(self._singletons_scope).__aexit__(
+                exc_type, exc_val, exc_tb
+            )
+        with self._lock:
+            self._shutdown_thread_pool()
+
+    def _call_injected(
+        self, injector: Injector, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Any:  # noqa: ANN401
+        scope = _injection_scope.get()
+        if scope is not None and scope.container is self:
+            args_, kwargs_ = injector.resolve_arguments(scope, args, kwargs)
+            return injector.function(*args_, **kwargs_)
+        with self.create_scope() as scope:
+            token = _injection_scope.set(scope)
+            try:
+                args_, kwargs_ = injector.resolve_arguments(scope, args, kwargs)
+                return injector.function(*args_, **kwargs_)
+            finally:
+                _injection_scope.reset(token)
+
+    async def _acall_injected(
+        self, injector: Injector, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> Any:  # noqa: ANN401
+        scope = _injection_scope.get()
+        if scope is not None and scope.container is self:
+            args_, kwargs_ = await injector.aresolve_arguments(scope, args, kwargs)
+            return await injector.function(*args_, **kwargs_)
+        async with self.create_scope() as scope:
+            token = _injection_scope.set(scope)
+            try:
+                args_, kwargs_ = await injector.aresolve_arguments(scope, args, kwargs)
+                return await injector.function(*args_, **kwargs_)
+            finally:
+                _injection_scope.reset(token)
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="handless"
+                )
+            return self._thread_pool
+
+    def _shutdown_thread_pool(self) -> None:
+        # NOTE: must be called with the lock held. The pool is created again on
+        # next use since closed containers can still be used
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+    def _defer_teardown(self, context: LifetimeContext) -> bool:
+        """Queue given context to be closed by the teardown thread, unless full."""
+        with self._lock:
+            if self._teardown_queue is None:
+                self._teardown_queue = Queue()
+                self._teardown_thread = Thread(
+                    target=_run_deferred_teardowns,
+                    args=(self._teardown_queue,),
+                    name="handless-teardown",
+                    daemon=True,
+                )
+                self._teardown_thread.start()
+            if self._teardown_queue.qsize() >= self._max_deferred_teardowns:
+                return False
+            self._teardown_queue.put(context)
+            return True
+
+    def _adefer_teardown(self, context: LifetimeContext) -> bool:
+        """Schedule given context to be closed by a task, unless too many are pending."""
+        if len(self._teardown_tasks) >= self._max_deferred_teardowns:
+            return False
+        task = asyncio.get_running_loop().create_task(_arun_deferred_teardown(context))
+        self._teardown_tasks.add(task)
+        task.add_done_callback(self._teardown_tasks.discard)
+        return True
+
+    def _stop_teardown_worker(self) -> None:
+        """Wait for deferred sync teardowns to complete and stop their thread."""
+        with self._lock:
+            queue, thread = self._teardown_queue, self._teardown_thread
+            self._teardown_queue = self._teardown_thread = None
+        # NOTE: joined without the lock, teardowns may need it to use the pool
+        if queue is not None and thread is not None:
+            queue.put(None)
+            thread.join()
+
+    def _get_singletons_scope(self) -> Scope:
+        # Scope resolving dependencies of singletons shared with child containers, so
+        # that those never depend on bindings of the child resolving them first. It is
+        # not reported to scope hooks and is closed along with this container.
+        with self._lock:
+            if self._singletons_scope is None:
+                self._singletons_scope = Scope(self)
+            return self._singletons_scope
+
+    def _invalidate(self, binding: Binding[Any]) -> None:
+        # Evict cached instances created using a previous binding of the same type,
+        # or of its specializations when generic
+        origin = get_origin(binding.type_) or binding.type_
+        self._evict(
+            {
+                binding.type_,
+                *(key for key in self._specializations if get_origin(key) is origin),
+            },
+            binding,
+        )
+        self._forget_plans(binding.type_)
+
+    def _evict(self, types: set[type[Any]], binding: Binding[Any]) -> None:
+        ctx = LifetimeContext.get(self)
+        for type_ in tuple(types):
+            types |= ctx.get_transitive_dependents(type_)
+        ctx.evict(types)
+        for scope in self._scopes:
+            LifetimeContext.get(scope).evict(types)
+        if self._singletons_scope is not None:
+            LifetimeContext.get(self._singletons_scope).evict(types)
+        # NOTE: children may cache instances created using the new binding type, or
+        # its dependents, unless they bind this type themselves
+        for child in self._children:
+            if child._get_binding(binding.type_) is binding:  # noqa: SLF001
+                child._evict(set(types), binding)  # noqa: SLF001
+
+    def _find_binding(self, key: type[_T]) -> Binding[_T] | None:
+        return (
+            self._get_binding(key)
+            or self._get_collection_binding(key)
+            or self._get_specialized_binding(key)
+        )
+
+    def _is_bound(self, type_: type[Any]) -> bool:
+        return type_ is Scope or self._find_binding(type_) is not None
+
+    def _get_dependencies(self, binding: Binding[Any]) -> tuple[Dependency, ...]:
+        return self._plans.get(binding, self._is_bound)
+
+    def _forget_plans(self, type_: type[Any] | None = None) -> None:
+        # Dependencies to omit may have become bound, or the other way around, for
+        # this container, its scopes and its children
+        self._plans.forget(type_)
+        for scope in self._scopes:
+            scope._plans.forget(type_)  # noqa: SLF001
+        for child in self._children:
+            child._forget_plans(type_)  # noqa: SLF001
+
+    def _get_binding(self, key: type[_T]) -> Binding[_T] | None:
+        binding = self._overrides.get_binding(key) or self._registry.get_binding(key)
+        if binding is None and self._parent is not None:
+            return self._parent._get_binding(key)  # noqa: SLF001
+        return binding
+
+    def _defines(self, binding: Binding[Any]) -> bool:
+        type_ = binding.type_
+        own_binding = self._overrides.get_binding(type_) or self._registry.get_binding(
+            type_
+        )
+        return own_binding is binding or any(
+            member is binding for member in self._registry.get_members(type_)
+        )
+
+    def _get_members(self, type_: type[_T]) -> tuple[Binding[_T], ...]:
+        members = self._registry.get_members(type_)
+        if self._parent is not None:
+            return (*self._parent._get_members(type_), *members)  # noqa: SLF001
+        return members
+
+    def _get_collection_binding(self, key: type[_T]) -> Binding[_T] | None:
+        if get_origin(key) not in _COLLECTION_TYPES or len(get_args(key)) != 1:
+            return None
+        members = self._get_members(get_args(key)[0])
+        if not members:
+            return None
+        # NOTE: bindings of collections are cached until their members change so that
+        # collections are resolved as a single binding with its own cached instances
+        with self._lock:
+            cached = self._collections.get(key)
+            if cached is None or cached.lifetime != Members(members):
+                cached = self._collections[key] = Binding(
+                    key,
+                    list,
+                    managed=False,
+                    lifetime=Members(members),
+                    slot_allocator=self._slot_allocator,
+                )
+            return cached
+
+    def _get_specialized_binding(self, key: type[_T]) -> Binding[_T] | None:
+        origin: Any = get_origin(key)
+        parameters: tuple[Any, ...] = getattr(origin, "__parameters__", ())
+        if not parameters:
+            return None
+        generic = self._get_binding(origin) or self._get_binding(origin[parameters])
+        if generic is None:
+            return None
+        # NOTE: specializations are cached until their generic binding changes so
+        # that dependencies types are substituted once per specialization
+        with self._lock:
+            cached = self._specializations.get(key)
+            if cached is not None and cached[0] is generic:
+                return cached[1]
+            substitutions = dict(zip(parameters, get_args(key), strict=False))
+            specialized = Binding(
+                key,
+                generic.factory,
+                managed=generic.managed,
+                lifetime=generic.lifetime,
+                dependencies=tuple(
+                    replace(dep, type_=substitute_type_vars(dep.type_, substitutions))
+                    for dep in generic.dependencies
+                ),
+                blocking=generic.blocking,
+                slot_allocator=self._slot_allocator,
+            )
+            self._specializations[key] = (generic, specialized)
+            return specialized
+
+    def _invalidate_members(self, binding: Binding[Any]) -> None:
+        # Evict cached instances created using collections of the member type
+        types = {key for key in self._collections if get_args(key)[0] is binding.type_}
+        if types:
+            self._evict(types, binding)
+        self._plans.forget(binding.type_)
+        for scope in self._scopes:
+            scope._plans.forget(binding.type_)  # noqa: SLF001
+        for child in self._children:
+            child._invalidate_members(binding)  # noqa: SLF001
+
+    def _get_effective_bindings(self) -> dict[type[Any], Binding[Any]]:
+        parent_bindings = (
+            self._parent._get_effective_bindings()  # noqa: SLF001
+            if self._parent is not None
+            else {}
+        )
+        return {
+            **parent_bindings,
+            **self._registry.bindings,
+            **self._overrides.bindings,
+        }
+
+
+def _run_deferred_teardowns(queue: Queue[LifetimeContext | None]) -> None:
+    while (context := queue.get()) is not None:
+        _run_deferred_teardown(context)
+
+
+def _run_deferred_teardown(context: LifetimeContext) -> None:
+    try:
+        context.close()
+    except Exception:
+        logging.getLogger(__name__).exception("Failed deferred scope teardown.")
+
+
+async def _arun_deferred_teardown(context: LifetimeContext) -> None:
+    try:
+        await context.aclose()
+    except Exception:
+        logging.getLogger(__name__).exception("Failed deferred scope teardown.")
+
+
+class _DependenciesPlans:
+    """Dependencies to resolve for each binding, computed once per binding.
+
+    Dependencies having a default value are omitted when their type is not bound so
+    that factories use their default value instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # NOTE: plans reference their binding so their slot can not be reused by
+        # another binding while planned
+        self._plans: dict[int, tuple[Binding[Any], tuple[Dependency, ...]]] = {}
+
+    def get(
+        self, binding: Binding[Any], is_bound: Callable[[type[Any]], bool]
+    ) -> tuple[Dependency, ...]:
+        """Return dependencies of given binding to resolve.
+
+        :param binding: Binding whose dependencies are resolved.
+        :param is_bound: Function telling whether a type is bound, used when planning.
+        """
+        plan = self._plans.get(binding.slot)
+        if plan is not None and plan[0] is binding:
+            return plan[1]
+        dependencies = _plan_dependencies(binding.dependencies, is_bound)
+        with self._lock:
+            self._plans[binding.slot] = (binding, dependencies)
+        return dependencies
+
+    def forget(self, type_: type[Any] | None = None) -> None:
+        """Forget plans possibly depending on whether given type is bound, or all."""
+        with self._lock:
+            if type_ is None:
+                self._plans.clear()
+                return
+            for slot, (binding, _) in tuple(self._plans.items()):
+                if _refers_to(binding.type_, type_) or any(
+                    _refers_to(dep.type_, type_)
+                    for dep in binding.dependencies
+                    if dep.default is not ...
+                ):
+                    del self._plans[slot]
+
+
+def _plan_dependencies(
+    dependencies: tuple[Dependency, ...], is_bound: Callable[[type[Any]], bool]
+) -> tuple[Dependency, ...]:
+    if all(dep.default is ... for dep in dependencies):
+        return dependencies
+    planned: list[Dependency] = []
+    omit_positional = False
+    for dep in dependencies:
+        if dep.positional_only and omit_positional:
+            continue
+        if dep.default is not ... and not is_bound(dep.type_):
+            # NOTE: next positional only parameters, all having a default value, are
+            # omitted too so that they are not passed in place of this one
+            omit_positional = omit_positional or dep.positional_only
+            continue
+        planned.append(dep)
+    return tuple(planned)
+
+
+def _refers_to(type_: Any, other: Any) -> bool:  # noqa: ANN401
+    # Whether binding `other` may change how `type_` is resolved, for example as a
+    # specialization of a generic type or as a collection of members
+    origin = get_origin(other) or other
+    return type_ is other or get_origin(type_) is origin or other in get_args(type_)
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerDiff:
+    """Differences between the bindings of two containers.
+
+    A diff is falsy when both containers hold equal bindings.
+    """
+
+    added: Mapping[type[Any], Binding[Any]] = field(default_factory=dict)
+    """Bindings only present in the compared container"""
+    removed: Mapping[type[Any], Binding[Any]] = field(default_factory=dict)
+    """Bindings missing from the compared container"""
+    changed: Mapping[type[Any], tuple[Binding[Any], Binding[Any]]] = field(
+        default_factory=dict
+    )
+    """Bindings present in both containers but different, as (old, new) pairs"""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass(frozen=True, slots=True)
+class ShutdownReport:
+    """Outcome of a container shutdown.
+
+    Lists bindings whose context managers did not finish exiting.
+    """
+
+    timed_out: tuple[Binding[Any], ...] = ()
+    """Bindings whose context manager exit has been cancelled"""
+    failed: tuple[tuple[Binding[Any], Exception], ...] = ()
+    """Bindings whose context manager exit raised, with raised errors"""
+    pending: tuple[Binding[Any], ...] = ()
+    """Bindings whose context manager has not been exited before the deadline"""
+    duration: float = 0.0
+    """Shutdown duration, in seconds"""
+
+    @property
+    def completed(self) -> bool:
+        """Return whether all context managers have been exited successfully."""
+        return not (self.timed_out or self.failed or self.pending)
+
 
 class Scope(Releasable["Scope"]):
     """Allow to resolve types from a container.
@@ -346,14 +1429,134 @@ class Scope(Releasable["Scope"]):
         """
         super().__init__()
         self._container = container
-        self._registry = Registry()
+        self._registry = Registry(
+            slot_allocator=container._slot_allocator  # noqa: SLF001
+        )
         self._logger = logging.getLogger(__name__)
+        self._hooks = container.hooks
+        self._opened_at = perf_counter()
+        self._closed = False
+        self._creation_stack = (
+            capture_stack() if container._trace_scopes else None  # noqa: SLF001
+        )
+        self._plans = _DependenciesPlans()
 
     @property
     def container(self) -> Container:
         """Return the parent container of this scope."""
         return self._container
 
+    @property
+    def hooks(self) -> Hooks:
+        """Return callbacks called on resolution events of the scope container."""
+        return self._hooks
+
+    @property
+    def closed(self) -> bool:
+        """Return whether this scope has been closed at least once."""
+        return self._closed
+
+    @property
+    def creation_stack(self) -> StackSummary | None:
+        """Return the call stack of this scope creation, outermost frame first.
+
+        Stacks are only captured for scopes created while
+        :meth:`Container.trace_scopes` is enabled.
+        """
+        return self._creation_stack
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        start = perf_counter()
+        super().__exit__(exc_type, exc_val, exc_tb)
+        self._on_closed(start)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        start = perf_counter()
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        self._on_closed(start)
+
+    def close(self, *, defer: bool = False) -> None:
+        """Close cached instances and exit entered context managers.
+
+        With ``defer``, entered context managers are detached from this scope and
+        exited by a background thread instead, so that the caller does not wait for
+        them. When too many teardowns are already pending, see
+        :meth:`Container.limit_deferred_teardowns`, the caller exits them itself.
+        Deferred teardowns are awaited when closing the container.
+
+        This method is idempotent, can be called multiple times, and does not make
+        the object unusable afterwards.
+
+        :param defer: Whether to exit context managers in the background.
+        """
+        if not defer:
+            super().close()
+            return
+        start = perf_counter()
+        context = LifetimeContext.get(self).detach()
+        container = self._container
+        if context.pending_resources and not container._defer_teardown(context):  # noqa: SLF001
+            context.close()
+        self._on_closed(start)
+
+    async def aclose(self, *, defer: bool = False) -> None:
+        """Asynchronously close cached instances and exit entered context managers.
+
+        With ``defer``, entered context managers are detached from this scope and
+        exited by a background task instead, see :meth:`close`.
+
+        This method is idempotent, can be called multiple times, and does not make
+        the object unusable afterwards.
+
+        :param defer: Whether to exit context managers in the background.
+        """
+        if not defer:
+            await super().aclose()
+            return
+        start = perf_counter()
+        context = LifetimeContext.get(self).detach()
+        container = self._container
+        if context.pending_resources and not container._adefer_teardown(context):  # noqa: SLF001
+            await context.aclose()
+        self._on_closed(start)
+
+    def _on_closed(self, start: float) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._hooks.enabled:
+            end = perf_counter()
+            self._hooks.emit_scope_close(
+                ScopeCloseEvent(self, end - self._opened_at, end - start)
+            )
+
+    def __del__(self) -> None:
+        # NOTE: attributes may be missing if the constructor failed
+        hooks: Hooks | None = getattr(self, "_hooks", None)
+        if hooks is None or self._closed or not hooks.enabled:
+            return
+        if self._container._singletons_scope is self:  # noqa: SLF001
+            return
+        context = LifetimeContext._contexts.get(self)  # noqa: SLF001
+        hooks.defer_scope_leak(
+            ScopeLeakEvent(
+                self._container,
+                perf_counter() - self._opened_at,
+                context.pending_resources if context is not None else 0,
+                self._creation_stack,
+            )
+        )
+
     def bind_local(self, type_: type[_T]) -> Binder[_T]:
         """Bind a type only within this scope (doesn't affect the container).
 
@@ -382,7 +1585,7 @@ class Scope(Releasable["Scope"]):
             >>> with container.create_scope() as scope2:
             ...     assert scope2.resolve(str) == "global"
         """
-        return Binder(self._registry, type_)
+        return Binder(self._registry, type_, on_bound=self._invalidate)
 
     def resolve(self, type_: type[_T]) -> _T:
         """Resolve a type to get an instance.
@@ -417,9 +1620,16 @@ class Scope(Releasable["Scope"]):
         if type_ is type(self):
             return self
 
+        frame = _resolution_frame.get()
+        if frame is not None:
+            frame.dependencies.add(type_)
+
         try:
             binding = self._lookup(type_)
-            value = binding.lifetime.resolve(self, binding)
+            if self._hooks.enabled:
+                value = self._resolve_with_hooks(binding)
+            else:
+                value = binding.lifetime.resolve(self, binding)
             self._logger.info("Resolved %s: %s -> %s", type_, binding, type(value))
         except ResolutionError as res_error:
             res_error.add_parent_resolved_type(type_)
@@ -474,9 +1684,16 @@ class Scope(Releasable["Scope"]):
         if type_ is type(self):
             return self
 
+        frame = _resolution_frame.get()
+        if frame is not None:
+            frame.dependencies.add(type_)
+
         try:
             binding = self._lookup(type_)
-            value = await binding.lifetime.aresolve(self, binding)
+            if self._hooks.enabled:
+                value = await self._aresolve_with_hooks(binding)
+            else:
+                value = await binding.lifetime.aresolve(self, binding)
             self._logger.info("Resolved %s: %s -> %s", type_, binding, type(value))
         except ResolutionError as res_error:
             res_error.add_parent_resolved_type(type_)
@@ -486,5 +1703,80 @@ class Scope(Releasable["Scope"]):
         else:
             return value
 
+    def get_owner(self, binding: Binding[Any]) -> Container | Scope:
+        """Return the object responsible for caching singletons of given binding.
+
+        Scope local bindings can not outlive their scope so their singletons are cached
+        by the scope itself. Otherwise, this is the container returned by
+        :meth:`Container.get_owner`.
+
+        :param binding: Binding to get the owner for.
+        :returns: The scope or container caching instances of given binding.
+        """
+        if self._registry.get_binding(binding.type_) is binding:
+            return self
+        return self._container.get_owner(binding)
+
+    def _invalidate(self, binding: Binding[Any]) -> None:
+        # Evict scoped instances created using the container binding of the same type
+        dependents = LifetimeContext.get(self._container).get_transitive_dependents(
+            binding.type_
+        )
+        LifetimeContext.get(self).evict({binding.type_, *dependents})
+        self._plans.forget(binding.type_)
+
+    def _is_bound(self, type_: type[Any]) -> bool:
+        return (
+            self._registry.get_binding(type_) is not None
+            or self._container._is_bound(type_)  # noqa: SLF001
+        )
+
+    def _get_dependencies(self, binding: Binding[Any]) -> tuple[Dependency, ...]:
+        # NOTE: plans of the container are shared by all scopes not having local
+        # bindings which could be used in place of missing dependencies
+        if not self._registry.bindings:
+            return self._container._get_dependencies(binding)  # noqa: SLF001
+        return self._plans.get(binding, self._is_bound)
+
+    def _resolve_with_hooks(self, binding: Binding[_T]) -> _T:
+        created: list[Any] = []
+        token = _created_instances.set(created)
+        start = perf_counter()
+        try:
+            value = binding.lifetime.resolve(self, binding)
+        finally:
+            _created_instances.reset(token)
+        self._hooks.emit_resolve(
+            ResolveEvent(
+                binding,
+                self,
+                cache_hit=not created,
+                duration=perf_counter() - start,
+                start=start,
+                nested=_resolution_frame.get() is not None,
+            )
+        )
+        return value
+
+    async def _aresolve_with_hooks(self, binding: Binding[_T]) -> _T:
+        created: list[Any] = []
+        token = _created_instances.set(created)
+        start = perf_counter()
+        try:
+            value = await binding.lifetime.aresolve(self, binding)
+        finally:
+            _created_instances.reset(token)
+        self._hooks.emit_resolve(
+            ResolveEvent(
+                binding,
+                self,
+                cache_hit=not created,
+                duration=perf_counter() - start,
+                start=start,
+                nested=_resolution_frame.get() is not None,
+            )
+        )
+        return value
+
     def _lookup(self, type_: type[_T]) -> Binding[_T]:
         return self._registry.get_binding(type_) or self._container.lookup(type_)
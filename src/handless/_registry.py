@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import heapq
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
@@ -10,15 +11,20 @@ from contextlib import (
 )
 from dataclasses import dataclass, field
 from inspect import Parameter, isasyncgenfunction, isclass, isgeneratorfunction
-from types import EllipsisType
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, overload
-
-from handless._utils import are_functions_equal, get_non_variadic_params
+from threading import Lock
+from types import EllipsisType, MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, get_origin, overload
+
+from handless._utils import (
+    get_function_fingerprint,
+    get_non_variadic_params,
+    hash_fingerprint,
+)
 from handless.exceptions import BindingAlreadyExistsError, BindingError
 from handless.lifetimes import Lifetime, Singleton, Transient
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
 
     from handless._container import Scope
 
@@ -26,10 +32,21 @@ if TYPE_CHECKING:
 class Registry:
     """Store and look up type bindings."""
 
-    def __init__(self, *, allow_override: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        allow_override: bool = False,
+        slot_allocator: SlotAllocator | None = None,
+    ) -> None:
         self._logger = logging.getLogger(__name__)
         self._bindings: dict[type[Any], Binding[Any]] = {}
+        self._members: dict[type[Any], tuple[Binding[Any], ...]] = {}
+        # Whether bindings dicts are shared with a forked registry and must be copied
+        # before being modified
+        self._shared = False
         self.allow_override = allow_override
+        self.slot_allocator = slot_allocator or _slot_allocator
+        """Allocator of slots of bindings created for this registry"""
 
     def register(self, binding: Binding[Any]) -> None:
         """Store a binding for later resolution.
@@ -41,9 +58,24 @@ class Registry:
         if not self.allow_override and binding.type_ in self._bindings:
             raise BindingAlreadyExistsError(binding.type_)
 
+        self._unshare()
         self._bindings[binding.type_] = binding
         self._logger.info("Bound %s: %s", binding.type_, binding)
 
+    def add_member(self, binding: Binding[Any]) -> None:
+        """Add a binding to the collection of its type.
+
+        :param binding: Binding of a collection member.
+        """
+        self._unshare()
+        self._members[binding.type_] = (*self._members.get(binding.type_, ()), binding)
+        self._logger.info("Bound member of %s: %s", binding.type_, binding)
+
+    @property
+    def bindings(self) -> Mapping[type[Any], Binding[Any]]:
+        """Read-only view of registered bindings mapped to their bound type."""
+        return MappingProxyType(self._bindings)
+
     def get_binding(self, type_: type[_T]) -> Binding[_T] | None:
         """Return binding for given type, or ``None`` if not bound.
 
@@ -52,14 +84,87 @@ class Registry:
         """
         return self._bindings.get(type_)
 
+    def get_members(self, type_: type[_T]) -> tuple[Binding[_T], ...]:
+        """Return bindings of members of the collection of given type, in order.
+
+        :param type_: Type of collection members.
+        :returns: Bindings of members, empty if none.
+        """
+        return self._members.get(type_, ())
+
     def clear(self) -> None:
         """Remove all bindings from this registry."""
+        if self._shared:
+            self._bindings = {}
+            self._members = {}
+            self._shared = False
         self._bindings.clear()
+        self._members.clear()
+
+    def _unshare(self) -> None:
+        if self._shared:
+            self._bindings = dict(self._bindings)
+            self._members = dict(self._members)
+            self._shared = False
+
+    def fork(self) -> Registry:
+        """Return a copy of this registry.
+
+        Both registries share the same bindings until one of them is modified, in
+        which case only the modified registry copies them (copy-on-write). Forking is
+        then done in constant time whatever the number of bindings.
+
+        :returns: A new registry holding the same bindings.
+        """
+        registry = Registry(
+            allow_override=self.allow_override, slot_allocator=self.slot_allocator
+        )
+        registry._bindings = self._bindings
+        registry._members = self._members
+        registry._shared = self._shared = True
+        return registry
 
 
 _T = TypeVar("_T")
 
 
+class SlotAllocator:
+    """Allocate small integer slots identifying live bindings.
+
+    Slots of garbage collected bindings are reused, smallest first, so that slots
+    remain as compact as possible whatever the number of bindings created over time.
+    Each container hierarchy uses its own allocator so that cached instances arrays
+    are sized after its own bindings only.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._next_slot = 0
+        self._free_slots: list[int] = []
+        # NOTE: released slots are first pushed to a deque without locking because
+        # release is called on garbage collection which can happen anytime, including
+        # while the lock is held by the same thread
+        self._released_slots = deque[int]()
+
+    def allocate(self) -> int:
+        """Return an unused slot."""
+        with self._lock:
+            while self._released_slots:
+                heapq.heappush(self._free_slots, self._released_slots.popleft())
+            if self._free_slots:
+                return heapq.heappop(self._free_slots)
+            slot = self._next_slot
+            self._next_slot += 1
+            return slot
+
+    def release(self, slot: int) -> None:
+        """Make given slot available again."""
+        self._released_slots.append(slot)
+
+
+_slot_allocator = SlotAllocator()
+
+
 @dataclass(slots=True, eq=False)
 class Binding(Generic[_T]):
     """Describe how a specific type should be resolved.
@@ -84,17 +189,52 @@ class Binding(Generic[_T]):
     """Lifetime of the factory returned objects"""
     dependencies: tuple[Dependency, ...] = field(default_factory=tuple)
     """Dependencies to inject into the specified factory"""
+    blocking: bool = False
+    """Whether the factory, and the context manager it returns, block the calling
+    thread. Those are run on an executor when resolved asynchronously."""
+    slot_allocator: SlotAllocator = field(default=_slot_allocator, repr=False)
+    """Allocator of this binding slot, shared by all bindings of a container
+    hierarchy"""
+    fingerprint: tuple[Any, ...] = field(init=False, repr=False)
+    """Precomputed key identifying this binding, used for equality and hashing"""
+    slot: int = field(init=False, repr=False)
+    """Small integer identifying this binding among all live bindings.
+
+    It is used to index cached instances. A slot is never shared by two live bindings
+    and is only reused once its binding has been garbage collected.
+    """
+    _hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.slot = self.slot_allocator.allocate()
+        self.fingerprint = (
+            self.type_,
+            get_function_fingerprint(self.factory),
+            self.managed,
+            self.lifetime,
+            tuple(
+                (dep.name, dep.type_, dep.default, dep.positional_only)
+                for dep in self.dependencies
+            ),
+            self.blocking,
+        )
+        self._hash = hash_fingerprint(self.fingerprint)
 
     def __eq__(self, value: object) -> bool:
+        # NOTE: compare hashes first so that different bindings are told apart in
+        # constant time without comparing factories code
         return (
             isinstance(value, Binding)
-            and self.type_ == value.type_
-            and are_functions_equal(self.factory, value.factory)
-            and self.managed == value.managed
-            and self.lifetime == value.lifetime
-            and self.dependencies == value.dependencies
+            and self._hash == value._hash
+            and self.fingerprint == value.fingerprint
         )
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __del__(self) -> None:
+        self.slot_allocator.release(self.slot)
+
 
 @dataclass(slots=True)
 class Dependency:
@@ -124,7 +264,11 @@ class Dependency:
         if actual_type is Parameter.empty:
             msg = f"Parameter {param.name} is missing type annotation"
             raise TypeError(msg)
-        if not isclass(actual_type):
+        if (
+            not isclass(actual_type)
+            and get_origin(actual_type) is None
+            and not isinstance(actual_type, TypeVar)
+        ):
             msg = f"Parameter {param.name} type annotation {param.annotation} is not a type"
             raise TypeError(msg)
 
@@ -151,12 +295,25 @@ class Binder(Generic[_T]):
         >>> container.bind(list).to_self(lifetime=Scoped())
     """
 
-    def __init__(self, registry: Registry, type_: type[_T]) -> None:
+    def __init__(
+        self,
+        registry: Registry,
+        type_: type[_T],
+        *,
+        on_bound: Callable[[Binding[_T]], None] | None = None,
+        member: bool = False,
+    ) -> None:
         self._registry = registry
         self._type = type_
+        self._on_bound = on_bound
+        self._member = member
 
     def to_self(
-        self, lifetime: Lifetime | type[Lifetime] | None = None, *, managed: bool = True
+        self,
+        lifetime: Lifetime | type[Lifetime] | None = None,
+        *,
+        managed: bool = True,
+        blocking: bool = False,
     ) -> None:
         """Bind the type's constructor as its factory (standard constructor injection).
 
@@ -167,6 +324,8 @@ class Binder(Generic[_T]):
             when omitted. Can pass a class like ``Singleton`` or an instance like
             ``Singleton()``.
         :param managed: Whether returned context managers are automatically managed.
+        :param blocking: Whether the constructor blocks the calling thread, for example
+            doing IO. It is then called on an executor when resolved asynchronously.
         :raises BindingError: If constructor parameters lack type annotations.
 
         Example::
@@ -190,7 +349,9 @@ class Binder(Generic[_T]):
             ...     repo = scope.resolve(UserRepository)
             ...     assert repo.db == "postgresql://localhost"
         """
-        self.to_factory(self._type, lifetime=lifetime, managed=managed)
+        self.to_factory(
+            self._type, lifetime=lifetime, managed=managed, blocking=blocking
+        )
 
     def to(self, alias_type: type[_T]) -> None:
         """Resolve the given type when resolving the bound one.
@@ -224,6 +385,7 @@ class Binder(Generic[_T]):
         lifetime: Lifetime | type[Lifetime] | None = ...,
         *,
         managed: bool = ...,
+        blocking: bool = ...,
     ) -> None: ...
 
     @overload
@@ -239,6 +401,7 @@ class Binder(Generic[_T]):
         lifetime: Lifetime | type[Lifetime] | None = ...,
         *,
         managed: Literal[True] = ...,
+        blocking: bool = ...,
     ) -> None: ...
 
     @overload
@@ -248,6 +411,7 @@ class Binder(Generic[_T]):
         lifetime: Lifetime | type[Lifetime] | None = ...,
         *,
         managed: bool = ...,
+        blocking: bool = ...,
     ) -> None: ...
 
     @overload
@@ -263,6 +427,7 @@ class Binder(Generic[_T]):
         lifetime: Lifetime | type[Lifetime] | None = ...,
         *,
         managed: Literal[True] = ...,
+        blocking: bool = ...,
     ) -> None: ...
 
     def to_factory(
@@ -271,6 +436,7 @@ class Binder(Generic[_T]):
         lifetime: Lifetime | type[Lifetime] | None = None,
         *,
         managed: bool = True,
+        blocking: bool = False,
     ) -> None:
         """Use a function or type to produce an instance of bound type when resolved.
 
@@ -287,6 +453,10 @@ class Binder(Generic[_T]):
             ``Transient`` when omitted. Can pass a class like ``Singleton`` or an
             instance like ``Singleton()``.
         :param managed: Whether returned context managers are automatically managed.
+        :param blocking: Whether the factory, and the context manager it returns, block
+            the calling thread, for example doing IO. Those are then run on the
+            container executor when resolved asynchronously so the event loop is not
+            stalled. Sync resolutions are not affected.
         :raises BindingError: If dependency extraction fails.
         """
         if isasyncgenfunction(factory):
@@ -299,19 +469,26 @@ class Binder(Generic[_T]):
         )
 
         try:
-            self._registry.register(
-                Binding(
-                    self._type,
-                    factory,
-                    lifetime=normalized_lifetime,
-                    managed=managed,
-                    dependencies=_collect_dependencies(factory),
-                )
+            binding = Binding(
+                self._type,
+                factory,
+                lifetime=normalized_lifetime,
+                managed=managed,
+                dependencies=_collect_dependencies(factory),
+                blocking=blocking,
+                slot_allocator=self._registry.slot_allocator,
             )
         except TypeError as error:
             msg = f"Cannot bind {self._type} using {factory}: {error}"
             raise BindingError(msg) from error
 
+        if self._member:
+            self._registry.add_member(binding)
+        else:
+            self._registry.register(binding)
+        if self._on_bound is not None:
+            self._on_bound(binding)
+
 
 def _collect_dependencies(
     function: Callable[..., Any], overrides: dict[str, type[Any]] | None = None
@@ -327,14 +504,29 @@ def _collect_dependencies(
     # This is to handle lambda expressions taking a single untyped parameter which is
     # expected to be a Scope.
     overrides_ = defaultdict[str, type[Any] | EllipsisType](
-        lambda: Scope
-        if len(params) == 1
-        and next(iter(params.values())).annotation is Parameter.empty
-        else ...,
+        lambda: (
+            Scope
+            if len(params) == 1
+            and next(iter(params.values())).annotation is Parameter.empty
+            else ...
+        ),
         **overrides,
     )
 
-    return tuple(
-        Dependency.from_parameter(param, overrides_[name])
-        for name, param in params.items()
-    )
+    dependencies: list[Dependency] = []
+    omit_positional = False
+    for name, param in params.items():
+        type_ = overrides_[name]
+        if param.kind is Parameter.POSITIONAL_ONLY and omit_positional:
+            continue
+        # NOTE: parameters missing a type annotation are left to their default value.
+        # Next positional only ones are omitted too so they are not passed in place
+        if (
+            type_ is ...
+            and param.annotation is Parameter.empty
+            and param.default is not Parameter.empty
+        ):
+            omit_positional = omit_positional or param.kind is Parameter.POSITIONAL_ONLY
+            continue
+        dependencies.append(Dependency.from_parameter(param, type_))
+    return tuple(dependencies)
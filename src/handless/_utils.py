@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import inspect
+import sys
+import traceback
 from functools import cache
 from inspect import Parameter, isasyncgenfunction, isgeneratorfunction
-from typing import TYPE_CHECKING, Any, NewType, TypeVar, cast, get_type_hints
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    NewType,
+    TypeVar,
+    cast,
+    get_origin,
+    get_type_hints,
+)
 from unittest.mock import Mock
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 _T = TypeVar("_T")
 
+_PACKAGE_DIR = str(Path(__file__).parent)
+
 
 @cache
 def get_return_type(func: Callable[..., _T]) -> type[_T] | None:
@@ -49,11 +62,109 @@ def are_functions_equal(a: Callable[..., Any], b: Callable[..., Any]) -> bool:
     """Check if the two given functions are identicals.
 
     Return true even if both functions are not refering the same object in memory.
-    The function will try to compare the function compiled code itself if possible.
+    The function will try to compare the function compiled code, constants and
+    captured variables if possible.
+    """
+    return bool(get_function_fingerprint(a) == get_function_fingerprint(b))
+
+
+def get_function_fingerprint(function: Callable[..., Any]) -> Any:  # noqa: ANN401
+    """Return a key identifying given function code and captured variables.
+
+    Two functions having the same compiled code, constants, referenced names and
+    closure variables values share the same fingerprint, which matches the behavior
+    of `are_functions_equal`. The key may be unhashable if captured values are.
+
+    >>> def to_value(value):
+    ...     return lambda: value
+    >>> get_function_fingerprint(to_value(1)) == get_function_fingerprint(to_value(1))
+    True
+    >>> get_function_fingerprint(to_value(1)) == get_function_fingerprint(to_value(2))
+    False
+    """
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return function
+    return (
+        code.co_code,
+        code.co_consts,
+        code.co_names,
+        tuple(
+            _get_cell_contents(cell)
+            for cell in getattr(function, "__closure__", None) or ()
+        ),
+    )
+
+
+def _get_cell_contents(cell: Any) -> Any:  # noqa: ANN401
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # NOTE: cell of a variable not yet assigned
+        return None
+
+
+def hash_fingerprint(value: Any) -> int:  # noqa: ANN401
+    """Hash given value, falling back to its type when it is not hashable.
+
+    Tuples are hashed item per item so a single unhashable item does not prevent
+    hashing the others.
     """
-    a_code = a.__code__.co_code if hasattr(a, "__code__") else a
-    b_code = b.__code__.co_code if hasattr(b, "__code__") else b
-    return a_code == b_code
+    try:
+        return hash(value)
+    except TypeError:
+        if isinstance(value, tuple):
+            return hash(tuple(hash_fingerprint(item) for item in value))
+        return hash(type(value))
+
+
+def get_qualified_name(type_: Any) -> str:  # noqa: ANN401
+    """Return the fully qualified name of given type, including its module.
+
+    >>> get_qualified_name(dict)
+    'builtins.dict'
+    """
+    qualname = getattr(type_, "__qualname__", None)
+    if qualname is None:
+        # e.g. generic aliases or NewType in older Python versions
+        return repr(type_)
+    return f"{type_.__module__}.{qualname}"
+
+
+def substitute_type_vars(type_: Any, substitutions: Mapping[Any, Any]) -> Any:  # noqa: ANN401
+    """Return given type with its type variables replaced using given mapping.
+
+    >>> from typing import TypeVar
+    >>> T = TypeVar("T")
+    >>> substitute_type_vars(dict[str, list[T]], {T: int})
+    dict[str, list[int]]
+    """
+    if isinstance(type_, TypeVar):
+        return substitutions.get(type_, type_)
+    parameters = getattr(type_, "__parameters__", ())
+    if not parameters or get_origin(type_) is None:
+        return type_
+    return type_[tuple(substitutions.get(param, param) for param in parameters)]
+
+
+def capture_stack() -> traceback.StackSummary:
+    """Return the current call stack, outermost frame first, without source lines.
+
+    Innermost frames from this package are omitted so the stack ends in the code
+    calling it. Source lines are only read when the stack is formatted.
+
+    :returns: Frames of the first caller outside of this package, and its callers.
+    """
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(
+        _PACKAGE_DIR
+    ):
+        frame = frame.f_back
+    stack = traceback.StackSummary.extract(
+        traceback.walk_stack(frame), lookup_lines=False
+    )
+    stack.reverse()
+    return stack
 
 
 def iscontextmanager(function: Callable[..., Any]) -> bool:
@@ -0,0 +1,98 @@
+"""Report factories and context managers taking too long to create or release objects."""
+
+from __future__ import annotations
+
+import logging
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from handless._registry import Binding
+
+
+class SlowCallWarning(UserWarning):
+    """Warn about a factory or a context manager slower than its threshold."""
+
+
+@dataclass(frozen=True, slots=True)
+class SlowCallEvent:
+    """A factory or context manager call took longer than its threshold."""
+
+    binding: Binding[Any]
+    """Binding whose factory or context manager has been called"""
+    operation: Literal["factory", "enter", "exit"]
+    """Slow call, either the factory itself or entering or exiting its context
+    manager"""
+    duration: float
+    """Time spent in the call, in seconds"""
+    threshold: float
+    """Threshold exceeded, in seconds"""
+    resolution_chain: tuple[type[Any], ...]
+    """Types being resolved when the call occurred, from the outermost to the slow
+    binding type. It only holds the slow binding type when exiting."""
+
+    def __str__(self) -> str:
+        chain = " -> ".join(str(type_) for type_ in self.resolution_chain)
+        return (
+            f"Calling {self.operation} of {self.binding.type_} took"
+            f" {self.duration:.3f}s (threshold: {self.threshold}s)."
+            f" Resolution chain: {chain}"
+        )
+
+
+class SlowCallDetector:
+    """Check durations of factories and context managers calls against thresholds.
+
+    Prefer using :meth:`Container.detect_slow_calls` rather than this class directly.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        *,
+        thresholds: Mapping[type[Any], float] | None = None,
+        callback: Callable[[SlowCallEvent], object] | None = None,
+    ) -> None:
+        """Create a new slow calls detector.
+
+        :param threshold: Default maximum duration of calls, in seconds.
+        :param thresholds: Maximum duration of calls, in seconds, per bound type.
+        :param callback: Function receiving a :class:`SlowCallEvent` for each slow
+            call. By default, a :class:`SlowCallWarning` is emitted instead. Exceptions
+            it raises are logged and never interrupt resolution.
+        """
+        self._logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.callback = callback
+
+    def check(
+        self,
+        binding: Binding[Any],
+        operation: Literal["factory", "enter", "exit"],
+        duration: float,
+        get_chain: Callable[[], tuple[type[Any], ...]],
+    ) -> None:
+        """Report given call if slower than the threshold of its binding type.
+
+        :param binding: Binding whose factory or context manager has been called.
+        :param operation: Name of the call.
+        :param duration: Duration of the call, in seconds.
+        :param get_chain: Function returning the current resolution chain, only
+            called when the call is slow.
+        """
+        threshold = self.thresholds.get(binding.type_, self.threshold)
+        if duration <= threshold:
+            return
+
+        event = SlowCallEvent(binding, operation, duration, threshold, get_chain())
+        if self.callback is None:
+            warnings.warn(str(event), SlowCallWarning, stacklevel=2)
+            return
+        try:
+            self.callback(event)
+        except Exception:
+            self._logger.exception("Failed reporting %s.", event)
@@ -0,0 +1,385 @@
+"""Callbacks called on resolution events, for feeding metrics or tracing pipelines."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from traceback import StackSummary
+
+    from handless._container import Container, Scope
+    from handless._registry import Binding
+    from handless.diagnostics import SlowCallDetector
+
+
+_E = TypeVar("_E")
+
+
+@dataclass(frozen=True, slots=True)
+class ResolveEvent:
+    """A type has been resolved from a scope."""
+
+    binding: Binding[Any]
+    """Binding used to resolve the type"""
+    scope: Scope
+    """Scope the type has been resolved from"""
+    cache_hit: bool
+    """Whether the returned instance was already cached"""
+    duration: float
+    """Time spent resolving the type, including its dependencies, in seconds"""
+    start: float
+    """Value of `time.perf_counter()` when the resolution started"""
+    nested: bool
+    """Whether the type has been resolved while creating another instance, for
+    example as one of its dependencies"""
+
+
+@dataclass(frozen=True, slots=True)
+class CreateEvent:
+    """An instance has been created by a binding factory."""
+
+    binding: Binding[Any]
+    """Binding whose factory created the instance"""
+    scope: Scope
+    """Scope the instance has been resolved from"""
+    duration: float
+    """Time spent calling (and awaiting) the factory and entering the context manager
+    it returned, excluding dependencies resolution, in seconds"""
+
+
+@dataclass(frozen=True, slots=True)
+class CacheHitEvent:
+    """A cached instance has been returned instead of creating a new one."""
+
+    binding: Binding[Any]
+    """Binding of the cached instance"""
+    scope: Scope
+    """Scope the instance has been resolved from"""
+
+
+@dataclass(frozen=True, slots=True)
+class LockWaitEvent:
+    """A resolution waited for another one to create a scoped or singleton instance.
+
+    This event is only sent when the lock serializing creations of a binding instance
+    was already held, uncontended resolutions are not reported.
+    """
+
+    binding: Binding[Any]
+    """Binding whose creation lock has been waited for"""
+    scope: Scope
+    """Scope the type has been resolved from"""
+    duration: float
+    """Time spent waiting for the lock, in seconds"""
+    waiters: int
+    """Number of threads or tasks waiting for the lock when this one started waiting,
+    including itself"""
+
+
+@dataclass(frozen=True, slots=True)
+class ReleaseEvent:
+    """The context manager entered when creating an instance has been exited."""
+
+    binding: Binding[Any]
+    """Binding of the released instance"""
+    owner: Container | Scope | None
+    """Container or scope which owned the instance, if still alive"""
+    duration: float
+    """Time spent exiting the context manager, in seconds"""
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeOpenEvent:
+    """A scope has been created from a container."""
+
+    scope: Scope
+    """The new scope"""
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeCloseEvent:
+    """A scope has been closed for the first time."""
+
+    scope: Scope
+    """The closed scope"""
+    lifetime: float
+    """Time elapsed between the scope creation and its closing, in seconds"""
+    duration: float
+    """Time spent exiting the scope context managers, in seconds"""
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeLeakEvent:
+    """A scope has been garbage collected without being closed.
+
+    Those events are queued by the garbage collector and only sent along with the
+    next event of the container, or when :meth:`Hooks.flush` is called.
+    """
+
+    container: Container
+    """Container the scope has been created from"""
+    lifetime: float
+    """Time elapsed between the scope creation and its garbage collection, in
+    seconds"""
+    pending_resources: int
+    """Number of context managers the scope entered and never exited"""
+    creation_stack: StackSummary | None
+    """Stack of the scope creation, only captured when scopes are traced"""
+
+
+class Hooks:
+    """Hold callbacks called on resolution events of a container.
+
+    Callbacks are called synchronously, in the thread resolving types, with a single
+    event argument. Exceptions they raise are logged and never interrupt resolution.
+    When no callback is registered, hooks cost a single attribute check per resolution.
+
+    Resolve, create and cache hit events are sent to the hooks of the container the
+    scope has been created from. Release events are sent to the hooks of the container
+    of the scope or container which owned the instance.
+
+    >>> from handless import Container
+    >>> container = Container()
+    >>> container.bind(str).to_value("handless")
+    >>> @container.hooks.on_resolve
+    ... def print_resolved(event: ResolveEvent) -> None:
+    ...     print(event.binding.type_, event.cache_hit)
+    >>> with container.resolve(str) as value:
+    ...     pass
+    <class 'str'> False
+    >>> container.hooks.remove(print_resolved)
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        """Whether at least one callback is registered"""
+        self.slow_calls: SlowCallDetector | None = None
+        """Detector of slow factories and context managers, if enabled. It does not
+        require any callback to be registered"""
+        self._lock = Lock()
+        self._logger = logging.getLogger(__name__)
+        self._on_resolve: tuple[Callable[[ResolveEvent], object], ...] = ()
+        self._on_create: tuple[Callable[[CreateEvent], object], ...] = ()
+        self._on_cache_hit: tuple[Callable[[CacheHitEvent], object], ...] = ()
+        self._on_release: tuple[Callable[[ReleaseEvent], object], ...] = ()
+        self._on_lock_wait: tuple[Callable[[LockWaitEvent], object], ...] = ()
+        self._on_scope_open: tuple[Callable[[ScopeOpenEvent], object], ...] = ()
+        self._on_scope_close: tuple[Callable[[ScopeCloseEvent], object], ...] = ()
+        self._on_scope_leak: tuple[Callable[[ScopeLeakEvent], object], ...] = ()
+        # NOTE: leak events are sent from finalizers, which can run anytime, including
+        # while a callback holds a lock it would need. They are then queued without
+        # locking and emitted later from regular code
+        self._deferred_scope_leaks = deque[ScopeLeakEvent]()
+
+    def on_resolve(
+        self, callback: Callable[[ResolveEvent], object]
+    ) -> Callable[[ResolveEvent], object]:
+        """Call given callback each time a type is resolved from a scope.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`ResolveEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_resolve = (*self._on_resolve, callback)
+            self._update()
+        return callback
+
+    def on_create(
+        self, callback: Callable[[CreateEvent], object]
+    ) -> Callable[[CreateEvent], object]:
+        """Call given callback each time a binding factory creates an instance.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`CreateEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_create = (*self._on_create, callback)
+            self._update()
+        return callback
+
+    def on_cache_hit(
+        self, callback: Callable[[CacheHitEvent], object]
+    ) -> Callable[[CacheHitEvent], object]:
+        """Call given callback each time a scoped or singleton instance is reused.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`CacheHitEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_cache_hit = (*self._on_cache_hit, callback)
+            self._update()
+        return callback
+
+    def on_release(
+        self, callback: Callable[[ReleaseEvent], object]
+    ) -> Callable[[ReleaseEvent], object]:
+        """Call given callback each time an entered context manager is exited.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`ReleaseEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_release = (*self._on_release, callback)
+            self._update()
+        return callback
+
+    def on_lock_wait(
+        self, callback: Callable[[LockWaitEvent], object]
+    ) -> Callable[[LockWaitEvent], object]:
+        """Call given callback each time a resolution waits for a concurrent creation.
+
+        Only scoped and singleton bindings creations are serialized and waited for.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`LockWaitEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_lock_wait = (*self._on_lock_wait, callback)
+            self._update()
+        return callback
+
+    def on_scope_open(
+        self, callback: Callable[[ScopeOpenEvent], object]
+    ) -> Callable[[ScopeOpenEvent], object]:
+        """Call given callback each time a scope is created.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`ScopeOpenEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_scope_open = (*self._on_scope_open, callback)
+            self._update()
+        return callback
+
+    def on_scope_close(
+        self, callback: Callable[[ScopeCloseEvent], object]
+    ) -> Callable[[ScopeCloseEvent], object]:
+        """Call given callback the first time each scope is closed.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`ScopeCloseEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_scope_close = (*self._on_scope_close, callback)
+            self._update()
+        return callback
+
+    def on_scope_leak(
+        self, callback: Callable[[ScopeLeakEvent], object]
+    ) -> Callable[[ScopeLeakEvent], object]:
+        """Call given callback each time a scope is garbage collected unclosed.
+
+        This function can be used as a decorator.
+
+        :param callback: Function receiving a :class:`ScopeLeakEvent`.
+        :returns: The given callback, untouched.
+        """
+        with self._lock:
+            self._on_scope_leak = (*self._on_scope_leak, callback)
+            self._update()
+        return callback
+
+    def remove(self, callback: Callable[[Any], object]) -> None:
+        """Unregister given callback from all events it has been registered for.
+
+        :param callback: Callback to unregister.
+        """
+        with self._lock:
+            self._on_resolve = tuple(c for c in self._on_resolve if c != callback)
+            self._on_create = tuple(c for c in self._on_create if c != callback)
+            self._on_cache_hit = tuple(c for c in self._on_cache_hit if c != callback)
+            self._on_release = tuple(c for c in self._on_release if c != callback)
+            self._on_lock_wait = tuple(c for c in self._on_lock_wait if c != callback)
+            self._on_scope_open = tuple(c for c in self._on_scope_open if c != callback)
+            self._on_scope_close = tuple(
+                c for c in self._on_scope_close if c != callback
+            )
+            self._on_scope_leak = tuple(c for c in self._on_scope_leak if c != callback)
+            self._update()
+
+    def emit_resolve(self, event: ResolveEvent) -> None:
+        self._emit(self._on_resolve, event)
+
+    def emit_create(self, event: CreateEvent) -> None:
+        self._emit(self._on_create, event)
+
+    def emit_cache_hit(self, event: CacheHitEvent) -> None:
+        self._emit(self._on_cache_hit, event)
+
+    def emit_release(self, event: ReleaseEvent) -> None:
+        self._emit(self._on_release, event)
+
+    def emit_lock_wait(self, event: LockWaitEvent) -> None:
+        self._emit(self._on_lock_wait, event)
+
+    def emit_scope_open(self, event: ScopeOpenEvent) -> None:
+        self._emit(self._on_scope_open, event)
+
+    def emit_scope_close(self, event: ScopeCloseEvent) -> None:
+        self._emit(self._on_scope_close, event)
+
+    def emit_scope_leak(self, event: ScopeLeakEvent) -> None:
+        self._emit(self._on_scope_leak, event)
+
+    def defer_scope_leak(self, event: ScopeLeakEvent) -> None:
+        """Queue given event, emitted along with the next event or on :meth:`flush`.
+
+        This is safe to call from finalizers.
+
+        :param event: Scope leak event to emit later.
+        """
+        self._deferred_scope_leaks.append(event)
+
+    def flush(self) -> None:
+        """Emit queued scope leak events."""
+        while True:
+            try:
+                event = self._deferred_scope_leaks.popleft()
+            except IndexError:
+                return
+            self._emit_callbacks(self._on_scope_leak, event)
+
+    def _emit(self, callbacks: tuple[Callable[[_E], object], ...], event: _E) -> None:
+        if self._deferred_scope_leaks:
+            self.flush()
+        self._emit_callbacks(callbacks, event)
+
+    def _emit_callbacks(
+        self, callbacks: tuple[Callable[[_E], object], ...], event: _E
+    ) -> None:
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:  # noqa: PERF203
+                self._logger.exception("Hook %s failed handling %s.", callback, event)
+
+    def _update(self) -> None:
+        self.enabled = bool(
+            self._on_resolve
+            or self._on_create
+            or self._on_cache_hit
+            or self._on_release
+            or self._on_lock_wait
+            or self._on_scope_open
+            or self._on_scope_close
+            or self._on_scope_leak
+        )
@@ -0,0 +1,103 @@
+"""Call functions with their parameters resolved from a scope."""
+
+from __future__ import annotations
+
+from inspect import Parameter
+from typing import TYPE_CHECKING, Any
+
+from handless._registry import Binding, Dependency
+from handless._utils import get_non_variadic_params
+from handless.lifetimes import Transient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from handless._container import Scope
+    from handless._registry import SlotAllocator
+
+
+class Injector:
+    """Plan of the parameters of a function to resolve when calling it.
+
+    The plan is computed once from the function signature: parameters having a type
+    annotation are resolved unless given by the caller. Just like factories
+    parameters, those having a default value are omitted when their type is not
+    bound.
+
+    Prefer using :meth:`Container.inject` rather than this class directly.
+    """
+
+    def __init__(
+        self, function: Callable[..., Any], slot_allocator: SlotAllocator
+    ) -> None:
+        """Create a new injector of given function parameters.
+
+        :param function: Function whose parameters are resolved.
+        :param slot_allocator: Allocator of the container resolving parameters.
+        :raises TypeError: If a parameter type annotation is not a type.
+        """
+        params = get_non_variadic_params(function)
+        self.function = function
+        # NOTE: the function is planned as a binding so that its parameters to omit are
+        # computed and updated just like factories ones
+        self.binding = Binding(
+            object,
+            function,
+            managed=False,
+            lifetime=Transient(),
+            dependencies=tuple(
+                Dependency.from_parameter(param)
+                for param in params.values()
+                if param.annotation is not Parameter.empty
+            ),
+            slot_allocator=slot_allocator,
+        )
+        self._positions = {name: index for index, name in enumerate(params)}
+
+    def resolve_arguments(
+        self, scope: Scope, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[list[Any], dict[str, Any]]:
+        """Return given arguments completed with parameters resolved from given scope.
+
+        :param scope: Scope to resolve parameters from.
+        :param args: Positional arguments given by the caller.
+        :param kwargs: Keyword arguments given by the caller.
+        :returns: Positional and keyword arguments to call the function with.
+        """
+        args_, kwargs_ = list(args), dict(kwargs)
+        for dep in self._get_missing_dependencies(scope, args, kwargs):
+            resolved = scope.resolve(dep.type_)
+            if dep.positional_only:
+                args_.append(resolved)
+                continue
+            kwargs_[dep.name] = resolved
+        return args_, kwargs_
+
+    async def aresolve_arguments(
+        self, scope: Scope, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[list[Any], dict[str, Any]]:
+        """Asynchronous version of :meth:`resolve_arguments`.
+
+        :param scope: Scope to resolve parameters from.
+        :param args: Positional arguments given by the caller.
+        :param kwargs: Keyword arguments given by the caller.
+        :returns: Positional and keyword arguments to call the function with.
+        """
+        args_, kwargs_ = list(args), dict(kwargs)
+        for dep in self._get_missing_dependencies(scope, args, kwargs):
+            resolved = await scope.aresolve(dep.type_)
+            if dep.positional_only:
+                args_.append(resolved)
+                continue
+            kwargs_[dep.name] = resolved
+        return args_, kwargs_
+
+    def _get_missing_dependencies(
+        self, scope: Scope, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> list[Dependency]:
+        positions = self._positions
+        return [
+            dep
+            for dep in scope._get_dependencies(self.binding)  # noqa: SLF001
+            if positions[dep.name] >= len(args) and dep.name not in kwargs
+        ]
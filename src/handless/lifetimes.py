@@ -1,24 +1,139 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import warnings
 import weakref
 from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, wait
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, suppress
+from contextvars import ContextVar, copy_context
+from functools import partial
 from threading import Lock, RLock
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, runtime_checkable
 
+from handless.hooks import (
+    CacheHitEvent,
+    CreateEvent,
+    Hooks,
+    LockWaitEvent,
+    ReleaseEvent,
+)
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor, Future
+    from traceback import StackSummary
     from types import TracebackType
 
-    from handless._container import Scope
+    from handless._container import Container, Scope
     from handless._registry import Binding
+    from handless.diagnostics import SlowCallDetector
 
 
 _T = TypeVar("_T")
 
 
+class _ResolutionFrame:
+    """Types resolved while creating an instance of a binding."""
+
+    __slots__ = ("binding", "dependencies", "nested_duration", "parent", "start")
+
+    def __init__(
+        self, binding: Binding[Any], parent: _ResolutionFrame | None = None
+    ) -> None:
+        self.binding = binding
+        self.parent = parent
+        self.dependencies: set[type[Any]] = set()
+        # Only measured when detecting slow calls
+        self.start = 0.0
+        self.nested_duration = 0.0
+        """Time spent creating instances of dependencies, in seconds"""
+
+    def end(self) -> None:
+        """Count time elapsed since this frame start as spent by its parent's children."""
+        if self.parent is not None:
+            self.parent.nested_duration += perf_counter() - self.start
+
+    def get_chain(self) -> tuple[type[Any], ...]:
+        """Return types being created, from the outermost to this frame binding type."""
+        chain: list[type[Any]] = []
+        frame: _ResolutionFrame | None = self
+        while frame is not None:
+            chain.append(frame.binding.type_)
+            frame = frame.parent
+        return tuple(reversed(chain))
+
+
+# Innermost instance creation. This is used to learn the dependency graph of bound
+# types, including dependencies resolved manually by factories receiving the scope
+_resolution_frame = ContextVar[_ResolutionFrame | None](
+    "_resolution_frame", default=None
+)
+# Instances created by the innermost resolution. This is only set when hooks are
+# enabled, to tell whether a resolved instance was cached or not
+_created_instances = ContextVar[list[Any] | None]("_created_instances", default=None)
+
+
+async def _run_blocking(executor: Executor | None, function: Callable[[], _T]) -> _T:
+    # NOTE: context is copied so that functions resolving types from the scope still
+    # record dependencies in the current resolution frame
+    if executor is None:
+        return await asyncio.to_thread(function)
+    context = copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, partial(context.run, function)
+    )
+
+
+class _OffloadedContextManager(AbstractAsyncContextManager[_T]):
+    """Enter and exit a blocking sync context manager on an executor."""
+
+    def __init__(
+        self, context_manager: AbstractContextManager[_T], executor: Executor | None
+    ) -> None:
+        self.context_manager = context_manager
+        self._executor = executor
+
+    async def __aenter__(self) -> _T:
+        return await _run_blocking(self._executor, self.context_manager.__enter__)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> bool | None:
+        return await _run_blocking(
+            self._executor,
+            partial(self.context_manager.__exit__, exc_type, exc_val, exc_tb),
+        )
+
+
+def _resolve_in_parallel(
+    scope: Scope, types: list[type[Any]], executor: Executor
+) -> list[Any]:
+    """Resolve given types concurrently, the first one in the calling thread."""
+    futures = [
+        executor.submit(copy_context().run, scope.resolve, type_) for type_ in types[1:]
+    ]
+    values: list[Any] = []
+    try:
+        values.append(scope.resolve(types[0]))
+        for type_, future in zip(types[1:], futures, strict=False):
+            # NOTE: resolve types no pool thread started resolving yet ourselves so
+            # that waiting for dependencies never requires an idle pool thread
+            values.append(scope.resolve(type_) if future.cancel() else future.result())
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
+    return values
+
+
 @runtime_checkable
 class Lifetime(Protocol):
     def resolve(self, scope: Scope, binding: Binding[_T]) -> _T:
@@ -71,6 +186,9 @@ class Transient(Lifetime):
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Transient)
 
+    def __hash__(self) -> int:
+        return hash(Transient)
+
 
 class Scoped(Lifetime):
     """Create one instance per scope (best for request-scoped resources).
@@ -112,6 +230,9 @@ class Scoped(Lifetime):
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Scoped)
 
+    def __hash__(self) -> int:
+        return hash(Scoped)
+
 
 class Singleton(Lifetime):
     """Create one instance for the entire container lifetime (app-wide).
@@ -143,16 +264,140 @@ class Singleton(Lifetime):
     """
 
     def resolve(self, scope: Scope, binding: Binding[_T]) -> _T:
-        ctx = LifetimeContext.get(scope.container)
-        return ctx.get_cached_instance(scope, binding)
+        owner = scope.get_owner(binding)
+        ctx = LifetimeContext.get(owner)
+        return ctx.get_cached_instance(_get_owner_scope(scope, owner), binding)
 
     async def aresolve(self, scope: Scope, binding: Binding[_T]) -> _T:
-        ctx = LifetimeContext.get(scope.container)
-        return await ctx.aget_cached_instance(scope, binding)
+        owner = scope.get_owner(binding)
+        ctx = LifetimeContext.get(owner)
+        return await ctx.aget_cached_instance(_get_owner_scope(scope, owner), binding)
 
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Singleton)
 
+    def __hash__(self) -> int:
+        return hash(Singleton)
+
+
+class Prototype(Lifetime):
+    """Create one instance for the entire container lifetime and return its copies.
+
+    The first resolution creates a prototype, cached like a singleton, and each
+    resolution returns a shallow copy of it. Objects can customize copies by defining
+    a ``__clone__`` method returning the copy, otherwise :func:`copy.copy` is used.
+    Use for objects whose construction is expensive but which must not be shared.
+
+    Only the prototype context manager (if any) is entered, on first resolve, and
+    exited on container end (close). Copies are never entered.
+
+    Example::
+
+        >>> from handless import Container, Prototype
+        >>> container = Container()
+        >>> container.bind(list).to_factory(lambda: [1, 2, 3], Prototype)
+        >>>
+        >>> with container.create_scope() as scope:
+        ...     l1 = scope.resolve(list)
+        ...     l1.append(4)
+        ...     l2 = scope.resolve(list)
+        ...     print(l1 is l2, l2)  # Distinct copies of the same prototype
+        False [1, 2, 3]
+
+    See Also:
+        Singleton: for app-wide singletons
+        Transient: for no caching
+    """
+
+    def resolve(self, scope: Scope, binding: Binding[_T]) -> _T:
+        return _clone(Singleton().resolve(scope, binding))
+
+    async def aresolve(self, scope: Scope, binding: Binding[_T]) -> _T:
+        return _clone(await Singleton().aresolve(scope, binding))
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, Prototype)
+
+    def __hash__(self) -> int:
+        return hash(Prototype)
+
+
+class Members(Lifetime):
+    """Resolve members of a collection, each according to its own lifetime.
+
+    This lifetime is used by bindings of collections whose members are bound using
+    :meth:`Container.bind_member`, it is not meant to be used directly. Members are
+    resolved in binding order into a new list on each resolve, concurrently when
+    resolved asynchronously.
+    """
+
+    def __init__(self, bindings: tuple[Binding[Any], ...]) -> None:
+        self.bindings = bindings
+
+    def resolve(self, scope: Scope, binding: Binding[_T]) -> _T:  # noqa: ARG002
+        return cast(
+            "_T", [member.lifetime.resolve(scope, member) for member in self.bindings]
+        )
+
+    async def aresolve(self, scope: Scope, binding: Binding[_T]) -> _T:  # noqa: ARG002
+        return cast(
+            "_T",
+            list(
+                await asyncio.gather(
+                    *(
+                        member.lifetime.aresolve(scope, member)
+                        for member in self.bindings
+                    )
+                )
+            ),
+        )
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, Members) and value.bindings == self.bindings
+
+    def __hash__(self) -> int:
+        return hash((Members, self.bindings))
+
+
+def _clone(prototype: _T) -> _T:
+    clone = getattr(prototype, "__clone__", None)
+    if clone is not None:
+        return cast("_T", clone())
+    return copy.copy(prototype)
+
+
+def _get_teardown_order(
+    graph: LifetimeContext, bindings: list[Binding[Any]]
+) -> tuple[list[int], list[list[int]]]:
+    """Return how many entered bindings each one must wait for before being exited.
+
+    Also returns, for each binding, indexes of the bindings waiting for it. A binding
+    waits for bindings entered after it whose type has been created using its type.
+    """
+    dependents = {
+        type_: graph.get_transitive_dependents(type_)
+        for type_ in {binding.type_ for binding in bindings}
+    }
+    pending = [0] * len(bindings)
+    waiting: list[list[int]] = [[] for _ in bindings]
+    for index, binding in enumerate(bindings):
+        for later in range(index + 1, len(bindings)):
+            if bindings[later].type_ in dependents[binding.type_]:
+                pending[index] += 1
+                waiting[later].append(index)
+    return pending, waiting
+
+
+def _get_owner_scope(scope: Scope, owner: Container | Scope) -> Scope:
+    """Return the scope to create singletons cached by given owner from.
+
+    Singletons cached by a parent container are shared by all its children, hence
+    they must be created using bindings of that parent only.
+    """
+    if owner is scope or owner is scope.container:
+        return scope
+    return cast("Container", owner)._get_singletons_scope()  # noqa: SLF001
+
 
 class Releasable(AbstractContextManager[_T], AbstractAsyncContextManager[_T]):
     def __exit__(
@@ -201,19 +446,39 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         :returns: Existing or newly created lifetime context.
         """
         if obj not in cls._contexts:
-            cls._contexts[obj] = cls()
+            cls._contexts[obj] = cls(obj)
         return cls._contexts[obj]
 
-    def __init__(self) -> None:
+    def __init__(self, owner: object | None = None) -> None:
         self._logger = logging.getLogger(__name__)
-        self._cache: dict[int, Any] = {}
+        self._owner = weakref.ref(owner) if owner is not None else None
+        hooks = getattr(owner, "hooks", None)
+        self._hooks = hooks if isinstance(hooks, Hooks) else Hooks()
+        self._cache: list[tuple[Binding[Any], Any] | None] = []
         self._lock = Lock()
         self._async_lock = asyncio.Lock()
+        # Locks mapped to binding slots
         self._registration_locks = defaultdict[int, RLock](RLock)
         self._async_registration_locks = defaultdict[int, asyncio.Lock](asyncio.Lock)
-        self._entered_context_managers = deque[
-            AbstractContextManager[Any] | AbstractAsyncContextManager[Any]
-        ]()
+        # Number of threads or tasks waiting for registration locks, per binding slot.
+        # Only counted when hooks are enabled
+        self._lock_waiters: dict[int, int] = {}
+        self._entered_context_managers: deque[
+            tuple[
+                Binding[Any],
+                AbstractContextManager[Any] | AbstractAsyncContextManager[Any],
+            ]
+        ] = deque()
+        self.dependents = defaultdict[type[Any], set[type[Any]]](set)
+        """Types which have been created using a given type, only filled for containers"""
+        self._creation_stack: StackSummary | None = getattr(
+            owner, "creation_stack", None
+        )
+
+    @property
+    def pending_resources(self) -> int:
+        """Return the number of entered context managers not exited yet."""
+        return len(self._entered_context_managers)
 
     def __exit__(
         self,
@@ -221,21 +486,12 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        container = self._get_parallel_teardown_container()
+        if container is not None and len(self._entered_context_managers) > 1:
+            self._exit_in_parallel(container, exc_type, exc_val, exc_tb)
         while self._entered_context_managers:
-            cm = self._entered_context_managers.pop()
-            if isinstance(cm, AbstractAsyncContextManager):
-                warnings.warn(
-                    f"SKipped exiting async context manager {cm} in sync cleanup, use `aclose()` or `async with`.",
-                    UserWarning,
-                    stacklevel=1,
-                )
-                continue
-
-            try:
-                cm.__exit__(exc_type, exc_val, exc_tb)
-            except Exception:
-                # TODO: reraise the last exception (just like an exit stack)
-                self._logger.exception("Failed exiting context manager {cm}.")
+            binding, cm = self._entered_context_managers.pop()
+            self._exit_entry(binding, cm, exc_type, exc_val, exc_tb)
 
         self._cache.clear()
         self._registration_locks.clear()
@@ -248,16 +504,14 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         exc_tb: TracebackType | None,
     ) -> None:
         while self._entered_context_managers:
-            cm = self._entered_context_managers.pop()
-
-            try:
-                if isinstance(cm, AbstractAsyncContextManager):
-                    await cm.__aexit__(exc_type, exc_val, exc_tb)
-                else:
-                    cm.__exit__(exc_type, exc_val, exc_tb)
-            except Exception:
-                # TODO: reraise the last exception (just like an exit stack)
-                self._logger.exception("Failed exiting context manager {cm}.")
+            binding, cm = self._entered_context_managers.pop()
+            # TODO: reraise the last exception (just like an exit stack)
+            if isinstance(cm, AbstractAsyncContextManager):
+                await self._aexit_context_manager(
+                    binding, cm, exc_type, exc_val, exc_tb
+                )
+            else:
+                self._exit_context_manager(binding, cm, exc_type, exc_val, exc_tb)
 
         self._cache.clear()
         self._registration_locks.clear()
@@ -269,51 +523,298 @@ class LifetimeContext(Releasable["LifetimeContext"]):
     async def aclose(self) -> None:
         await self.__aexit__(None, None, None)
 
+    async def ashutdown(
+        self,
+        resource_timeout: float | None,
+        timed_out: list[Binding[Any]],
+        failed: list[tuple[Binding[Any], Exception]],
+    ) -> None:
+        """Asynchronously exit entered context managers, reporting unfinished ones.
+
+        Each async context manager exit is cancelled after ``resource_timeout``
+        seconds. Sync context managers exits can not be interrupted, unless they
+        belong to blocking bindings. When this coroutine is cancelled, the context
+        manager being exited is reported as timed out and the remaining ones are
+        kept entered.
+
+        :param resource_timeout: Maximum duration of each exit, in seconds.
+        :param timed_out: List to append bindings whose exit timed out to.
+        :param failed: List to append bindings whose exit raised, with errors, to.
+        """
+        while self._entered_context_managers:
+            binding, cm = self._entered_context_managers.pop()
+            try:
+                if isinstance(cm, AbstractAsyncContextManager):
+                    error = await asyncio.wait_for(
+                        self._aexit_context_manager(binding, cm, None, None, None),
+                        resource_timeout,
+                    )
+                else:
+                    error = self._exit_context_manager(binding, cm, None, None, None)
+            except asyncio.TimeoutError:
+                timed_out.append(binding)
+                continue
+            except asyncio.CancelledError:
+                timed_out.append(binding)
+                raise
+            if error is not None:
+                failed.append((binding, error))
+
+        self._cache.clear()
+        self._registration_locks.clear()
+        self._async_registration_locks.clear()
+
+    def detach(self) -> LifetimeContext:
+        """Move entered context managers to a new context and clear this one.
+
+        This allows exiting context managers later, or from another thread, while
+        this context owner is immediately reusable.
+
+        :returns: A context holding entered context managers of this context.
+        """
+        detached = LifetimeContext(self._owner() if self._owner is not None else None)
+        detached._hooks = self._hooks
+        detached._entered_context_managers, self._entered_context_managers = (
+            self._entered_context_managers,
+            deque(),
+        )
+        self._cache.clear()
+        self._registration_locks.clear()
+        self._async_registration_locks.clear()
+        return detached
+
+    def get_pending_bindings(self) -> list[Binding[Any]]:
+        """Return bindings of entered context managers not exited yet, oldest first."""
+        return [binding for binding, _ in self._entered_context_managers]
+
+    def get_transitive_dependents(self, type_: type[Any]) -> set[type[Any]]:
+        """Return all types which have been created using given type, even indirectly.
+
+        :param type_: Type to get dependents of.
+        :returns: Types depending on given type.
+        """
+        dependents: set[type[Any]] = set()
+        pending = [type_]
+        while pending:
+            for dependent in self.dependents.get(pending.pop(), ()):
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    pending.append(dependent)
+        return dependents
+
+    def evict(self, types: set[type[Any]]) -> None:
+        """Remove cached instances of given types and exit their context managers.
+
+        Async context managers can not be exited synchronously and are kept until
+        this context is asynchronously closed.
+
+        :param types: Bound types whose cached instances must be removed.
+        """
+        evicted: list[Binding[Any]] = []
+        with self._lock:
+            for slot, entry in enumerate(self._cache):
+                if entry is not None and entry[0].type_ in types:
+                    evicted.append(entry[0])
+                    self._cache[slot] = None
+        if not evicted:
+            return
+
+        self._logger.info("Evicted cached instances of %s", evicted)
+
+        evicted_ids = {id(binding) for binding in evicted}
+        for entry in reversed(self._entered_context_managers.copy()):
+            binding, cm = entry
+            if isinstance(cm, _OffloadedContextManager):
+                cm = cm.context_manager
+            if id(binding) not in evicted_ids or isinstance(
+                cm, AbstractAsyncContextManager
+            ):
+                continue
+            self._entered_context_managers.remove(entry)
+            self._exit_context_manager(binding, cm, None, None, None)
+
+    def share_cached_instances(self, other: LifetimeContext) -> None:
+        """Make given context cached instances available from this context.
+
+        Context managers entered for those instances remain owned by the other context
+        and are not exited when this context is closed. The types those instances have
+        been created from are copied as well so they are evicted from this context
+        when one of them is rebound.
+
+        :param other: Context whose cached instances must be shared.
+        """
+        for entry in other._cache:
+            if entry is not None:
+                self._set_entry(*entry)
+        for type_, dependents in list(other.dependents.items()):
+            self.dependents[type_] |= dependents
+
     def get_cached_instance(self, scope: Scope, binding: Binding[_T]) -> _T:
-        # NOTE: use binding object ID allowing to not get previously cached value
-        # for a type already resolved but overriden afterwards (Override will bind
-        # another binding object).
-        registration_hash = id(binding)
+        # NOTE: cache is indexed by binding slot. A type already resolved but
+        # overriden afterwards is bound to another binding object having its own slot
+        # hence previously cached value is not used.
+        slot = binding.slot
+        entry = self._get_entry(binding)
+        if entry is not None:
+            if scope._hooks.enabled:  # noqa: SLF001
+                scope._hooks.emit_cache_hit(CacheHitEvent(binding, scope))  # noqa: SLF001
+            return cast("_T", entry[1])
 
         with self._lock:
             # Use a context shared lock to ensure all threads use the same lock
             # per binding
-            registration_lock = self._registration_locks[registration_hash]
-
-        with registration_lock:
-            # Use a context and binding shared lock to ensure a single thread
-            # can run the following code. This will ensure we can not end up with
-            # two instances of a singleton lifetime binding if two threads
-            # resolve it at the same time
-            if registration_hash not in self._cache:
-                self._cache[registration_hash] = self.get_instance(scope, binding)
-            return cast("_T", self._cache[registration_hash])
+            registration_lock = self._registration_locks[slot]
+
+        # Use a context and binding shared lock to ensure a single thread
+        # can run the following code. This will ensure we can not end up with
+        # two instances of a singleton lifetime binding if two threads
+        # resolve it at the same time
+        self._acquire_registration_lock(scope, binding, registration_lock)
+        try:
+            entry = self._get_entry(binding)
+            if entry is None:
+                entry = self._set_entry(binding, self.get_instance(scope, binding))
+            elif scope._hooks.enabled:  # noqa: SLF001
+                scope._hooks.emit_cache_hit(CacheHitEvent(binding, scope))  # noqa: SLF001
+            return cast("_T", entry[1])
+        finally:
+            registration_lock.release()
 
     async def aget_cached_instance(self, scope: Scope, binding: Binding[_T]) -> _T:
-        # NOTE: use binding object ID allowing to not get previously cached value
-        # for a type already resolved but overriden afterwards (Override will bind
-        # another binding object).
-        registration_hash = id(binding)
+        # NOTE: cache is indexed by binding slot. A type already resolved but
+        # overriden afterwards is bound to another binding object having its own slot
+        # hence previously cached value is not used.
+        slot = binding.slot
+        entry = self._get_entry(binding)
+        if entry is not None:
+            if scope._hooks.enabled:  # noqa: SLF001
+                scope._hooks.emit_cache_hit(CacheHitEvent(binding, scope))  # noqa: SLF001
+            return cast("_T", entry[1])
 
         async with self._async_lock:
             # Use a context shared lock to ensure all threads use the same lock
             # per binding
-            registration_lock = self._async_registration_locks[registration_hash]
-
-        async with registration_lock:
-            # Use a context and binding shared lock to ensure a single thread
-            # can run the following code. This will ensure we can not end up with
-            # two instances of a singleton lifetime binding if two threads
-            # resolve it at the same time
-            if registration_hash not in self._cache:
-                self._cache[registration_hash] = await self.aget_instance(
-                    scope, binding
+            registration_lock = self._async_registration_locks[slot]
+
+        # Use a context and binding shared lock to ensure a single thread
+        # can run the following code. This will ensure we can not end up with
+        # two instances of a singleton lifetime binding if two threads
+        # resolve it at the same time
+        await self._aacquire_registration_lock(scope, binding, registration_lock)
+        try:
+            entry = self._get_entry(binding)
+            if entry is None:
+                entry = self._set_entry(
+                    binding, await self.aget_instance(scope, binding)
                 )
-            return cast("_T", self._cache[registration_hash])
+            elif scope._hooks.enabled:  # noqa: SLF001
+                scope._hooks.emit_cache_hit(CacheHitEvent(binding, scope))  # noqa: SLF001
+            return cast("_T", entry[1])
+        finally:
+            registration_lock.release()
+
+    def _acquire_registration_lock(
+        self, scope: Scope, binding: Binding[Any], lock: RLock
+    ) -> None:
+        # NOTE: waits are only measured when the lock is contended and hooks enabled,
+        # uncontended resolutions only pay a non blocking acquire
+        if lock.acquire(blocking=False):
+            return
+        if not scope._hooks.enabled:  # noqa: SLF001
+            lock.acquire()
+            return
+
+        waiters = self._add_lock_waiter(binding, 1)
+        start = perf_counter()
+        try:
+            lock.acquire()
+        finally:
+            self._add_lock_waiter(binding, -1)
+        self._emit_lock_wait(scope, binding, start, waiters)
+
+    async def _aacquire_registration_lock(
+        self, scope: Scope, binding: Binding[Any], lock: asyncio.Lock
+    ) -> None:
+        if not lock.locked() or not scope._hooks.enabled:  # noqa: SLF001
+            await lock.acquire()
+            return
+
+        waiters = self._add_lock_waiter(binding, 1)
+        start = perf_counter()
+        try:
+            await lock.acquire()
+        finally:
+            self._add_lock_waiter(binding, -1)
+        self._emit_lock_wait(scope, binding, start, waiters)
+
+    def _add_lock_waiter(self, binding: Binding[Any], count: int) -> int:
+        slot = binding.slot
+        with self._lock:
+            waiters = self._lock_waiters.get(slot, 0) + count
+            if waiters:
+                self._lock_waiters[slot] = waiters
+            else:
+                del self._lock_waiters[slot]
+        return waiters
+
+    def _emit_lock_wait(
+        self, scope: Scope, binding: Binding[Any], start: float, waiters: int
+    ) -> None:
+        duration = perf_counter() - start
+        scope._hooks.emit_lock_wait(  # noqa: SLF001
+            LockWaitEvent(binding, scope, duration, waiters)
+        )
+
+    def get_cached_entry(self, binding: Binding[_T]) -> tuple[Binding[_T], _T] | None:
+        """Return given binding cached instance, if any, without creating it.
+
+        :param binding: Binding to get the cached instance of.
+        :returns: The binding and its cached instance or None if not cached.
+        """
+        return self._get_entry(binding)
+
+    def _get_entry(self, binding: Binding[Any]) -> tuple[Binding[Any], Any] | None:
+        cache = self._cache
+        slot = binding.slot
+        if slot < len(cache):
+            entry = cache[slot]
+            # NOTE: a slot can only be reused by another binding once the previous
+            # one has been garbage collected, which can't happen while cached because
+            # entries reference their binding. This check is then only a safety net.
+            if entry is not None and entry[0] is binding:
+                return entry
+        return None
+
+    def _set_entry(self, binding: Binding[_T], instance: _T) -> tuple[Binding[_T], _T]:
+        entry = (binding, instance)
+        slot = binding.slot
+        with self._lock:
+            if slot >= len(self._cache):
+                self._cache.extend([None] * (slot + 1 - len(self._cache)))
+            self._cache[slot] = entry
+        return entry
 
     def get_instance(self, scope: Scope, binding: Binding[_T]) -> _T:
-        args, kwargs = self._resolve_dependencies(binding, scope)
-        instance = binding.factory(*args, **kwargs)
+        hooks = scope._hooks  # noqa: SLF001
+        slow_calls = hooks.slow_calls
+        frame = _ResolutionFrame(binding, _resolution_frame.get())
+        if slow_calls is not None:
+            frame.start = perf_counter()
+        token = _resolution_frame.set(frame)
+        try:
+            args, kwargs = self._resolve_dependencies(binding, scope)
+            timed = hooks.enabled or slow_calls is not None
+            start = perf_counter() if timed else 0.0
+            nested_duration = frame.nested_duration
+            instance = binding.factory(*args, **kwargs)
+            if slow_calls is not None:
+                # NOTE: exclude dependencies resolved by the factory itself
+                duration = perf_counter() - start
+                duration -= frame.nested_duration - nested_duration
+                slow_calls.check(binding, "factory", duration, frame.get_chain)
+        finally:
+            _resolution_frame.reset(token)
+        self._add_dependents(scope, binding, frame.dependencies)
 
         if asyncio.iscoroutine(instance):
             instance.close()
@@ -323,8 +824,11 @@ class LifetimeContext(Releasable["LifetimeContext"]):
             msg = f"Cannot resolve async context manager {instance}. Use `aresolve()` instead."
             raise TypeError(msg)
         if isinstance(instance, AbstractContextManager) and binding.managed:
-            self._entered_context_managers.append(instance)
-            instance = instance.__enter__()
+            instance = self._enter_context_manager(binding, instance, frame, slow_calls)
+        if hooks.enabled:
+            self._emit_create(scope, binding, instance, start)
+        if slow_calls is not None:
+            frame.end()
 
         with suppress(TypeError):
             if not isinstance(instance, binding.type_):
@@ -340,17 +844,42 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         return cast("_T", instance)
 
     async def aget_instance(self, scope: Scope, binding: Binding[_T]) -> _T:
-        args, kwargs = await self._aresolve_dependencies(binding, scope)
-        instance = binding.factory(*args, **kwargs)
-
-        if asyncio.iscoroutine(instance):
-            instance = await instance
+        hooks = scope._hooks  # noqa: SLF001
+        slow_calls = hooks.slow_calls
+        frame = _ResolutionFrame(binding, _resolution_frame.get())
+        if slow_calls is not None:
+            frame.start = perf_counter()
+        token = _resolution_frame.set(frame)
+        try:
+            args, kwargs = await self._aresolve_dependencies(binding, scope)
+            timed = hooks.enabled or slow_calls is not None
+            start = perf_counter() if timed else 0.0
+            nested_duration = frame.nested_duration
+            instance = await self._acall_factory(scope, binding, args, kwargs)
+            if slow_calls is not None:
+                # NOTE: exclude dependencies resolved by the factory itself
+                duration = perf_counter() - start
+                duration -= frame.nested_duration - nested_duration
+                slow_calls.check(binding, "factory", duration, frame.get_chain)
+        finally:
+            _resolution_frame.reset(token)
+        self._add_dependents(scope, binding, frame.dependencies)
+        # NOTE: offloaded context managers often return themselves when entered
+        offloaded = isinstance(instance, _OffloadedContextManager)
         if isinstance(instance, AbstractAsyncContextManager) and binding.managed:
-            self._entered_context_managers.append(instance)
-            instance = await instance.__aenter__()
-        if isinstance(instance, AbstractContextManager) and binding.managed:
-            self._entered_context_managers.append(instance)
-            instance = instance.__enter__()
+            instance = await self._aenter_context_manager(
+                binding, instance, frame, slow_calls
+            )
+        if (
+            isinstance(instance, AbstractContextManager)
+            and binding.managed
+            and not offloaded
+        ):
+            instance = self._enter_context_manager(binding, instance, frame, slow_calls)
+        if hooks.enabled:
+            self._emit_create(scope, binding, instance, start)
+        if slow_calls is not None:
+            frame.end()
 
         with suppress(TypeError):
             if not isinstance(instance, binding.type_):
@@ -365,14 +894,219 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         # is no way to enforce this so we just return the value anyway
         return cast("_T", instance)
 
+    async def _acall_factory(
+        self,
+        scope: Scope,
+        binding: Binding[Any],
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        if not binding.blocking:
+            instance = binding.factory(*args, **kwargs)
+        else:
+            executor = scope.container.executor
+            instance = await _run_blocking(
+                executor, partial(binding.factory, *args, **kwargs)
+            )
+            if (
+                isinstance(instance, AbstractContextManager)
+                and not isinstance(instance, AbstractAsyncContextManager)
+                and binding.managed
+            ):
+                # Enter and exit the returned context manager on the executor as well
+                instance = _OffloadedContextManager(instance, executor)
+        if asyncio.iscoroutine(instance):
+            instance = await instance
+        return instance
+
+    def _enter_context_manager(
+        self,
+        binding: Binding[Any],
+        cm: AbstractContextManager[Any],
+        frame: _ResolutionFrame,
+        slow_calls: SlowCallDetector | None,
+    ) -> Any:  # noqa: ANN401
+        self._entered_context_managers.append((binding, cm))
+        if slow_calls is None:
+            return cm.__enter__()
+        start = perf_counter()
+        instance = cm.__enter__()
+        slow_calls.check(binding, "enter", perf_counter() - start, frame.get_chain)
+        return instance
+
+    async def _aenter_context_manager(
+        self,
+        binding: Binding[Any],
+        cm: AbstractAsyncContextManager[Any],
+        frame: _ResolutionFrame,
+        slow_calls: SlowCallDetector | None,
+    ) -> Any:  # noqa: ANN401
+        self._entered_context_managers.append((binding, cm))
+        if slow_calls is None:
+            return await cm.__aenter__()
+        start = perf_counter()
+        instance = await cm.__aenter__()
+        slow_calls.check(binding, "enter", perf_counter() - start, frame.get_chain)
+        return instance
+
+    def _exit_context_manager(
+        self,
+        binding: Binding[Any],
+        cm: AbstractContextManager[Any],
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Exception | None:
+        timed = self._hooks.enabled or self._hooks.slow_calls is not None
+        start = perf_counter() if timed else 0.0
+        error = None
+        try:
+            cm.__exit__(exc_type, exc_val, exc_tb)
+        except Exception as exc:
+            self._logger.exception("Failed exiting context manager %s.", cm)
+            error = exc
+        if timed:
+            self._released(binding, perf_counter() - start)
+        return error
+
+    def _get_parallel_teardown_container(self) -> Container | None:
+        """Return the container whose pool must exit context managers, if enabled."""
+        owner = self._owner() if self._owner is not None else None
+        # NOTE: scopes are torn down according to their container settings
+        container = getattr(owner, "container", owner)
+        if getattr(container, "_parallel_teardown", False):
+            return cast("Container", container)
+        return None
+
+    def _exit_entry(
+        self,
+        binding: Binding[Any],
+        cm: AbstractContextManager[Any] | AbstractAsyncContextManager[Any],
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if isinstance(cm, _OffloadedContextManager):
+            # NOTE: exiting synchronously already blocks the calling thread
+            cm = cm.context_manager
+        if isinstance(cm, AbstractAsyncContextManager):
+            warnings.warn(
+                f"SKipped exiting async context manager {cm} in sync cleanup, use `aclose()` or `async with`.",
+                UserWarning,
+                stacklevel=1,
+            )
+            return
+
+        # TODO: reraise the last exception (just like an exit stack)
+        self._exit_context_manager(binding, cm, exc_type, exc_val, exc_tb)
+
+    def _exit_in_parallel(
+        self,
+        container: Container,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit entered context managers concurrently, in reverse dependency order.
+
+        A context manager is exited only once all context managers entered after it
+        for types created using its type, even indirectly, have been exited.
+        """
+        executor = container._get_thread_pool()  # noqa: SLF001
+        entries = list(self._entered_context_managers)
+        self._entered_context_managers.clear()
+        pending, waiting = _get_teardown_order(
+            LifetimeContext.get(container), [binding for binding, _ in entries]
+        )
+        running: dict[Future[None], int] = {}
+        ready = [index for index, count in enumerate(pending) if not count]
+        errors: list[BaseException] = []
+        while ready or running:
+            for index in reversed(ready):
+                binding, cm = entries[index]
+                future = executor.submit(
+                    copy_context().run,
+                    partial(self._exit_entry, binding, cm, exc_type, exc_val, exc_tb),
+                )
+                running[future] = index
+            ready = []
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                # NOTE: exceptions are logged by exits, only base ones are left
+                if (error := future.exception()) is not None:
+                    errors.append(error)
+                for index in waiting[running.pop(future)]:
+                    pending[index] -= 1
+                    if not pending[index]:
+                        ready.append(index)
+        if errors:
+            raise errors[0]
+
+    async def _aexit_context_manager(
+        self,
+        binding: Binding[Any],
+        cm: AbstractAsyncContextManager[Any],
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Exception | None:
+        timed = self._hooks.enabled or self._hooks.slow_calls is not None
+        start = perf_counter() if timed else 0.0
+        error = None
+        try:
+            await cm.__aexit__(exc_type, exc_val, exc_tb)
+        except Exception as exc:
+            self._logger.exception("Failed exiting context manager %s.", cm)
+            error = exc
+        if timed:
+            self._released(binding, perf_counter() - start)
+        return error
+
+    def _emit_create(
+        self, scope: Scope, binding: Binding[Any], instance: object, start: float
+    ) -> None:
+        duration = perf_counter() - start
+        created = _created_instances.get()
+        if created is not None:
+            created.append(instance)
+        scope._hooks.emit_create(CreateEvent(binding, scope, duration))  # noqa: SLF001
+
+    def _released(self, binding: Binding[Any], duration: float) -> None:
+        if self._hooks.slow_calls is not None:
+            self._hooks.slow_calls.check(
+                binding, "exit", duration, lambda: (binding.type_,)
+            )
+        if self._hooks.enabled:
+            owner = self._owner() if self._owner is not None else None
+            self._hooks.emit_release(
+                ReleaseEvent(binding, owner, duration)  # type: ignore[arg-type]
+            )
+
+    def _add_dependents(
+        self, scope: Scope, binding: Binding[Any], dependencies: set[type[Any]]
+    ) -> None:
+        if dependencies:
+            graph = LifetimeContext.get(scope.container).dependents
+            for dependency in dependencies:
+                graph[dependency].add(binding.type_)
+
     def _resolve_dependencies(
         self, binding: Binding[_T], scope: Scope
     ) -> tuple[list[Any], dict[str, Any]]:
         args = []
         kwargs: dict[str, Any] = {}
 
-        for dep in binding.dependencies:
-            resolved = scope.resolve(dep.type_)
+        dependencies = scope._get_dependencies(binding)  # noqa: SLF001
+        if len(dependencies) > 1 and scope.container._parallel_resolution:  # noqa: SLF001
+            values = _resolve_in_parallel(
+                scope,
+                [dep.type_ for dep in dependencies],
+                scope.container._get_thread_pool(),  # noqa: SLF001
+            )
+        else:
+            values = [scope.resolve(dep.type_) for dep in dependencies]
+
+        for dep, resolved in zip(dependencies, values, strict=False):
             if dep.positional_only:
                 args.append(resolved)
                 continue
@@ -386,7 +1120,7 @@ class LifetimeContext(Releasable["LifetimeContext"]):
         args = []
         kwargs: dict[str, Any] = {}
 
-        for dep in binding.dependencies:
+        for dep in scope._get_dependencies(binding):  # noqa: SLF001
             resolved = await scope.aresolve(dep.type_)
             if dep.positional_only:
                 args.append(resolved)
@@ -397,9 +1131,11 @@ class LifetimeContext(Releasable["LifetimeContext"]):
 
     def __del__(self) -> None:
         if self._entered_context_managers:
-            warnings.warn(
+            message = (
                 "A Container or Scope has been garbage-collected with pending resources."
-                " Did you forget to call `close()` or `aclose()`?",
-                UserWarning,
-                stacklevel=1,
+                " Did you forget to call `close()` or `aclose()`?"
             )
+            if self._creation_stack is not None:
+                stack = "".join(self._creation_stack.format())
+                message += f" It has been created at:\n{stack}"
+            warnings.warn(message, UserWarning, stacklevel=1)
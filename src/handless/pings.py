@@ -0,0 +1,124 @@
+"""Check health of singletons interacting with shared resources, like databases."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextvars import copy_context
+from dataclasses import dataclass, replace
+from functools import partial
+from inspect import isawaitable
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class PingResult:
+    """Outcome of a single ping."""
+
+    type_: type[Any]
+    """Type whose singleton has been pinged"""
+    healthy: bool
+    """Whether the ping neither raised, timed out nor returned ``False``"""
+    duration: float
+    """Time spent pinging, in seconds"""
+    error: Exception | None = None
+    """Error raised by the ping, :class:`TimeoutError` if it timed out"""
+    cached: bool = False
+    """Whether this result has been returned by a previous ping still fresh"""
+
+
+@dataclass(frozen=True, slots=True)
+class PingReport:
+    """Outcome of pinging all singletons of a container."""
+
+    results: tuple[PingResult, ...] = ()
+    """Results of pings of created singletons"""
+    skipped: tuple[type[Any], ...] = ()
+    """Types having pings but whose singleton has not been created yet"""
+
+    @property
+    def healthy(self) -> bool:
+        """Return whether all pings succeeded."""
+        return all(result.healthy for result in self.results)
+
+
+class Ping(Generic[_T]):
+    """Health check of the singleton bound to a type.
+
+    Prefer using :meth:`Container.add_ping` rather than this class directly.
+    """
+
+    def __init__(
+        self,
+        type_: type[_T],
+        callback: Callable[[_T], object],
+        *,
+        timeout: float | None = 5.0,
+        ttl: float = 0.0,
+    ) -> None:
+        """Create a new ping.
+
+        :param type_: Type whose singleton is pinged.
+        :param callback: Function, sync or async, receiving the singleton to check.
+            It fails by raising or returning ``False``.
+        :param timeout: Maximum duration of the ping, in seconds.
+        :param ttl: Duration, in seconds, during which a result is reused.
+        """
+        self._logger = logging.getLogger(__name__)
+        self.type_ = type_
+        self.callback = callback
+        self.timeout = timeout
+        self.ttl = ttl
+        # Last result with the id of the pinged instance and its expiration time
+        self._last: tuple[int, float, PingResult] | None = None
+
+    async def arun(self, instance: _T, executor: Executor | None) -> PingResult:
+        """Ping given instance unless a fresh result of a previous ping exists.
+
+        Sync callbacks are run on given executor, or :func:`asyncio.to_thread`.
+
+        :param instance: Singleton to check.
+        :param executor: Executor running sync callbacks.
+        :returns: The ping result, which never raises.
+        """
+        last = self._last
+        if last is not None and last[0] == id(instance) and perf_counter() < last[1]:
+            return replace(last[2], cached=True)
+
+        start = perf_counter()
+        error: Exception | None = None
+        try:
+            healthy = await asyncio.wait_for(
+                self._call(instance, executor), self.timeout
+            )
+        except asyncio.TimeoutError:
+            self._logger.warning("Ping of %s timed out.", self.type_)
+            healthy, error = False, TimeoutError(f"Ping of {self.type_} timed out")
+        except Exception as exc:
+            self._logger.exception("Ping of %s failed.", self.type_)
+            healthy, error = False, exc
+        end = perf_counter()
+        result = PingResult(self.type_, healthy is not False, end - start, error)
+        if self.ttl:
+            self._last = (id(instance), end + self.ttl, result)
+        return result
+
+    async def _call(self, instance: _T, executor: Executor | None) -> object:
+        if asyncio.iscoroutinefunction(self.callback):
+            return await self.callback(instance)
+        call = partial(copy_context().run, self.callback, instance)
+        if executor is None:
+            result = await asyncio.to_thread(call)
+        else:
+            result = await asyncio.get_running_loop().run_in_executor(executor, call)
+        if isawaitable(result):
+            return await result
+        return result
@@ -0,0 +1,190 @@
+"""Record resolution trees with timings to find slow branches of objects graphs."""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from handless._utils import get_qualified_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from handless._registry import Binding
+    from handless.hooks import Hooks, ResolveEvent
+
+
+@dataclass(slots=True)
+class ResolutionNode:
+    """A single resolution and the resolutions it triggered."""
+
+    binding: Binding[Any]
+    """Binding used to resolve the type"""
+    start: float
+    """Value of `time.perf_counter()` when the resolution started"""
+    duration: float
+    """Time spent resolving the type, including its children, in seconds"""
+    cache_hit: bool
+    """Whether the returned instance was already cached"""
+    children: list[ResolutionNode] = field(default_factory=list)
+    """Resolutions of dependencies, in resolution order"""
+
+    @property
+    def self_time(self) -> float:
+        """Return time spent resolving the type excluding its children, in seconds."""
+        return max(0.0, self.duration - sum(child.duration for child in self.children))
+
+    @property
+    def name(self) -> str:
+        """Return the qualified name of the resolved type."""
+        return get_qualified_name(self.binding.type_)
+
+    def walk(
+        self, path: tuple[str, ...] = ()
+    ) -> Iterator[tuple[tuple[str, ...], ResolutionNode]]:
+        """Iterate over this node and its descendants along with their names path.
+
+        :param path: Names of this node ancestors.
+        :yields: Names path, from the top level resolved type, and node pairs.
+        """
+        path = (*path, self.name)
+        yield path, self
+        for child in self.children:
+            yield from child.walk(path)
+
+
+class Profiler:
+    """Record the nested resolution tree of each top level resolution.
+
+    Trees are rebuilt from resolve hooks events, which are received after each
+    resolution completes, children first. Each thread and asyncio task builds its own
+    trees.
+
+    >>> from handless import Container
+    >>> container = Container()
+    >>> container.bind(str).to_value("handless")
+    >>> container.bind(bytes).to_factory(lambda scope: scope.resolve(str).encode())
+    >>> with container.profile() as profiler, container.resolve(bytes):
+    ...     pass
+    >>> [
+    ...     (node.name, [child.name for child in node.children])
+    ...     for node in profiler.roots
+    ... ]
+    [('builtins.bytes', ['builtins.str'])]
+    """
+
+    def __init__(self) -> None:
+        self.roots: list[ResolutionNode] = []
+        """Trees of completed top level resolutions, in completion order"""
+        self._lock = Lock()
+        self._pending = ContextVar[list[ResolutionNode] | None](
+            f"_pending_{id(self)}", default=None
+        )
+
+    def register(self, hooks: Hooks) -> None:
+        """Start recording resolutions from given hooks events.
+
+        :param hooks: Hooks to register the profiler on.
+        """
+        hooks.on_resolve(self._on_resolve)
+
+    def unregister(self, hooks: Hooks) -> None:
+        """Stop recording resolutions from given hooks events.
+
+        :param hooks: Hooks to unregister the profiler from.
+        """
+        hooks.remove(self._on_resolve)
+
+    def clear(self) -> None:
+        """Forget all recorded resolution trees."""
+        with self._lock:
+            self.roots = []
+
+    def to_collapsed(self) -> str:
+        """Export recorded trees in collapsed stacks format, for flame graph tools.
+
+        Each line holds the semicolon separated names path of a resolved type followed
+        by the sum of its self time, in nanoseconds, for all resolutions of this path.
+
+        :returns: Collapsed stacks, one per line.
+        """
+        weights = Counter[tuple[str, ...]]()
+        for root in self.roots:
+            for path, node in root.walk():
+                weights[path] += round(node.self_time * 1e9)
+        return "".join(
+            f"{';'.join(name.replace(';', ':') for name in path)} {weight}\n"
+            for path, weight in weights.items()
+        )
+
+    def to_speedscope(self, name: str = "handless") -> str:
+        """Export recorded trees as a speedscope evented profile JSON document.
+
+        Top level resolutions are laid out one after the other, in start order, so
+        that resolutions run concurrently by several threads or tasks do not overlap.
+
+        :param name: Name of the profile.
+        :returns: A JSON document loadable with https://www.speedscope.app.
+        """
+        frames: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+
+        def add_events(node: ResolutionNode, offset: float) -> None:
+            frame = frames.setdefault(node.name, len(frames))
+            events.append({"type": "O", "frame": frame, "at": node.start + offset})
+            for child in node.children:
+                add_events(child, offset)
+            end = node.start + node.duration + offset
+            events.append({"type": "C", "frame": frame, "at": end})
+
+        elapsed = 0.0
+        for root in sorted(self.roots, key=lambda root: root.start):
+            add_events(root, elapsed - root.start)
+            elapsed += root.duration
+        return json.dumps(
+            {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "exporter": "handless",
+                "name": name,
+                "shared": {"frames": [{"name": frame} for frame in frames]},
+                "profiles": [
+                    {
+                        "type": "evented",
+                        "name": name,
+                        "unit": "seconds",
+                        "startValue": 0.0,
+                        "endValue": events[-1]["at"] if events else 0.0,
+                        "events": events,
+                    }
+                ],
+            }
+        )
+
+    def _on_resolve(self, event: ResolveEvent) -> None:
+        pending = self._pending.get()
+        if pending is None:
+            pending = []
+            self._pending.set(pending)
+
+        node = ResolutionNode(
+            event.binding, event.start, event.duration, event.cache_hit
+        )
+        # NOTE: children complete before their parent. All nodes completed since this
+        # one started are then its children
+        index = len(pending)
+        while index and pending[index - 1].start >= node.start:
+            index -= 1
+        node.children = pending[index:]
+        del pending[index:]
+
+        if event.nested:
+            pending.append(node)
+            return
+        # Drop nodes left by failed resolutions, if any
+        pending.clear()
+        with self._lock:
+            self.roots.append(node)
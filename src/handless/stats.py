@@ -0,0 +1,412 @@
+"""Resolution statistics of containers collected using hooks."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from handless._utils import get_qualified_name
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from handless._registry import Binding
+    from handless.hooks import (
+        CreateEvent,
+        Hooks,
+        LockWaitEvent,
+        ReleaseEvent,
+        ResolveEvent,
+        ScopeCloseEvent,
+        ScopeLeakEvent,
+        ScopeOpenEvent,
+    )
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+"""Default upper bounds, in seconds, of factory durations histograms buckets"""
+
+
+@dataclass(frozen=True, slots=True)
+class Histogram:
+    """Distribution of durations, in seconds."""
+
+    buckets: tuple[float, ...]
+    """Upper bounds of buckets, an implicit last bucket holds greater values"""
+    counts: tuple[int, ...]
+    """Number of values per bucket, including the last implicit one"""
+    sum: float = 0.0
+    """Sum of all values"""
+
+    @property
+    def count(self) -> int:
+        """Return the total number of values."""
+        return sum(self.counts)
+
+
+@dataclass(frozen=True, slots=True)
+class TypeStats:
+    """Resolution statistics of a single bound type."""
+
+    type_: type[Any]
+    """The bound type"""
+    lifetime: str
+    """Name of the lifetime of the last binding resolved for this type"""
+    resolves: int
+    """Number of times the type has been resolved"""
+    cache_hits: int
+    """Number of resolutions returning an already cached instance"""
+    created: int
+    """Number of instances created by the binding factory"""
+    released: int
+    """Number of context managers exited for instances of this type"""
+    factory_duration: Histogram
+    """Time spent creating instances, excluding dependencies"""
+    lock_wait_duration: Histogram = field(default_factory=lambda: Histogram((), (0,)))
+    """Time spent waiting for concurrent creations of scoped or singleton instances,
+    only contended waits are counted"""
+    max_lock_waiters: int = 0
+    """Maximum number of threads or tasks waited at once for a concurrent creation"""
+
+    @property
+    def cache_misses(self) -> int:
+        """Return the number of resolutions which did not use a cached instance."""
+        return self.resolves - self.cache_hits
+
+
+@dataclass(frozen=True, slots=True)
+class LifetimeStats:
+    """Cache statistics of all bindings sharing the same lifetime."""
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the ratio of resolutions using a cached instance, 0 if none."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScopeStats:
+    """Lifecycle statistics of scopes created from a container."""
+
+    opened: int = 0
+    """Number of scopes created"""
+    closed: int = 0
+    """Number of scopes closed, each scope is only counted on its first close"""
+    leaked: int = 0
+    """Number of scopes garbage collected without being closed"""
+    lifetime: Histogram = field(default_factory=lambda: Histogram((), (0,)))
+    """Time elapsed between scopes creation and their first close"""
+    teardown_duration: Histogram = field(default_factory=lambda: Histogram((), (0,)))
+    """Time spent exiting scopes context managers on their first close"""
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerStats:
+    """Snapshot of a container resolution statistics.
+
+    >>> from handless import Container, Scoped
+    >>> container = Container()
+    >>> container.enable_stats()
+    >>> container.bind(object).to_self(Scoped)
+    >>> with container.create_scope() as scope:
+    ...     _ = scope.resolve(object), scope.resolve(object)
+    >>> stats = container.stats()
+    >>> stats.types[object].resolves, stats.types[object].created
+    (2, 1)
+    >>> stats.lifetimes["Scoped"].hit_ratio
+    0.5
+    """
+
+    types: Mapping[type[Any], TypeStats] = field(default_factory=dict)
+    """Statistics per bound type"""
+    lifetimes: Mapping[str, LifetimeStats] = field(default_factory=dict)
+    """Cache statistics per lifetime name"""
+    open_scopes: int = 0
+    """Number of scopes created from the container, still referenced and not closed
+    yet"""
+    scopes: ScopeStats = field(default_factory=ScopeStats)
+    """Lifecycle statistics of scopes"""
+
+    def to_prometheus(self, prefix: str = "handless") -> str:
+        """Format statistics using Prometheus text exposition format.
+
+        :param prefix: Prefix of all metrics names.
+        :returns: Metrics text, ending with a new line.
+        """
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help_: str) -> str:
+            lines.extend(
+                [f"# HELP {prefix}_{name} {help_}", f"# TYPE {prefix}_{name} {kind}"]
+            )
+            return f"{prefix}_{name}"
+
+        counters = (
+            ("resolves_total", "Number of resolutions per type.", "resolves"),
+            ("cache_hits_total", "Number of cached instances reused.", "cache_hits"),
+            ("instances_created_total", "Number of instances created.", "created"),
+            ("instances_released_total", "Number of instances released.", "released"),
+        )
+        for name, help_, attribute in counters:
+            full_name = metric(name, "counter", help_)
+            lines.extend(
+                f"{full_name}{{{_labels(stats)}}} {getattr(stats, attribute)}"
+                for stats in self.types.values()
+            )
+
+        histograms = (
+            (
+                "factory_duration_seconds",
+                "Time spent creating instances, excluding dependencies.",
+                "factory_duration",
+            ),
+            (
+                "lock_wait_duration_seconds",
+                "Time spent waiting for concurrent creations of instances.",
+                "lock_wait_duration",
+            ),
+        )
+        for name, help_, attribute in histograms:
+            full_name = metric(name, "histogram", help_)
+            for stats in self.types.values():
+                _add_histogram(
+                    lines, full_name, _labels(stats), getattr(stats, attribute)
+                )
+
+        full_name = metric(
+            "lock_waiters_max",
+            "gauge",
+            "Maximum number of concurrent waiters for instances creations.",
+        )
+        lines.extend(
+            f"{full_name}{{{_labels(stats)}}} {stats.max_lock_waiters}"
+            for stats in self.types.values()
+        )
+
+        full_name = metric("open_scopes", "gauge", "Number of open scopes.")
+        lines.append(f"{full_name} {self.open_scopes}")
+
+        scope_counters = (
+            ("scopes_opened_total", "Number of scopes created.", self.scopes.opened),
+            ("scopes_closed_total", "Number of scopes closed.", self.scopes.closed),
+            (
+                "scopes_leaked_total",
+                "Number of scopes garbage collected without being closed.",
+                self.scopes.leaked,
+            ),
+        )
+        for name, help_, value in scope_counters:
+            lines.append(f"{metric(name, 'counter', help_)} {value}")
+
+        scope_histograms = (
+            (
+                "scope_lifetime_seconds",
+                "Time elapsed between scopes creation and closing.",
+                self.scopes.lifetime,
+            ),
+            (
+                "scope_teardown_duration_seconds",
+                "Time spent closing scopes.",
+                self.scopes.teardown_duration,
+            ),
+        )
+        for name, help_, histogram in scope_histograms:
+            _add_histogram(lines, metric(name, "histogram", help_), "", histogram)
+        return "\n".join(lines) + "\n"
+
+
+def _add_histogram(
+    lines: list[str], full_name: str, labels: str, histogram: Histogram
+) -> None:
+    cumulated = 0
+    for bound, count in zip(
+        (*histogram.buckets, "+Inf"), histogram.counts, strict=True
+    ):
+        cumulated += count
+        bucket_labels = f'{labels},le="{bound}"' if labels else f'le="{bound}"'
+        lines.append(f"{full_name}_bucket{{{bucket_labels}}} {cumulated}")
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{full_name}_sum{suffix} {histogram.sum}")
+    lines.append(f"{full_name}_count{suffix} {cumulated}")
+
+
+def _labels(stats: TypeStats) -> str:
+    type_name = get_qualified_name(stats.type_)
+    return f'type="{_escape(type_name)}",lifetime="{_escape(stats.lifetime)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _TypeCounters:
+    __slots__ = (
+        "cache_hits",
+        "created",
+        "durations",
+        "durations_sum",
+        "lifetime",
+        "lock_waits",
+        "lock_waits_sum",
+        "max_lock_waiters",
+        "released",
+        "resolves",
+    )
+
+    def __init__(self, buckets_count: int) -> None:
+        self.lifetime = ""
+        self.resolves = 0
+        self.cache_hits = 0
+        self.created = 0
+        self.released = 0
+        self.durations = [0] * (buckets_count + 1)
+        self.durations_sum = 0.0
+        self.lock_waits = [0] * (buckets_count + 1)
+        self.lock_waits_sum = 0.0
+        self.max_lock_waiters = 0
+
+
+class StatsCollector:
+    """Collect resolution statistics from hooks events.
+
+    Prefer using :meth:`Container.enable_stats` and :meth:`Container.stats` rather than
+    this class directly.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Create a new statistics collector.
+
+        :param buckets: Upper bounds, in seconds, of factory durations histograms.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        self._types: dict[type[Any], _TypeCounters] = {}
+        self._scopes_opened = 0
+        self._scopes_closed = 0
+        self._scopes_leaked = 0
+        self._scope_lifetimes = [0] * (len(self._buckets) + 1)
+        self._scope_lifetimes_sum = 0.0
+        self._scope_teardowns = [0] * (len(self._buckets) + 1)
+        self._scope_teardowns_sum = 0.0
+
+    def register(self, hooks: Hooks) -> None:
+        """Start collecting statistics from given hooks events.
+
+        :param hooks: Hooks to register the collector on.
+        """
+        hooks.on_resolve(self._on_resolve)
+        hooks.on_create(self._on_create)
+        hooks.on_release(self._on_release)
+        hooks.on_lock_wait(self._on_lock_wait)
+        hooks.on_scope_open(self._on_scope_open)
+        hooks.on_scope_close(self._on_scope_close)
+        hooks.on_scope_leak(self._on_scope_leak)
+
+    def snapshot(self, open_scopes: int = 0) -> ContainerStats:
+        """Return statistics collected so far.
+
+        :param open_scopes: Number of currently open scopes to report.
+        :returns: A snapshot of the collected statistics.
+        """
+        types: dict[type[Any], TypeStats] = {}
+        lifetimes: dict[str, LifetimeStats] = {}
+        with self._lock:
+            for type_, counters in self._types.items():
+                types[type_] = stats = TypeStats(
+                    type_=type_,
+                    lifetime=counters.lifetime,
+                    resolves=counters.resolves,
+                    cache_hits=counters.cache_hits,
+                    created=counters.created,
+                    released=counters.released,
+                    factory_duration=Histogram(
+                        self._buckets, tuple(counters.durations), counters.durations_sum
+                    ),
+                    lock_wait_duration=Histogram(
+                        self._buckets,
+                        tuple(counters.lock_waits),
+                        counters.lock_waits_sum,
+                    ),
+                    max_lock_waiters=counters.max_lock_waiters,
+                )
+                if stats.resolves:
+                    previous = lifetimes.get(stats.lifetime, LifetimeStats())
+                    lifetimes[stats.lifetime] = LifetimeStats(
+                        previous.cache_hits + stats.cache_hits,
+                        previous.cache_misses + stats.cache_misses,
+                    )
+            scopes = ScopeStats(
+                opened=self._scopes_opened,
+                closed=self._scopes_closed,
+                leaked=self._scopes_leaked,
+                lifetime=Histogram(
+                    self._buckets,
+                    tuple(self._scope_lifetimes),
+                    self._scope_lifetimes_sum,
+                ),
+                teardown_duration=Histogram(
+                    self._buckets,
+                    tuple(self._scope_teardowns),
+                    self._scope_teardowns_sum,
+                ),
+            )
+        return ContainerStats(
+            types=types, lifetimes=lifetimes, open_scopes=open_scopes, scopes=scopes
+        )
+
+    def _get_counters(self, binding: Binding[Any]) -> _TypeCounters:
+        counters = self._types.get(binding.type_)
+        if counters is None:
+            counters = _TypeCounters(len(self._buckets))
+            self._types[binding.type_] = counters
+        counters.lifetime = type(binding.lifetime).__name__
+        return counters
+
+    def _on_resolve(self, event: ResolveEvent) -> None:
+        with self._lock:
+            counters = self._get_counters(event.binding)
+            counters.resolves += 1
+            counters.cache_hits += event.cache_hit
+
+    def _on_create(self, event: CreateEvent) -> None:
+        bucket = bisect_left(self._buckets, event.duration)
+        with self._lock:
+            counters = self._get_counters(event.binding)
+            counters.created += 1
+            counters.durations[bucket] += 1
+            counters.durations_sum += event.duration
+
+    def _on_release(self, event: ReleaseEvent) -> None:
+        with self._lock:
+            self._get_counters(event.binding).released += 1
+
+    def _on_lock_wait(self, event: LockWaitEvent) -> None:
+        bucket = bisect_left(self._buckets, event.duration)
+        with self._lock:
+            counters = self._get_counters(event.binding)
+            counters.lock_waits[bucket] += 1
+            counters.lock_waits_sum += event.duration
+            counters.max_lock_waiters = max(counters.max_lock_waiters, event.waiters)
+
+    def _on_scope_open(self, event: ScopeOpenEvent) -> None:  # noqa: ARG002
+        with self._lock:
+            self._scopes_opened += 1
+
+    def _on_scope_close(self, event: ScopeCloseEvent) -> None:
+        lifetime_bucket = bisect_left(self._buckets, event.lifetime)
+        teardown_bucket = bisect_left(self._buckets, event.duration)
+        with self._lock:
+            self._scopes_closed += 1
+            self._scope_lifetimes[lifetime_bucket] += 1
+            self._scope_lifetimes_sum += event.lifetime
+            self._scope_teardowns[teardown_bucket] += 1
+            self._scope_teardowns_sum += event.duration
+
+    def _on_scope_leak(self, event: ScopeLeakEvent) -> None:  # noqa: ARG002
+        with self._lock:
+            self._scopes_leaked += 1
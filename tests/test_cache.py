@@ -0,0 +1,78 @@
+import gc
+
+from handless import Binding, Container, Scope, Scoped, Singleton, Transient
+from handless.lifetimes import LifetimeContext
+from tests.helpers import FakeService
+
+
+def create_binding() -> Binding[FakeService]:
+    return Binding(FakeService, FakeService, managed=True, lifetime=Transient())
+
+
+def test_live_bindings_have_distinct_slots() -> None:
+    bindings = [create_binding() for _ in range(10)]
+
+    assert len({binding.slot for binding in bindings}) == len(bindings)
+
+
+def test_slots_of_garbage_collected_bindings_are_reused() -> None:
+    binding = create_binding()
+    slot = binding.slot
+
+    del binding
+    gc.collect()
+
+    assert create_binding().slot == slot
+
+
+def test_scope_local_binding_reusing_a_slot_does_not_get_stale_instance(
+    container: Container,
+) -> None:
+    with container.create_scope() as scope:
+        scope.bind_local(FakeService).to_self(Singleton)
+        previous = scope.resolve(FakeService)
+    del scope
+    gc.collect()
+
+    with container.create_scope() as scope:
+        scope.bind_local(FakeService).to_self(Singleton)
+
+        assert scope.resolve(FakeService) is not previous
+
+
+def test_scope_local_singletons_are_cached_and_closed_by_their_scope(
+    container: Container,
+) -> None:
+    with container.create_scope() as scope:
+        scope.bind_local(FakeService).to_self(Singleton)
+        resolved = scope.resolve(FakeService)
+
+        assert scope.resolve(FakeService) is resolved
+
+    assert resolved.exited
+
+
+def test_cached_instance_is_not_shared_with_other_binding(scope: Scope) -> None:
+    scope.bind_local(FakeService).to_self(Singleton)
+
+    resolved = scope.resolve(FakeService)
+
+    with scope.container.create_scope() as other_scope:
+        other_scope.bind_local(FakeService).to_self(Singleton)
+        assert other_scope.resolve(FakeService) is not resolved
+
+
+def test_cached_instances_are_indexed_by_container_hierarchy_slots(
+    container: Container, scope: Scope
+) -> None:
+    other = Container()
+    for index in range(100):
+        other.bind(type(f"Type{index}", (), {})).to_self()
+    container.bind(FakeService).to_self(Scoped)
+    child = container.create_child()
+    child.bind(str).to_value("handless")
+
+    scope.resolve(FakeService)
+
+    assert len(LifetimeContext.get(scope)._cache) == 1  # noqa: SLF001
+    assert child.lookup(str).slot == 1
@@ -0,0 +1,158 @@
+import pytest
+
+from handless import Container, Scoped, Singleton
+from handless.exceptions import BindingNotFoundError
+from tests.helpers import FakeService, FakeServiceWithParams
+
+
+@pytest.fixture
+def child(container: Container) -> Container:
+    return container.create_child()
+
+
+def test_child_falls_back_to_parent_bindings(
+    container: Container, child: Container
+) -> None:
+    container.bind(FakeService).to_self()
+
+    assert child.lookup(FakeService) is container.lookup(FakeService)
+
+
+def test_child_bindings_take_precedence_over_parent_ones(
+    container: Container, child: Container
+) -> None:
+    container.bind(str).to_value("parent")
+    container.override(str).to_value("parent override")
+    child.bind(str).to_value("child")
+
+    with child.resolve(str) as value:
+        assert value == "child"
+
+
+def test_child_bindings_are_not_visible_from_parent(
+    container: Container, child: Container
+) -> None:
+    child.bind(FakeService).to_self()
+
+    with pytest.raises(BindingNotFoundError):
+        container.lookup(FakeService)
+
+
+def test_child_resolves_dependencies_from_parent_and_own_bindings(
+    container: Container, child: Container
+) -> None:
+    container.bind(FakeServiceWithParams).to_self()
+    container.bind(int).to_value(42)
+    child.bind(str).to_value("foo")
+
+    with child.resolve(FakeServiceWithParams) as service:
+        assert isinstance(service, FakeServiceWithParams)
+
+
+def test_children_share_parent_singletons_by_default(container: Container) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    child1 = container.create_child()
+    child2 = container.create_child()
+
+    with (
+        child1.resolve(FakeService) as service1,
+        child2.resolve(FakeService) as service2,
+    ):
+        assert service1 is service2
+
+    child1.close()
+    assert not service1.exited
+    container.close()
+    assert service1.exited
+
+
+class Tenant:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def test_shared_singletons_dependencies_are_resolved_from_parent(
+    container: Container,
+) -> None:
+    container.bind(str).to_value("parent")
+    container.bind(Tenant).to_self(Singleton)
+    child1 = container.create_child()
+    child1.bind(str).to_value("tenant1")
+    child2 = container.create_child()
+    child2.bind(str).to_value("tenant2")
+
+    with (
+        child1.resolve(Tenant) as tenant1,
+        child2.resolve(Tenant) as tenant2,
+        container.resolve(Tenant) as tenant,
+    ):
+        assert tenant1 is tenant2 is tenant
+        assert tenant.name == "parent"
+
+
+def test_shared_singletons_dependencies_are_exited_with_parent(
+    container: Container, child: Container
+) -> None:
+    services: list[FakeService] = []
+
+    def create_tenant(service: FakeService) -> Tenant:
+        services.append(service)
+        return Tenant("parent")
+
+    container.bind(FakeService).to_self()
+    container.bind(Tenant).to_factory(create_tenant, Singleton)
+
+    with child.resolve(Tenant):
+        pass
+    child.close()
+
+    assert not services[0].exited
+    container.close()
+    assert services[0].exited
+
+
+def test_children_cache_parent_singletons_when_not_shared(container: Container) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    child1 = container.create_child(share_singletons=False)
+    child2 = container.create_child(share_singletons=False)
+
+    with (
+        child1.resolve(FakeService) as service1,
+        child2.resolve(FakeService) as service2,
+    ):
+        assert service1 is not service2
+
+    child1.close()
+    assert service1.exited
+    assert not service2.exited
+    child2.close()
+
+
+def test_child_caches_its_own_singletons(child: Container) -> None:
+    child.bind(FakeService).to_self(Singleton)
+
+    with child.resolve(FakeService) as service:
+        pass
+
+    assert child.get_owner(child.lookup(FakeService)) is child
+    child.close()
+    assert service.exited
+
+
+def test_grandchild_uses_closest_ancestor_not_sharing_singletons(
+    container: Container,
+) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    child = container.create_child(share_singletons=False)
+    grandchild = child.create_child()
+
+    assert grandchild.get_owner(container.lookup(FakeService)) is child
+
+
+def test_child_scopes_cache_scoped_bindings_from_parent(
+    container: Container, child: Container
+) -> None:
+    container.bind(FakeService).to_self(Scoped)
+
+    with child.create_scope() as scope:
+        assert scope.resolve(FakeService) is scope.resolve(FakeService)
@@ -0,0 +1,155 @@
+import pytest
+
+from handless import Container, Scope, Singleton
+from handless.exceptions import ResolutionError
+
+
+class Settings:
+    pass
+
+
+class Clock:
+    pass
+
+
+DEFAULT_SETTINGS = Settings()
+DEFAULT_CLOCK = Clock()
+
+
+class Service:
+    def __init__(self, settings: Settings = DEFAULT_SETTINGS, retries: int = 3) -> None:
+        self.settings = settings
+        self.retries = retries
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(Service).to_self()
+    return container
+
+
+def test_unbound_dependencies_use_parameters_default_values(scope: Scope) -> None:
+    service = scope.resolve(Service)
+
+    assert service.settings is DEFAULT_SETTINGS
+    assert service.retries == 3  # noqa: PLR2004
+
+
+def test_bound_dependencies_take_precedence_over_default_values(
+    container: Container, scope: Scope
+) -> None:
+    settings = Settings()
+    container.bind(Settings).to_value(settings)
+
+    service = scope.resolve(Service)
+
+    assert service.settings is settings
+
+
+def test_unbound_dependencies_without_default_values_raise_error(
+    container: Container, scope: Scope
+) -> None:
+    def create_service(settings: Settings, retries: int = 3) -> Service:
+        return Service(settings, retries)
+
+    container.override(Service).to_factory(create_service)
+
+    with pytest.raises(ResolutionError):
+        scope.resolve(Service)
+
+
+def test_binding_dependency_later_updates_resolution(
+    container: Container, scope: Scope
+) -> None:
+    assert scope.resolve(Service).settings is DEFAULT_SETTINGS
+
+    container.bind(Settings).to_self(Singleton)
+
+    assert isinstance(scope.resolve(Service).settings, Settings)
+
+
+def test_closing_container_forgets_overridden_dependencies(
+    container: Container,
+) -> None:
+    container.override(Settings).to_self()
+    with container.resolve(Service) as service:
+        assert isinstance(service.settings, Settings)
+
+    container.close()
+
+    with container.resolve(Service) as service:
+        assert service.settings is DEFAULT_SETTINGS
+
+
+def test_child_containers_use_dependencies_bound_later_in_parent(
+    container: Container,
+) -> None:
+    child = container.create_child()
+    with child.resolve(Service) as service:
+        assert service.settings is DEFAULT_SETTINGS
+
+    container.bind(Settings).to_self()
+
+    with child.resolve(Service) as service:
+        assert isinstance(service.settings, Settings)
+
+
+def test_scope_local_bindings_are_used_for_defaulted_dependencies(
+    container: Container,
+) -> None:
+    settings = Settings()
+    with container.create_scope() as scope, container.create_scope() as other:
+        scope.bind_local(Settings).to_value(settings)
+
+        assert scope.resolve(Service).settings is settings
+        assert other.resolve(Service).settings is DEFAULT_SETTINGS
+
+
+def test_parameters_without_annotation_use_their_default_value(
+    container: Container, scope: Scope
+) -> None:
+    def create_service(settings: Settings = DEFAULT_SETTINGS, retries=5) -> Service:  # type: ignore[no-untyped-def]  # noqa: ANN001
+        return Service(settings, retries)
+
+    container.override(Service).to_factory(create_service)
+
+    assert scope.resolve(Service).retries == 5  # noqa: PLR2004
+
+
+def test_omitted_positional_only_parameters_omit_next_ones(
+    container: Container, scope: Scope
+) -> None:
+    clock = Clock()
+
+    def create_service(
+        settings: Settings = DEFAULT_SETTINGS, clock: Clock = DEFAULT_CLOCK, /
+    ) -> Service:
+        service = Service(settings)
+        service.clock = clock  # type: ignore[attr-defined]
+        return service
+
+    container.bind(Clock).to_value(clock)
+    container.override(Service).to_factory(create_service)
+
+    service = scope.resolve(Service)
+
+    assert service.settings is DEFAULT_SETTINGS
+    assert service.clock is DEFAULT_CLOCK  # type: ignore[attr-defined]
+
+
+@pytest.mark.anyio
+async def test_aresolve_unbound_dependencies_use_default_values(
+    acontainer: Container,
+) -> None:
+    async def create_service(settings: Settings = DEFAULT_SETTINGS) -> Service:
+        return Service(settings)
+
+    acontainer.bind(Service).to_factory(create_service)
+
+    async with acontainer.aresolve(Service) as service:
+        assert service.settings is DEFAULT_SETTINGS
+
+    acontainer.bind(Settings).to_self()
+
+    async with acontainer.aresolve(Service) as service:
+        assert isinstance(service.settings, Settings)
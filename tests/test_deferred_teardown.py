@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import threading
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+
+import pytest
+
+from handless import Container, Scoped
+
+
+class SlowExit(AbstractContextManager["SlowExit"]):
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.exit_thread: threading.Thread | None = None
+
+    def __exit__(self, *args: object) -> None:
+        self.release.wait(1)
+        self.exit_thread = threading.current_thread()
+
+
+class AsyncSlowExit(AbstractAsyncContextManager["AsyncSlowExit"]):
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.exited = False
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.release.wait()
+        self.exited = True
+
+
+class FailingExit(AbstractContextManager["FailingExit"]):
+    def __exit__(self, *args: object) -> None:
+        raise RuntimeError
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(SlowExit).to_self(Scoped)
+    container.bind(FailingExit).to_self(Scoped)
+    return container
+
+
+def test_deferred_close_exits_context_managers_in_background(
+    container: Container,
+) -> None:
+    scope = container.create_scope()
+    resource = scope.resolve(SlowExit)
+
+    scope.close(defer=True)
+
+    assert scope.closed
+    assert resource.exit_thread is None
+    other = scope.resolve(SlowExit)
+    assert other is not resource
+    other.release.set()
+    resource.release.set()
+    container.close()
+    assert resource.exit_thread is not None
+    assert resource.exit_thread is not threading.current_thread()
+
+
+def test_deferred_close_exits_in_caller_when_too_many_are_pending(
+    container: Container,
+) -> None:
+    container.limit_deferred_teardowns(0)
+    with container.create_scope() as scope:
+        resource = scope.resolve(SlowExit)
+        resource.release.set()
+
+        scope.close(defer=True)
+
+        assert resource.exit_thread is threading.current_thread()
+
+
+def test_deferred_close_errors_are_logged(
+    container: Container, caplog: pytest.LogCaptureFixture
+) -> None:
+    scope = container.create_scope()
+    scope.resolve(FailingExit)
+
+    with caplog.at_level(logging.ERROR):
+        scope.close(defer=True)
+        container.close()
+
+    assert "Failed exiting context manager" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_deferred_aclose_exits_context_managers_in_a_task(
+    acontainer: Container,
+) -> None:
+    acontainer.bind(AsyncSlowExit).to_self(Scoped)
+    scope = acontainer.create_scope()
+    resource = await scope.aresolve(AsyncSlowExit)
+
+    await scope.aclose(defer=True)
+
+    assert scope.closed
+    assert not resource.exited
+    resource.release.set()
+    await acontainer.aclose()
+    assert resource.exited
+
+
+@pytest.mark.anyio
+async def test_deferred_aclose_exits_in_caller_when_too_many_are_pending(
+    acontainer: Container,
+) -> None:
+    acontainer.bind(AsyncSlowExit).to_self(Scoped)
+    acontainer.limit_deferred_teardowns(0)
+    async with acontainer.create_scope() as scope:
+        resource = await scope.aresolve(AsyncSlowExit)
+        resource.release.set()
+
+        await scope.aclose(defer=True)
+
+        assert resource.exited
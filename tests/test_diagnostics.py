@@ -0,0 +1,181 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+
+from handless import Container, Scope, Scoped
+from handless.diagnostics import SlowCallEvent, SlowCallWarning
+
+
+class Leaf:
+    pass
+
+
+class Intermediate:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+class Root:
+    def __init__(self, intermediate: Intermediate) -> None:
+        self.intermediate = intermediate
+
+
+def create_slow_leaf() -> Leaf:
+    time.sleep(0.02)
+    return Leaf()
+
+
+@contextmanager
+def open_slow_leaf() -> Iterator[Leaf]:
+    time.sleep(0.02)
+    yield Leaf()
+    time.sleep(0.02)
+
+
+@pytest.fixture
+def events(container: Container) -> list[SlowCallEvent]:
+    events: list[SlowCallEvent] = []
+    container.detect_slow_calls(0.01, callback=events.append)
+    container.bind(Intermediate).to_self()
+    container.bind(Root).to_self()
+    return events
+
+
+def summary(events: list[SlowCallEvent]) -> list[tuple[str, tuple[type, ...]]]:
+    return [(event.operation, event.resolution_chain) for event in events]
+
+
+def test_detect_slow_factory_with_resolution_chain(
+    container: Container, scope: Scope, events: list[SlowCallEvent]
+) -> None:
+    container.bind(Leaf).to_factory(create_slow_leaf)
+
+    scope.resolve(Root)
+
+    # Dependencies do not count in their dependents factories durations
+    assert summary(events) == [("factory", (Root, Intermediate, Leaf))]
+    assert events[0].binding.type_ is Leaf
+    assert events[0].duration > events[0].threshold == 0.01  # noqa: PLR2004
+
+
+def test_detect_slow_factory_excludes_manually_resolved_dependencies(
+    container: Container, scope: Scope
+) -> None:
+    events: list[SlowCallEvent] = []
+    container.detect_slow_calls(0.01, callback=events.append)
+    container.bind(Leaf).to_factory(create_slow_leaf)
+    container.bind(Intermediate).to_factory(
+        lambda scope: Intermediate(scope.resolve(Leaf))
+    )
+
+    scope.resolve(Intermediate)
+
+    assert summary(events) == [("factory", (Intermediate, Leaf))]
+
+
+def test_detect_slow_context_manager_enter_and_exit(
+    container: Container, events: list[SlowCallEvent]
+) -> None:
+    container.bind(Leaf).to_factory(open_slow_leaf, Scoped)
+
+    with container.create_scope() as scope:
+        scope.resolve(Intermediate)
+
+    assert summary(events) == [("enter", (Intermediate, Leaf)), ("exit", (Leaf,))]
+
+
+def test_per_type_threshold_overrides_default(
+    container: Container, scope: Scope
+) -> None:
+    events: list[SlowCallEvent] = []
+    container.detect_slow_calls(0.01, thresholds={Leaf: 1.0}, callback=events.append)
+    container.bind(Leaf).to_factory(create_slow_leaf)
+
+    scope.resolve(Leaf)
+
+    assert not events
+
+
+def test_detect_slow_calls_warns_by_default(container: Container, scope: Scope) -> None:
+    container.detect_slow_calls(0.01)
+    container.bind(Leaf).to_factory(create_slow_leaf)
+
+    with pytest.warns(SlowCallWarning, match="Calling factory of .*Leaf"):
+        scope.resolve(Leaf)
+
+
+def test_disable_slow_calls_detection(
+    container: Container, scope: Scope, events: list[SlowCallEvent]
+) -> None:
+    container.bind(Leaf).to_factory(create_slow_leaf)
+    container.detect_slow_calls(None)
+
+    scope.resolve(Leaf)
+
+    assert not events
+    assert container.hooks.slow_calls is None
+
+
+def test_failing_callback_does_not_interrupt_resolution(
+    container: Container, scope: Scope
+) -> None:
+    def fail(event: SlowCallEvent) -> None:  # noqa: ARG001
+        raise RuntimeError
+
+    container.detect_slow_calls(0.01, callback=fail)
+    container.bind(Leaf).to_factory(create_slow_leaf)
+
+    assert isinstance(scope.resolve(Leaf), Leaf)
+
+
+@pytest.mark.anyio
+async def test_detect_slow_async_calls(acontainer: Container) -> None:
+    events: list[SlowCallEvent] = []
+    acontainer.detect_slow_calls(0.01, callback=events.append)
+
+    @asynccontextmanager
+    async def open_leaf() -> AsyncIterator[Leaf]:
+        await asyncio.sleep(0.02)
+        yield Leaf()
+
+    async def create_intermediate(leaf: Leaf) -> Intermediate:
+        await asyncio.sleep(0.02)
+        return Intermediate(leaf)
+
+    acontainer.bind(Leaf).to_factory(open_leaf, Scoped)
+    acontainer.bind(Intermediate).to_factory(create_intermediate)
+
+    async with acontainer.create_scope() as scope:
+        await scope.aresolve(Intermediate)
+
+    assert summary(events) == [
+        ("enter", (Intermediate, Leaf)),
+        ("factory", (Intermediate,)),
+    ]
+
+
+def test_trace_scopes_captures_creation_stack(container: Container) -> None:
+    container.trace_scopes()
+    traced = container.create_scope()
+    container.trace_scopes(enabled=False)
+    untraced = container.create_scope()
+
+    assert traced.creation_stack is not None
+    assert traced.creation_stack[-1].name == (
+        "test_trace_scopes_captures_creation_stack"
+    )
+    assert untraced.creation_stack is None
+    assert set(container.scopes) == {traced, untraced}
+
+
+def test_leaked_scope_warning_includes_creation_stack(container: Container) -> None:
+    container.trace_scopes()
+    container.bind(Leaf).to_factory(open_slow_leaf, Scoped)
+    scope = container.create_scope()
+    scope.resolve(Leaf)
+
+    with pytest.warns(UserWarning, match="created at:\n(.|\n)*in test_leaked_scope"):
+        del scope
@@ -0,0 +1,74 @@
+from handless import Container, Scoped, Singleton
+from tests.helpers import FakeService, FakeServiceWithParams, IFakeService
+
+
+def test_diff_containers_with_same_bindings_is_empty() -> None:
+    container = Container()
+    container.bind(FakeService).to_self(Singleton)
+    other = Container()
+    other.bind(FakeService).to_self(Singleton)
+
+    diff = container.diff(other)
+
+    assert not diff
+    assert diff.added == diff.removed == diff.changed == {}
+
+
+def test_diff_reports_added_removed_and_changed_bindings() -> None:
+    container = Container()
+    container.bind(FakeService).to_self(Singleton)
+    container.bind(str).to_value("foo")
+    other = Container()
+    other.bind(FakeService).to_self(Scoped)
+    other.bind(FakeServiceWithParams).to_self()
+
+    diff = container.diff(other)
+
+    assert diff
+    assert diff.added == {FakeServiceWithParams: other.lookup(FakeServiceWithParams)}
+    assert diff.removed == {str: container.lookup(str)}
+    assert diff.changed == {
+        FakeService: (container.lookup(FakeService), other.lookup(FakeService))
+    }
+
+
+def test_diff_compares_overridden_bindings() -> None:
+    container = Container()
+    container.bind(FakeService).to_self()
+    other = Container()
+    other.bind(FakeService).to_self()
+    other.override(FakeService).to_self(Singleton)
+
+    diff = container.diff(other)
+
+    assert diff.changed == {
+        FakeService: (container.lookup(FakeService), other.lookup(FakeService))
+    }
+
+
+def test_diff_compares_bound_values() -> None:
+    container = Container()
+    container.bind(str).to_value("prod-db")
+    other = Container()
+    other.bind(str).to_value("test-db")
+
+    diff = container.diff(other)
+
+    assert diff.changed == {str: (container.lookup(str), other.lookup(str))}
+    assert not container.diff(container.fork())
+
+
+def test_diff_compares_aliases_targets() -> None:
+    container = Container()
+    container.bind(IFakeService).to(FakeService)  # type: ignore[type-abstract]
+    other = Container()
+    other.bind(IFakeService).to(FakeServiceWithParams)  # type: ignore[type-abstract]
+
+    diff = container.diff(other)
+
+    assert diff.changed == {
+        IFakeService: (
+            container.lookup(IFakeService),  # type: ignore[type-abstract]
+            other.lookup(IFakeService),  # type: ignore[type-abstract]
+        )
+    }
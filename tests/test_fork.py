@@ -0,0 +1,86 @@
+import pytest
+
+from handless import Container, Singleton
+from handless.exceptions import BindingNotFoundError
+from tests.helpers import FakeService
+
+
+def test_fork_shares_parent_bindings(container: Container) -> None:
+    container.bind(FakeService).to_self()
+
+    fork = container.fork()
+
+    assert fork.lookup(FakeService) is container.lookup(FakeService)
+
+
+def test_fork_shares_parent_overrides(container: Container) -> None:
+    container.bind(str).to_value("foo")
+    container.override(str).to_value("bar")
+
+    fork = container.fork()
+
+    with fork.resolve(str) as value:
+        assert value == "bar"
+
+
+def test_fork_bindings_are_not_visible_from_parent(container: Container) -> None:
+    fork = container.fork()
+
+    fork.bind(FakeService).to_self()
+
+    with pytest.raises(BindingNotFoundError):
+        container.lookup(FakeService)
+
+
+def test_parent_bindings_added_after_fork_are_not_visible_from_fork(
+    container: Container,
+) -> None:
+    fork = container.fork()
+
+    container.bind(FakeService).to_self()
+
+    with pytest.raises(BindingNotFoundError):
+        fork.lookup(FakeService)
+
+
+def test_fork_overrides_do_not_affect_parent(container: Container) -> None:
+    container.bind(str).to_value("foo")
+    fork = container.fork()
+
+    fork.override(str).to_value("bar")
+
+    with container.resolve(str) as value:
+        assert value == "foo"
+
+
+def test_fork_does_not_share_singletons_by_default(container: Container) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    with container.resolve(FakeService) as service:
+        pass
+
+    with container.fork() as fork, fork.resolve(FakeService) as forked_service:
+        assert forked_service is not service
+
+
+def test_fork_shares_already_created_singletons(container: Container) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    with container.resolve(FakeService) as service:
+        pass
+
+    fork = container.fork(share_singletons=True)
+
+    with fork.resolve(FakeService) as forked_service:
+        assert forked_service is service
+
+
+def test_closing_fork_does_not_exit_shared_singletons(container: Container) -> None:
+    container.bind(FakeService).to_self(Singleton)
+    with container.resolve(FakeService) as service:
+        pass
+    fork = container.fork(share_singletons=True)
+
+    fork.close()
+
+    assert not service.exited
+    container.close()
+    assert service.exited
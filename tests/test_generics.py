@@ -0,0 +1,83 @@
+from typing import Generic, TypeVar
+
+import pytest
+
+from handless import Container, Scope, Scoped, Singleton
+from handless.exceptions import ResolutionError
+
+T = TypeVar("T")
+
+
+class User:
+    pass
+
+
+class Order:
+    pass
+
+
+class Serializer(Generic[T]):
+    pass
+
+
+class Cache(Generic[T]):
+    pass
+
+
+class Repository(Generic[T]):
+    def __init__(self, serializer: Serializer[T]) -> None:
+        self.serializer = serializer
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(Serializer).to_self(Scoped)
+    container.bind(Repository).to_self()
+    return container
+
+
+def test_resolve_specialization_of_generic_binding(scope: Scope) -> None:
+    repository = scope.resolve(Repository[User])
+
+    assert isinstance(repository, Repository)
+    assert repository.serializer is scope.resolve(Serializer[User])
+    assert repository.serializer is not scope.resolve(Serializer[Order])  # type: ignore[comparison-overlap]
+
+
+def test_resolve_specialization_of_parametrized_generic_binding(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Cache[T]).to_factory(Cache, Singleton)  # type: ignore[valid-type]
+
+    cache = scope.resolve(Cache[User])
+
+    assert scope.resolve(Cache[User]) is cache
+    assert scope.resolve(Cache[Order]) is not cache  # type: ignore[comparison-overlap]
+
+
+def test_specialized_bindings_are_cached(container: Container) -> None:
+    binding = container.lookup(Repository[User])
+
+    assert container.lookup(Repository[User]) is binding
+    assert binding.dependencies[0].type_ == Serializer[User]
+
+
+def test_rebinding_generic_type_evicts_specializations(
+    container: Container, scope: Scope
+) -> None:
+    container.override(Repository).to_self(Singleton)
+    binding = container.lookup(Repository[User])
+    repository = scope.resolve(Repository[User])
+
+    container.override(Repository).to_self(Singleton)
+
+    assert container.lookup(Repository[User]) is not binding
+    assert scope.resolve(Repository[User]) is not repository
+
+
+def test_resolve_specialization_of_unbound_generic_raises_error(scope: Scope) -> None:
+    class Unbound(Generic[T]):
+        pass
+
+    with pytest.raises(ResolutionError):
+        scope.resolve(Unbound[User])
@@ -0,0 +1,271 @@
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+
+from handless import Container, Scope, Scoped, Singleton
+from handless.hooks import (
+    CacheHitEvent,
+    CreateEvent,
+    LockWaitEvent,
+    ReleaseEvent,
+    ResolveEvent,
+    ScopeCloseEvent,
+    ScopeLeakEvent,
+    ScopeOpenEvent,
+)
+
+
+class Leaf:
+    pass
+
+
+class Root:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+@contextmanager
+def open_leaf() -> Iterator[Leaf]:
+    yield Leaf()
+
+
+@contextmanager
+def open_root(leaf: Leaf) -> Iterator[Root]:
+    yield Root(leaf)
+
+
+@asynccontextmanager
+async def aopen_leaf() -> AsyncIterator[Leaf]:
+    yield Leaf()
+
+
+def test_on_resolve_reports_resolved_bindings_and_cache_hits(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Scoped)
+    container.bind(Root).to_self()
+    events: list[ResolveEvent] = []
+    container.hooks.on_resolve(events.append)
+
+    scope.resolve(Root)
+    scope.resolve(Leaf)
+
+    assert [(e.binding.type_, e.scope, e.cache_hit) for e in events] == [
+        (Leaf, scope, False),
+        (Root, scope, False),
+        (Leaf, scope, True),
+    ]
+    assert events[1].duration >= events[0].duration > 0
+
+
+def test_on_create_reports_factory_calls(container: Container, scope: Scope) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Root).to_self()
+    events: list[CreateEvent] = []
+    container.hooks.on_create(events.append)
+
+    scope.resolve(Root)
+    scope.resolve(Root)
+
+    assert [(e.binding.type_, e.scope) for e in events] == [
+        (Leaf, scope),
+        (Root, scope),
+        (Root, scope),
+    ]
+    assert all(e.duration > 0 for e in events)
+
+
+def test_on_cache_hit_reports_reused_instances(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    events: list[CacheHitEvent] = []
+    container.hooks.on_cache_hit(events.append)
+
+    scope.resolve(Leaf)
+    with container.create_scope() as other:
+        other.resolve(Leaf)
+
+    assert [(e.binding.type_, e.scope) for e in events] == [(Leaf, other)]
+
+
+def test_on_release_reports_exited_context_managers(container: Container) -> None:
+    container.bind(Leaf).to_factory(open_leaf, Scoped)
+    events: list[ReleaseEvent] = []
+    container.hooks.on_release(events.append)
+
+    with container.create_scope() as scope:
+        scope.resolve(Leaf)
+        assert not events
+
+    assert [(e.binding.type_, e.owner) for e in events] == [(Leaf, scope)]
+
+
+def test_on_release_reports_evicted_context_managers(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self()
+    container.bind(Root).to_factory(open_root, Singleton)
+    events: list[ReleaseEvent] = []
+    container.hooks.on_release(events.append)
+    binding = container.lookup(Root)
+    scope.resolve(Root)
+
+    container.override(Leaf).to_value(Leaf())
+
+    assert [(e.binding, e.owner) for e in events] == [(binding, container)]
+
+
+def test_removed_hooks_are_not_called(container: Container, scope: Scope) -> None:
+    container.bind(Leaf).to_self()
+    events: list[object] = []
+    container.hooks.on_resolve(events.append)
+    container.hooks.on_create(events.append)
+
+    container.hooks.remove(events.append)
+    scope.resolve(Leaf)
+
+    assert not events
+    assert not container.hooks.enabled
+
+
+def test_failing_hooks_do_not_interrupt_resolution(
+    container: Container, scope: Scope, caplog: pytest.LogCaptureFixture
+) -> None:
+    container.bind(Leaf).to_self()
+
+    @container.hooks.on_resolve
+    def fail(event: ResolveEvent) -> None:  # noqa: ARG001
+        raise RuntimeError
+
+    assert isinstance(scope.resolve(Leaf), Leaf)
+    assert "failed handling" in caplog.text
+
+
+def test_hooks_are_not_inherited_by_child_containers(container: Container) -> None:
+    container.bind(Leaf).to_self()
+    events: list[ResolveEvent] = []
+    container.hooks.on_resolve(events.append)
+
+    with container.create_child().resolve(Leaf):
+        pass
+
+    assert not events
+
+
+def test_on_lock_wait_reports_contended_creations(container: Container) -> None:
+    started, release = threading.Event(), threading.Event()
+
+    def create_leaf() -> Leaf:
+        started.set()
+        release.wait()
+        return Leaf()
+
+    container.bind(Leaf).to_factory(create_leaf, Singleton)
+    events: list[LockWaitEvent] = []
+    container.hooks.on_lock_wait(events.append)
+
+    def resolve() -> None:
+        with container.create_scope() as scope:
+            scope.resolve(Leaf)
+
+    threads = [threading.Thread(target=resolve) for _ in range(3)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert [e.binding.type_ for e in events] == [Leaf, Leaf]
+    assert max(e.waiters for e in events) == 2  # noqa: PLR2004
+    assert all(e.duration > 0 for e in events)
+
+
+def test_on_lock_wait_ignores_uncontended_creations(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    events: list[LockWaitEvent] = []
+    container.hooks.on_lock_wait(events.append)
+
+    scope.resolve(Leaf)
+
+    assert not events
+
+
+@pytest.mark.anyio
+async def test_on_lock_wait_reports_contended_async_creations(
+    acontainer: Container, ascope: Scope
+) -> None:
+    async def create_leaf() -> Leaf:
+        await asyncio.sleep(0.01)
+        return Leaf()
+
+    acontainer.bind(Leaf).to_factory(create_leaf, Scoped)
+    events: list[LockWaitEvent] = []
+    acontainer.hooks.on_lock_wait(events.append)
+
+    await asyncio.gather(*(ascope.aresolve(Leaf) for _ in range(3)))
+
+    assert sorted(e.waiters for e in events) == [1, 2]
+
+
+def test_scope_hooks_report_opened_and_closed_scopes(container: Container) -> None:
+    container.bind(Leaf).to_factory(open_leaf, Scoped)
+    opened: list[ScopeOpenEvent] = []
+    closed: list[ScopeCloseEvent] = []
+    container.hooks.on_scope_open(opened.append)
+    container.hooks.on_scope_close(closed.append)
+
+    scope = container.create_scope()
+    scope.resolve(Leaf)
+    scope.close()
+    scope.close()
+
+    assert [e.scope for e in opened] == [scope]
+    assert [e.scope for e in closed] == [scope]
+    assert closed[0].lifetime >= closed[0].duration > 0
+    assert scope.closed
+
+
+def test_scope_hooks_report_leaked_scopes(container: Container) -> None:
+    container.bind(Leaf).to_factory(open_leaf, Scoped)
+    events: list[ScopeLeakEvent] = []
+    container.hooks.on_scope_leak(events.append)
+    container.create_scope().close()
+    scope = container.create_scope()
+    scope.resolve(Leaf)
+
+    with pytest.warns(UserWarning, match="pending resources"):
+        del scope
+    container.hooks.flush()
+
+    assert [(e.container, e.pending_resources) for e in events] == [(container, 1)]
+    assert events[0].creation_stack is None
+
+
+@pytest.mark.anyio
+async def test_async_hooks(acontainer: Container, ascope: Scope) -> None:
+    acontainer.bind(Leaf).to_factory(aopen_leaf, Scoped)
+    acontainer.bind(Root).to_self()
+    resolved: list[ResolveEvent] = []
+    created: list[CreateEvent] = []
+    acontainer.hooks.on_resolve(resolved.append)
+    acontainer.hooks.on_create(created.append)
+
+    await ascope.aresolve(Root)
+    await ascope.aresolve(Leaf)
+
+    assert [(e.binding.type_, e.cache_hit) for e in resolved] == [
+        (Leaf, False),
+        (Root, False),
+        (Leaf, True),
+    ]
+    assert [e.binding.type_ for e in created] == [Leaf, Root]
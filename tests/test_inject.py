@@ -0,0 +1,136 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from handless import Container, Scoped
+from handless._utils import get_non_variadic_params
+from handless.exceptions import ResolutionError
+
+
+class Message:
+    pass
+
+
+class Session:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+class Repository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+
+@contextmanager
+def open_session() -> Iterator[Session]:
+    session = Session()
+    yield session
+    session.closed = True
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(Session).to_factory(open_session, Scoped)
+    container.bind(Repository).to_self()
+    return container
+
+
+def test_inject_resolves_parameters_not_given_by_caller(container: Container) -> None:
+    message = Message()
+
+    @container.inject
+    def handle(message: Message, repository: Repository) -> Repository:
+        assert isinstance(message, Message)
+        assert not repository.session.closed
+        return repository
+
+    repository = handle(message)
+
+    assert isinstance(repository, Repository)
+    assert handle(message=message).session is not repository.session
+    assert repository.session.closed
+
+
+def test_inject_uses_parameters_given_by_caller(container: Container) -> None:
+    repository = Repository(Session())
+
+    @container.inject
+    def handle(repository: Repository) -> Repository:
+        return repository
+
+    assert handle(repository) is repository
+    assert handle(repository=repository) is repository
+
+
+def test_nested_injected_calls_share_the_same_scope(container: Container) -> None:
+    @container.inject
+    def get_session(session: Session) -> Session:
+        return session
+
+    @container.inject
+    def handle(session: Session) -> tuple[Session, Session]:
+        return session, get_session()
+
+    session, nested_session = handle()
+
+    assert nested_session is session
+
+
+def test_inject_uses_default_values_of_unbound_parameters(container: Container) -> None:
+    @container.inject
+    def handle(repository: Repository, retries: int = 3) -> int:
+        assert isinstance(repository, Repository)
+        return retries
+
+    assert handle() == 3  # noqa: PLR2004
+
+    container.bind(int).to_value(5)
+
+    assert handle() == 5  # noqa: PLR2004
+
+
+def test_inject_unbound_parameters_without_default_values_raise_error(
+    container: Container,
+) -> None:
+    @container.inject
+    def handle(message: Message) -> Message:
+        return message
+
+    with pytest.raises(ResolutionError):
+        handle()
+
+
+def test_inject_inspects_function_signature_once(container: Container) -> None:
+    with patch(
+        "handless.injection.get_non_variadic_params", wraps=get_non_variadic_params
+    ) as inspect:
+
+        @container.inject
+        def handle(repository: Repository) -> Repository:
+            return repository
+
+        handle()
+        handle()
+
+    inspect.assert_called_once()
+    assert handle.__name__ == "handle"
+
+
+@pytest.mark.anyio
+async def test_inject_async_function(acontainer: Container) -> None:
+    async def create_message() -> Message:
+        return Message()
+
+    acontainer.bind(Message).to_factory(create_message)
+    acontainer.bind(Session).to_factory(open_session, Scoped)
+
+    @acontainer.inject
+    async def handle(message: Message, session: Session) -> Session:
+        assert isinstance(message, Message)
+        return session
+
+    session = await handle()
+
+    assert session.closed
@@ -0,0 +1,163 @@
+from contextlib import AbstractContextManager
+
+from handless import Container, Scope, Scoped, Singleton
+
+
+class Leaf:
+    pass
+
+
+class Service(AbstractContextManager["Service"]):
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+        self.exited = False
+
+    def __exit__(self, *args: object) -> None:
+        self.exited = True
+
+
+class Intermediate:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+class Root:
+    def __init__(self, intermediate: Intermediate) -> None:
+        self.intermediate = intermediate
+
+
+class Unrelated:
+    pass
+
+
+def test_override_evicts_singletons_depending_on_overridden_type(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Service).to_self(Singleton)
+    service = scope.resolve(Service)
+
+    container.override(Leaf).to_value(leaf := Leaf())
+
+    assert service.exited
+    assert scope.resolve(Service).leaf is leaf
+
+
+def test_override_keeps_unrelated_singletons(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Unrelated).to_self(Singleton)
+    unrelated = scope.resolve(Unrelated)
+
+    container.override(Leaf).to_value(Leaf())
+
+    assert scope.resolve(Unrelated) is unrelated
+
+
+def test_override_evicts_transitive_dependents(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Intermediate).to_self()
+    container.bind(Root).to_self(Singleton)
+    scope.resolve(Root)
+
+    container.override(Leaf).to_value(leaf := Leaf())
+
+    assert scope.resolve(Root).intermediate.leaf is leaf
+
+
+def test_override_evicts_dependents_resolved_through_an_alias(
+    container: Container, scope: Scope
+) -> None:
+    class SubLeaf(Leaf):
+        pass
+
+    container.bind(SubLeaf).to_self(Singleton)
+    container.bind(Leaf).to(SubLeaf)
+    container.bind(Service).to_self(Singleton)
+    scope.resolve(Service)
+
+    container.override(SubLeaf).to_value(leaf := SubLeaf())
+
+    assert scope.resolve(Service).leaf is leaf
+
+
+def test_override_evicts_scoped_dependents_of_opened_scopes(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Service).to_self(Scoped)
+    service = scope.resolve(Service)
+
+    container.override(Leaf).to_value(leaf := Leaf())
+
+    assert service.exited
+    assert scope.resolve(Service).leaf is leaf
+
+
+def test_bind_local_evicts_scoped_dependents_of_the_scope(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self()
+    container.bind(Service).to_self(Scoped)
+    scope.resolve(Service)
+
+    scope.bind_local(Leaf).to_value(leaf := Leaf())
+
+    assert scope.resolve(Service).leaf is leaf
+
+
+def test_override_exits_overridden_singleton(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Leaf).to_self()
+    container.bind(Service).to_self(Singleton)
+    service = scope.resolve(Service)
+
+    container.override(Service).to_value(Service(Leaf()))
+
+    assert service.exited
+
+
+def test_fork_override_evicts_shared_singletons_dependents(
+    container: Container,
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Service).to_self(Singleton)
+    with container.resolve(Service) as service:
+        pass
+    fork = container.fork(share_singletons=True)
+
+    fork.override(Leaf).to_value(leaf := Leaf())
+
+    with fork.resolve(Service) as forked, container.resolve(Service) as unchanged:
+        assert forked.leaf is leaf
+        assert unchanged is service
+    # NOTE: shared singletons are still owned by the original container
+    assert not service.exited
+    fork.close()
+
+
+def test_parent_override_evicts_children_cached_dependents(
+    container: Container,
+) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.bind(Service).to_self(Singleton)
+    container.bind(Root).to_self(Scoped)
+    container.bind(Intermediate).to_self(Singleton)
+    child = container.create_child(share_singletons=False)
+    shared_child = container.create_child()
+    scope = shared_child.create_scope()
+    with child.resolve(Service):
+        pass
+    scope.resolve(Root)
+
+    container.override(Leaf).to_value(leaf := Leaf())
+
+    with child.resolve(Service) as service:
+        assert service.leaf is leaf
+    assert scope.resolve(Root).intermediate.leaf is leaf
+    scope.close()
+    child.close()
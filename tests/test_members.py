@@ -0,0 +1,116 @@
+import asyncio
+import time
+from collections.abc import Sequence
+
+import pytest
+
+from handless import Container, Scope, Singleton, Transient
+from handless.exceptions import ResolutionError
+
+
+class Plugin:
+    pass
+
+
+class AuthPlugin(Plugin):
+    pass
+
+
+class CachePlugin(Plugin):
+    pass
+
+
+class Pipeline:
+    def __init__(self, plugins: list[Plugin]) -> None:
+        self.plugins = plugins
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind_member(Plugin).to_factory(AuthPlugin, Singleton)
+    container.bind_member(Plugin).to_factory(CachePlugin, Transient)
+    return container
+
+
+@pytest.mark.parametrize("collection", [list[Plugin], Sequence[Plugin]])
+def test_resolve_collection_of_members(
+    scope: Scope, collection: type[Sequence[Plugin]]
+) -> None:
+    plugins = scope.resolve(collection)
+
+    assert [type(plugin) for plugin in plugins] == [AuthPlugin, CachePlugin]
+
+
+def test_inject_collection_of_members(container: Container, scope: Scope) -> None:
+    container.bind(Pipeline).to_self()
+
+    pipeline = scope.resolve(Pipeline)
+
+    assert [type(plugin) for plugin in pipeline.plugins] == [AuthPlugin, CachePlugin]
+
+
+def test_collection_members_honour_their_lifetime(scope: Scope) -> None:
+    first = scope.resolve(list[Plugin])
+    second = scope.resolve(list[Plugin])
+
+    assert first is not second
+    assert first[0] is second[0]
+    assert first[1] is not second[1]
+
+
+def test_collection_binding_is_cached_until_members_change(
+    container: Container, scope: Scope
+) -> None:
+    binding = container.lookup(list[Plugin])
+    container.bind(Pipeline).to_self(Singleton)
+    pipeline = scope.resolve(Pipeline)
+
+    assert container.lookup(list[Plugin]) is binding
+
+    container.bind_member(Plugin).to_self()
+
+    assert container.lookup(list[Plugin]) is not binding
+    assert scope.resolve(Pipeline) is not pipeline
+    assert len(scope.resolve(Pipeline).plugins) == 3  # noqa: PLR2004
+
+
+def test_child_collections_hold_parent_members_first(container: Container) -> None:
+    child = container.create_child()
+    child.bind_member(Plugin).to_self()
+
+    with (
+        child.resolve(list[Plugin]) as plugins,
+        container.resolve(list[Plugin]) as parent_plugins,
+    ):
+        assert [type(plugin) for plugin in plugins] == [AuthPlugin, CachePlugin, Plugin]
+        assert plugins[0] is parent_plugins[0]
+    child.close()
+
+
+def test_bound_collection_takes_precedence_over_members(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(list[Plugin]).to_value([])
+
+    assert scope.resolve(list[Plugin]) == []
+
+
+def test_resolve_collection_without_members_raises_error(scope: Scope) -> None:
+    with pytest.raises(ResolutionError):
+        scope.resolve(list[Pipeline])
+
+
+@pytest.mark.anyio
+async def test_aresolve_collection_members_concurrently(acontainer: Container) -> None:
+    async def create_plugin() -> Plugin:
+        await asyncio.sleep(0.05)
+        return Plugin()
+
+    for _ in range(3):
+        acontainer.bind_member(Plugin).to_factory(create_plugin)
+
+    start = time.perf_counter()
+    async with acontainer.aresolve(list[Plugin]) as plugins:
+        assert len(plugins) == 3  # noqa: PLR2004
+
+    assert time.perf_counter() - start < 0.09  # noqa: PLR2004
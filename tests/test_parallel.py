@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from contextlib import AbstractContextManager
+
+import pytest
+
+from handless import Container, Scope, Scoped
+from handless.exceptions import ResolutionError
+
+
+class Shared:
+    pass
+
+
+class Slow:
+    def __init__(self, shared: Shared) -> None:
+        self.shared = shared
+        self.thread = threading.current_thread()
+        time.sleep(0.05)
+
+
+class OtherSlow(Slow):
+    pass
+
+
+class AnotherSlow(Slow):
+    pass
+
+
+class Root:
+    def __init__(self, slow: Slow, other: OtherSlow, another: AnotherSlow) -> None:
+        self.dependencies = (slow, other, another)
+
+
+class SlowExit(AbstractContextManager["SlowExit"]):
+    def __init__(self, exits: list[object]) -> None:
+        self.exits = exits
+
+    def __exit__(self, *args: object) -> None:
+        time.sleep(0.05)
+        self.exits.append(self)
+
+
+class OtherSlowExit(SlowExit):
+    pass
+
+
+class DependentSlowExit(SlowExit):
+    def __init__(self, exits: list[object], dependency: SlowExit) -> None:
+        super().__init__(exits)
+        self.dependency = dependency
+
+
+class FailingExit(AbstractContextManager["FailingExit"]):
+    def __exit__(self, *args: object) -> None:
+        raise RuntimeError
+
+
+class Failing:
+    def __init__(self) -> None:
+        raise RuntimeError
+
+
+class RootWithFailure:
+    def __init__(self, slow: Slow, failing: Failing) -> None:
+        pass
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(Shared).to_self(Scoped)
+    container.bind(Slow).to_self()
+    container.bind(OtherSlow).to_self()
+    container.bind(AnotherSlow).to_self()
+    container.bind(Root).to_self()
+    return container
+
+
+def test_resolve_dependencies_in_parallel(container: Container, scope: Scope) -> None:
+    container.parallelize(max_workers=2)
+
+    start = time.perf_counter()
+    root = scope.resolve(Root)
+
+    assert time.perf_counter() - start < 0.14  # noqa: PLR2004
+    assert len({dep.thread for dep in root.dependencies}) > 1
+    assert len({id(dep.shared) for dep in root.dependencies}) == 1
+
+
+def test_nested_parallel_resolutions_do_not_wait_for_busy_pool(
+    container: Container, scope: Scope
+) -> None:
+    class Parent:
+        def __init__(self, root: Root, other: Root) -> None:
+            self.roots = (root, other)
+
+    container.bind(Parent).to_self()
+    container.parallelize(max_workers=1)
+
+    parent = scope.resolve(Parent)
+
+    assert parent.roots[0] is not parent.roots[1]
+
+
+def test_parallel_resolution_errors_are_raised(
+    container: Container, scope: Scope
+) -> None:
+    container.bind(Failing).to_self()
+    container.bind(RootWithFailure).to_self()
+    container.parallelize()
+
+    with pytest.raises(ResolutionError) as exc_info:
+        scope.resolve(RootWithFailure)
+
+    assert exc_info.value.__cause__ is not None
+
+
+def test_disable_parallel_resolution(container: Container, scope: Scope) -> None:
+    container.parallelize()
+    container.parallelize(resolution=False)
+
+    root = scope.resolve(Root)
+
+    assert {dep.thread for dep in root.dependencies} == {threading.current_thread()}
+
+
+def test_close_shuts_down_thread_pool(container: Container) -> None:
+    container.parallelize()
+    with container.resolve(Root):
+        pool = container._thread_pool  # noqa: SLF001
+
+    container.close()
+
+    assert pool is not None
+    assert container._thread_pool is None  # noqa: SLF001
+    with container.resolve(Root) as root:
+        assert isinstance(root, Root)
+
+
+@pytest.fixture
+def exits(container: Container) -> list[object]:
+    exits: list[object] = []
+    container.bind(list[object]).to_value(exits)
+    container.bind(SlowExit).to_self(Scoped)
+    container.bind(OtherSlowExit).to_self(Scoped)
+    container.bind(DependentSlowExit).to_self(Scoped)
+    container.parallelize(teardown=True, max_workers=2)
+    return exits
+
+
+def test_exit_independent_context_managers_in_parallel(
+    container: Container, exits: list[object]
+) -> None:
+    with container.create_scope() as scope:
+        scope.resolve(SlowExit)
+        scope.resolve(OtherSlowExit)
+        start = time.perf_counter()
+
+    assert time.perf_counter() - start < 0.09  # noqa: PLR2004
+    assert len(exits) == 2  # noqa: PLR2004
+
+
+def test_parallel_teardown_exits_dependents_first(
+    container: Container, exits: list[object]
+) -> None:
+    with container.create_scope() as scope:
+        dependent = scope.resolve(DependentSlowExit)
+        other = scope.resolve(OtherSlowExit)
+
+    assert exits.index(dependent) < exits.index(dependent.dependency)
+    assert other in exits
+
+
+def test_parallel_teardown_logs_exit_errors(
+    container: Container, exits: list[object], caplog: pytest.LogCaptureFixture
+) -> None:
+    container.bind(FailingExit).to_self(Scoped)
+
+    with caplog.at_level(logging.ERROR), container.create_scope() as scope:
+        scope.resolve(FailingExit)
+        slow = scope.resolve(SlowExit)
+
+    assert exits == [slow]
+    assert "Failed exiting context manager" in caplog.text
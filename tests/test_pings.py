@@ -0,0 +1,118 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from handless import Container, Scoped, Singleton
+from tests.helpers import FakeService
+
+pytestmark = pytest.mark.anyio
+
+
+class Database:
+    pass
+
+
+class Cache:
+    pass
+
+
+async def slow_ping(_: object) -> None:
+    await asyncio.sleep(0.05)
+
+
+def slow_sync_ping(_: object) -> None:
+    time.sleep(0.05)
+
+
+@pytest.fixture
+def acontainer(acontainer: Container) -> Container:
+    acontainer.bind(Database).to_self(Singleton)
+    acontainer.bind(Cache).to_self(Singleton)
+    return acontainer
+
+
+async def create_singletons(container: Container) -> None:
+    async with container.aresolve(Database, Cache):
+        pass
+
+
+async def test_pings_run_concurrently(acontainer: Container) -> None:
+    acontainer.add_ping(Database, slow_ping)
+    acontainer.add_ping(Database, slow_sync_ping)
+    acontainer.add_ping(Cache, slow_ping)
+    await create_singletons(acontainer)
+
+    start = time.perf_counter()
+    report = await acontainer.aping()
+
+    assert time.perf_counter() - start < 0.09  # noqa: PLR2004
+    assert report.healthy
+    assert [result.type_ for result in report.results] == [Database, Database, Cache]
+
+
+async def test_pings_skip_singletons_not_created_yet(acontainer: Container) -> None:
+    factory = Mock(return_value=FakeService())
+    acontainer.bind(FakeService).to_factory(factory, Singleton)
+    ping = Mock()
+    acontainer.add_ping(FakeService, ping)
+
+    report = await acontainer.aping()
+
+    assert report.skipped == (FakeService,)
+    assert not report.results
+    factory.assert_not_called()
+    ping.assert_not_called()
+
+
+async def test_pings_skip_types_not_bound_as_singletons(acontainer: Container) -> None:
+    acontainer.bind(FakeService).to_self(Scoped)
+    acontainer.add_ping(FakeService, Mock())
+    async with acontainer.aresolve(FakeService):
+        pass
+
+    report = await acontainer.aping()
+
+    assert report.skipped == (FakeService,)
+
+
+async def test_failing_pings_are_reported(acontainer: Container) -> None:
+    error = RuntimeError()
+    acontainer.add_ping(Database, Mock(side_effect=error))
+    acontainer.add_ping(Cache, lambda _: False)
+    await create_singletons(acontainer)
+
+    report = await acontainer.aping()
+
+    assert not report.healthy
+    assert [(result.healthy, result.error) for result in report.results] == [
+        (False, error),
+        (False, None),
+    ]
+
+
+async def test_pings_exceeding_their_timeout_are_reported(
+    acontainer: Container,
+) -> None:
+    acontainer.add_ping(Database, slow_ping, timeout=0.01)
+    await create_singletons(acontainer)
+
+    report = await acontainer.aping()
+
+    assert not report.healthy
+    assert isinstance(report.results[0].error, TimeoutError)
+
+
+async def test_ping_results_are_cached_for_their_ttl(acontainer: Container) -> None:
+    ping = Mock()
+    acontainer.add_ping(Database, ping, ttl=60)
+    await create_singletons(acontainer)
+
+    first = await acontainer.aping()
+    second = await acontainer.aping()
+
+    ping.assert_called_once()
+    assert not first.results[0].cached
+    assert second.results[0].cached
+    assert second.healthy
@@ -0,0 +1,144 @@
+import json
+import time
+
+import pytest
+
+from handless import Container, Scope, Scoped
+from handless.exceptions import ResolutionError
+from handless.profiling import ResolutionNode
+
+
+class Leaf:
+    pass
+
+
+class Other:
+    pass
+
+
+class Intermediate:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+class Root:
+    def __init__(self, intermediate: Intermediate, other: Other) -> None:
+        self.intermediate = intermediate
+        self.other = other
+
+
+class Failing:
+    def __init__(self, leaf: Leaf) -> None:  # noqa: ARG002
+        raise RuntimeError
+
+
+def create_slow_leaf() -> Leaf:
+    time.sleep(0.01)
+    return Leaf()
+
+
+@pytest.fixture
+def container(container: Container) -> Container:
+    container.bind(Leaf).to_factory(create_slow_leaf, Scoped)
+    container.bind(Other).to_self()
+    container.bind(Intermediate).to_self()
+    container.bind(Root).to_self()
+    return container
+
+
+def tree(node: ResolutionNode) -> tuple[str, list[object]]:
+    return node.binding.type_.__name__, [tree(child) for child in node.children]
+
+
+def test_profile_records_resolution_trees(container: Container, scope: Scope) -> None:
+    with container.profile() as profiler:
+        scope.resolve(Root)
+        scope.resolve(Leaf)
+
+    assert [tree(root) for root in profiler.roots] == [
+        ("Root", [("Intermediate", [("Leaf", [])]), ("Other", [])]),
+        ("Leaf", []),
+    ]
+    root, cached_leaf = profiler.roots
+    leaf = root.children[0].children[0]
+    assert not leaf.cache_hit
+    assert cached_leaf.cache_hit
+    assert root.duration >= leaf.duration >= 0.01  # noqa: PLR2004
+    assert root.self_time < leaf.self_time
+
+
+def test_profile_stops_recording_on_exit(container: Container, scope: Scope) -> None:
+    with container.profile() as profiler:
+        pass
+
+    scope.resolve(Root)
+
+    assert not profiler.roots
+    assert not container.hooks.enabled
+
+
+def test_profile_ignores_failed_resolutions(container: Container, scope: Scope) -> None:
+    container.bind(Failing).to_self()
+
+    with container.profile() as profiler:
+        with pytest.raises(ResolutionError):
+            scope.resolve(Failing)
+        scope.resolve(Other)
+
+    assert [tree(root) for root in profiler.roots] == [("Other", [])]
+
+
+def test_profile_to_collapsed(container: Container, scope: Scope) -> None:
+    with container.profile() as profiler:
+        scope.resolve(Root)
+        scope.resolve(Root)
+
+    lines = dict(line.rsplit(" ", 1) for line in profiler.to_collapsed().splitlines())
+
+    prefix = "tests.test_profiling."
+    root = f"{prefix}Root"
+    leaf_path = f"{root};{prefix}Intermediate;{prefix}Leaf"
+    assert set(lines) == {
+        root,
+        f"{root};{prefix}Intermediate",
+        leaf_path,
+        f"{root};{prefix}Other",
+    }
+    assert int(lines[leaf_path]) >= 10_000_000  # noqa: PLR2004
+
+
+def test_profile_to_speedscope(container: Container, scope: Scope) -> None:
+    with container.profile() as profiler:
+        scope.resolve(Intermediate)
+        scope.resolve(Other)
+
+    document = json.loads(profiler.to_speedscope())
+
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    events = [
+        (event["type"], frames[event["frame"]].rsplit(".", 1)[1])
+        for event in document["profiles"][0]["events"]
+    ]
+    assert events == [
+        ("O", "Intermediate"),
+        ("O", "Leaf"),
+        ("C", "Leaf"),
+        ("C", "Intermediate"),
+        ("O", "Other"),
+        ("C", "Other"),
+    ]
+    times = [event["at"] for event in document["profiles"][0]["events"]]
+    assert times == sorted(times)
+    assert times[0] == 0
+    assert document["profiles"][0]["endValue"] == times[-1]
+
+
+@pytest.mark.anyio
+async def test_profile_async_resolutions(acontainer: Container, ascope: Scope) -> None:
+    acontainer.bind(Leaf).to_self()
+    acontainer.bind(Intermediate).to_self()
+
+    with acontainer.profile() as profiler:
+        await ascope.aresolve(Intermediate)
+
+    assert [tree(root) for root in profiler.roots] == [("Intermediate", [("Leaf", [])])]
@@ -104,6 +104,13 @@ class TestBindFactory:
             FakeService, FakeService, managed=managed, lifetime=expected_lifetime
         )
 
+    def test_bind_blocking_factory(self, container: Container) -> None:
+        container.bind(FakeService).to_factory(FakeService, blocking=True)
+
+        assert container.lookup(FakeService) == Binding(
+            FakeService, FakeService, managed=True, lifetime=Transient(), blocking=True
+        )
+
     def test_bind_factory_with_generator_function_wraps_it_as_a_context_manager(
         self, container: Container
     ) -> None:
@@ -350,3 +357,80 @@ def test_override_bound_type(container: Container) -> None:
 
     binding = container.lookup(FakeService)
     assert are_functions_equal(binding.factory, lambda: expected)
+
+
+class TestBindingFingerprint:
+    def test_equal_bindings_share_fingerprint_and_hash(self) -> None:
+        binding = Binding(
+            FakeServiceWithParams,
+            FakeServiceWithParams,
+            managed=True,
+            lifetime=Singleton(),
+            dependencies=(Dependency("foo", str), Dependency("bar", int)),
+        )
+        other = Binding(
+            FakeServiceWithParams,
+            FakeServiceWithParams,
+            managed=True,
+            lifetime=Singleton(),
+            dependencies=(Dependency("foo", str), Dependency("bar", int)),
+        )
+
+        assert binding.fingerprint == other.fingerprint
+        assert hash(binding) == hash(other)
+        assert len({binding, other}) == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            pytest.param(
+                Binding(FakeService, FakeService, managed=True, lifetime=Singleton()),
+                id="Lifetime",
+            ),
+            pytest.param(
+                Binding(FakeService, FakeService, managed=False, lifetime=Transient()),
+                id="Managed",
+            ),
+            pytest.param(
+                Binding(
+                    FakeService, create_fake_service, managed=True, lifetime=Transient()
+                ),
+                id="Factory",
+            ),
+            pytest.param(
+                Binding(
+                    FakeService,
+                    FakeService,
+                    managed=True,
+                    lifetime=Transient(),
+                    dependencies=(Dependency("foo", str),),
+                ),
+                id="Dependencies",
+            ),
+            pytest.param(
+                Binding(
+                    FakeService,
+                    FakeService,
+                    managed=True,
+                    lifetime=Transient(),
+                    blocking=True,
+                ),
+                id="Blocking",
+            ),
+        ],
+    )
+    def test_different_bindings_are_not_equal(self, other: Binding[Any]) -> None:
+        binding = Binding(FakeService, FakeService, managed=True, lifetime=Transient())
+
+        assert binding != other
+
+    def test_binding_with_unhashable_default_is_hashable(self) -> None:
+        binding = Binding(
+            FakeService,
+            FakeService,
+            managed=True,
+            lifetime=Transient(),
+            dependencies=(Dependency("foo", list, default=[]),),
+        )
+
+        assert hash(binding) == hash(binding)
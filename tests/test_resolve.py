@@ -6,7 +6,7 @@ from unittest.mock import Mock, call
 
 import pytest
 
-from handless import Container, Scope, Scoped, Singleton, Transient
+from handless import Container, Prototype, Scope, Scoped, Singleton, Transient
 from handless.exceptions import ResolutionError
 from handless.lifetimes import Lifetime
 from tests.helpers import FakeService, FakeServiceWithParams
@@ -362,6 +362,64 @@ class TestResolveTypeBoundToScopeRegistration:
         assert received is not resolved
 
 
+class Rules:
+    def __init__(self) -> None:
+        self.rules: list[str] = []
+        self.cloned_from: Rules | None = None
+
+    def __clone__(self) -> "Rules":
+        clone = Rules()
+        clone.rules = self.rules.copy()
+        clone.cloned_from = self
+        return clone
+
+
+class TestResolveTypeBoundToPrototypeRegistration:
+    @pytest.fixture
+    def factory(self) -> Mock:
+        return Mock(wraps=lambda _: FakeService())
+
+    @pytest.fixture
+    def resolved(
+        self, container: Container, scope: Scope, factory: Mock
+    ) -> FakeService:
+        container.bind(FakeService).to_factory(factory, Prototype())
+
+        return scope.resolve(FakeService)
+
+    def test_calls_registration_factory_once_per_container_and_returns_copies(
+        self, resolved: FakeService, container: Container, scope: Scope, factory: Mock
+    ) -> None:
+        received = scope.resolve(FakeService)
+        with container.create_scope() as scope2:
+            other = scope2.resolve(FakeService)
+
+        assert len({id(resolved), id(received), id(other)}) == 3  # noqa: PLR2004
+        assert all(isinstance(obj, FakeService) for obj in (received, other))
+        factory.assert_called_once_with(_=scope)
+
+    def test_resolve_uses_clone_method_if_any(self, scope: Scope) -> None:
+        scope.container.bind(Rules).to_self(Prototype)
+
+        first = scope.resolve(Rules)
+        first.rules.append("rule")
+        second = scope.resolve(Rules)
+
+        assert first.cloned_from is second.cloned_from is not None
+        assert second.rules == []
+
+    def test_release_container_exit_prototype_context_manager_only(
+        self, container: Container, resolved: FakeService
+    ) -> None:
+        exited = Mock()
+        container.hooks.on_release(exited)
+
+        container.close()
+
+        exited.assert_called_once()
+        assert not resolved.exited
+
+
 class TestOverrideTypes:
     @pytest.fixture
     def factory(self, container: Container) -> Mock:
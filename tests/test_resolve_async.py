@@ -1,10 +1,15 @@
 import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import TypedDict, cast
 from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 
-from handless import Container, Scope, Scoped, Singleton, Transient
+from handless import Container, Prototype, Scope, Scoped, Singleton, Transient
 from handless.exceptions import ResolutionError
 from handless.lifetimes import Lifetime
 from tests.helpers import AsyncFakeService, FakeService, FakeServiceWithParams
@@ -388,6 +393,26 @@ class TestResolveTypeBoundToScopeRegistration:
         assert received is not resolved
 
 
+class TestResolveTypeBoundToPrototypeRegistration:
+    @pytest.fixture(params=[Mock, AsyncMock])
+    def factory(self, request: pytest.FixtureRequest) -> Mock:
+        AnyMock = cast("type[Mock | AsyncMock]", request.param)  # noqa: N806
+        return AnyMock(wraps=lambda _: AsyncFakeService())
+
+    async def test_calls_registration_factory_once_per_container_and_returns_copies(
+        self, acontainer: Container, ascope: Scope, factory: Mock
+    ) -> None:
+        acontainer.bind(AsyncFakeService).to_factory(factory, Prototype())
+
+        resolved = await ascope.aresolve(AsyncFakeService)
+        async with acontainer.create_scope() as scope2:
+            received = await scope2.aresolve(AsyncFakeService)
+
+        assert received is not resolved
+        assert isinstance(received, AsyncFakeService)
+        factory.assert_called_once_with(_=ascope)
+
+
 class TestContainerCloseWithScopes:
     async def test_container_close_closes_referenced_scopes(
         self, acontainer: Container
@@ -427,3 +452,192 @@ class TestContainerCloseWithScopes:
         await acontainer.aclose()
 
         assert service.exited
+
+    async def test_container_close_closes_scoped_async_resources(
+        self, acontainer: Container
+    ) -> None:
+        acontainer.bind(AsyncFakeService).to_self(Scoped)
+        scopes = [acontainer.create_scope() for _ in range(2)]
+        services = [await scope.aresolve(AsyncFakeService) for scope in scopes]
+
+        await acontainer.aclose()
+
+        assert all(service.exited for service in services)
+        assert all(scope.closed for scope in scopes)
+
+
+class SlowAsyncExit:
+    def __init__(self, duration: float) -> None:
+        self.duration = duration
+        self.exited = False
+
+    async def __aenter__(self) -> "SlowAsyncExit":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await asyncio.sleep(self.duration)
+        self.exited = True
+
+
+class FailingAsyncExit:
+    async def __aenter__(self) -> "FailingAsyncExit":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        raise RuntimeError
+
+
+class TestContainerShutdown:
+    async def test_shutdown_closes_scopes_concurrently_then_singletons(
+        self, acontainer: Container
+    ) -> None:
+        acontainer.bind(SlowAsyncExit).to_factory(lambda: SlowAsyncExit(0.05), Scoped)
+        acontainer.bind(AsyncFakeService).to_self(Singleton)
+        scopes = [acontainer.create_scope() for _ in range(3)]
+        resources = [await scope.aresolve(SlowAsyncExit) for scope in scopes]
+        singleton = await scopes[0].aresolve(AsyncFakeService)
+
+        report = await acontainer.ashutdown(timeout=1)
+
+        assert report.completed
+        assert report.duration < 0.14  # noqa: PLR2004
+        assert all(resource.exited for resource in resources)
+        assert all(scope.closed for scope in scopes)
+        assert singleton.exited
+
+    async def test_shutdown_reports_resources_exceeding_their_timeout(
+        self, acontainer: Container, ascope: Scope
+    ) -> None:
+        acontainer.bind(SlowAsyncExit).to_factory(lambda: SlowAsyncExit(10), Scoped)
+        acontainer.bind(AsyncFakeService).to_self(Scoped)
+        service = await ascope.aresolve(AsyncFakeService)
+        await ascope.aresolve(SlowAsyncExit)
+
+        report = await acontainer.ashutdown(resource_timeout=0.01)
+
+        assert report.timed_out == (acontainer.lookup(SlowAsyncExit),)
+        assert not report.pending
+        assert service.exited
+
+    async def test_shutdown_reports_resources_not_closed_before_deadline(
+        self, acontainer: Container, ascope: Scope
+    ) -> None:
+        acontainer.bind(SlowAsyncExit).to_factory(lambda: SlowAsyncExit(10), Scoped)
+        acontainer.bind(AsyncFakeService).to_self(Scoped)
+        service = await ascope.aresolve(AsyncFakeService)
+        await ascope.aresolve(SlowAsyncExit)
+
+        report = await acontainer.ashutdown(timeout=0.01)
+
+        assert report.timed_out == (acontainer.lookup(SlowAsyncExit),)
+        assert report.pending == (acontainer.lookup(AsyncFakeService),)
+        assert not service.exited
+        assert report.duration < 1
+
+    async def test_shutdown_reports_failed_resources(
+        self, acontainer: Container, ascope: Scope
+    ) -> None:
+        acontainer.bind(FailingAsyncExit).to_self(Scoped)
+        await ascope.aresolve(FailingAsyncExit)
+
+        report = await acontainer.ashutdown()
+
+        assert [binding for binding, _ in report.failed] == [
+            acontainer.lookup(FailingAsyncExit)
+        ]
+        assert isinstance(report.failed[0][1], RuntimeError)
+        assert not report.completed
+
+
+class TestResolveBlockingBinding:
+    async def test_blocking_factory_does_not_block_event_loop(
+        self, acontainer: Container, ascope: Scope
+    ) -> None:
+        threads: list[threading.Thread] = []
+        created = asyncio.Event()
+
+        def create_service() -> FakeService:
+            threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return FakeService()
+
+        acontainer.bind(FakeService).to_factory(create_service, blocking=True)
+        ticks = 0
+
+        async def resolve() -> FakeService:
+            try:
+                return await ascope.aresolve(FakeService)
+            finally:
+                created.set()
+
+        async def tick() -> None:
+            nonlocal ticks
+            while not created.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        resolved, _ = await asyncio.gather(resolve(), tick())
+
+        assert isinstance(resolved, FakeService)
+        assert threads != [threading.current_thread()]
+        assert ticks > 1
+
+    async def test_blocking_context_manager_is_entered_and_exited_on_executor(
+        self, acontainer: Container
+    ) -> None:
+        threads: list[str] = []
+
+        @contextmanager
+        def open_service() -> Iterator[FakeService]:
+            threads.append(threading.current_thread().name)
+            yield FakeService()
+            threads.append(threading.current_thread().name)
+
+        acontainer.bind(FakeService).to_factory(open_service, blocking=True)
+        with ThreadPoolExecutor(thread_name_prefix="blocking") as executor:
+            acontainer.use_executor(executor)
+            async with acontainer.create_scope() as scope:
+                await scope.aresolve(FakeService)
+
+        assert len(threads) == 2  # noqa: PLR2004
+        assert all(name.startswith("blocking") for name in threads)
+
+    async def test_blocking_factory_can_resolve_from_scope(
+        self, acontainer: Container, ascope: Scope
+    ) -> None:
+        resolved_values: list[str] = []
+
+        def create_service(scope: Scope) -> FakeServiceWithParams:
+            resolved_values.append(scope.resolve(str))
+            return FakeServiceWithParams(resolved_values[-1], 42)
+
+        acontainer.bind(str).to_value("handless")
+        acontainer.bind(FakeServiceWithParams).to_factory(create_service, blocking=True)
+
+        resolved = await ascope.aresolve(FakeServiceWithParams)
+
+        assert isinstance(resolved, FakeServiceWithParams)
+        assert resolved_values == ["handless"]
+
+    async def test_sync_close_exits_blocking_context_manager(
+        self, acontainer: Container
+    ) -> None:
+        acontainer.bind(FakeService).to_self(Scoped, blocking=True)
+        scope = acontainer.create_scope()
+        service = await scope.aresolve(FakeService)
+
+        scope.close()
+
+        assert service.exited
+
+    async def test_blocking_context_manager_returning_itself_is_entered_once(
+        self, acontainer: Container
+    ) -> None:
+        acontainer.bind(FakeService).to_self(Scoped, blocking=True)
+
+        async with acontainer.create_scope() as scope:
+            service = await scope.aresolve(FakeService)
+
+        assert service.entered
+        assert not service.reentered
+        assert service.exited
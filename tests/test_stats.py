@@ -0,0 +1,217 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from handless import Container, Scope, Scoped, Singleton, Transient
+from handless.stats import (
+    ContainerStats,
+    Histogram,
+    LifetimeStats,
+    ScopeStats,
+    TypeStats,
+)
+
+
+class Leaf:
+    pass
+
+
+class Root:
+    def __init__(self, leaf: Leaf) -> None:
+        self.leaf = leaf
+
+
+@contextmanager
+def open_leaf() -> Iterator[Leaf]:
+    yield Leaf()
+
+
+def test_stats_are_empty_when_not_enabled(container: Container, scope: Scope) -> None:
+    container.bind(Leaf).to_self()
+    scope.resolve(Leaf)
+
+    assert container.stats() == ContainerStats(open_scopes=1)
+    assert not container.hooks.enabled
+
+
+def test_stats_count_resolutions_per_type(container: Container) -> None:
+    container.enable_stats()
+    container.bind(Leaf).to_factory(open_leaf, Scoped)
+    container.bind(Root).to_self(Transient)
+
+    with container.create_scope() as scope:
+        scope.resolve(Root)
+        scope.resolve(Root)
+
+    stats = container.stats()
+    root, leaf = stats.types[Root], stats.types[Leaf]
+    assert (root.resolves, root.cache_misses, root.created) == (2, 2, 2)
+    assert (leaf.resolves, leaf.cache_hits, leaf.created, leaf.released) == (2, 1, 1, 1)
+    assert stats.lifetimes == {
+        "Scoped": LifetimeStats(cache_hits=1, cache_misses=1),
+        "Transient": LifetimeStats(cache_hits=0, cache_misses=2),
+    }
+
+
+def test_stats_factory_duration_histogram(container: Container, scope: Scope) -> None:
+    container.enable_stats(buckets=(1e-9, 60))
+    container.bind(Leaf).to_self()
+
+    scope.resolve(Leaf)
+    scope.resolve(Leaf)
+
+    histogram = container.stats().types[Leaf].factory_duration
+    assert histogram.buckets == (1e-9, 60)
+    assert (histogram.counts, histogram.count) == ((0, 2, 0), 2)
+    assert histogram.sum > 0
+
+
+def test_stats_count_open_scopes(container: Container) -> None:
+    scope = container.create_scope()
+
+    assert container.stats().open_scopes == 1
+
+    del scope
+    assert container.stats().open_scopes == 0
+
+
+def test_stats_do_not_count_closed_scopes_as_open(container: Container) -> None:
+    with container.create_scope() as scope:
+        assert container.stats().open_scopes == 1
+
+    assert container.stats().open_scopes == 0
+    assert scope.closed
+
+
+def test_enable_stats_twice_has_no_effect(container: Container, scope: Scope) -> None:
+    container.bind(Leaf).to_self(Singleton)
+    container.enable_stats()
+    container.enable_stats()
+
+    scope.resolve(Leaf)
+
+    assert container.stats().types[Leaf].resolves == 1
+
+
+@pytest.mark.anyio
+async def test_stats_lock_waits(acontainer: Container, ascope: Scope) -> None:
+    async def create_leaf() -> Leaf:
+        await asyncio.sleep(0.01)
+        return Leaf()
+
+    acontainer.enable_stats()
+    acontainer.bind(Leaf).to_factory(create_leaf, Singleton)
+
+    await asyncio.gather(*(ascope.aresolve(Leaf) for _ in range(3)))
+
+    stats = acontainer.stats().types[Leaf]
+    assert (stats.lock_wait_duration.count, stats.max_lock_waiters) == (2, 2)
+    assert stats.lock_wait_duration.sum > 0
+
+
+def test_stats_scopes_lifecycle(container: Container) -> None:
+    container.enable_stats(buckets=(60,))
+    with container.create_scope():
+        pass
+    container.create_scope()
+
+    scopes = container.stats().scopes
+    assert (scopes.opened, scopes.closed, scopes.leaked) == (2, 1, 1)
+    assert (scopes.lifetime.counts, scopes.teardown_duration.counts) == ((1, 0), (1, 0))
+
+
+def test_stats_count_scopes_leaked_while_collecting_stats(container: Container) -> None:
+    container.enable_stats()
+    scope = container.create_scope()
+
+    # NOTE: garbage collection can happen anytime, including while stats are updated
+    with container._stats._lock:  # type: ignore[union-attr]  # noqa: SLF001
+        del scope
+
+    assert container.stats().scopes.leaked == 1
+
+
+def test_stats_to_prometheus() -> None:
+    stats = ContainerStats(
+        types={
+            Leaf: TypeStats(
+                type_=Leaf,
+                lifetime="Scoped",
+                resolves=3,
+                cache_hits=2,
+                created=1,
+                released=1,
+                factory_duration=Histogram(
+                    buckets=(0.1, 1.0), counts=(1, 0, 0), sum=0.05
+                ),
+            )
+        },
+        open_scopes=2,
+        scopes=ScopeStats(
+            opened=3, closed=1, lifetime=Histogram((1.0,), (0, 1), sum=2.5)
+        ),
+    )
+    labels = 'type="tests.test_stats.Leaf",lifetime="Scoped"'
+
+    assert stats.to_prometheus(prefix="app") == "\n".join(
+        [
+            "# HELP app_resolves_total Number of resolutions per type.",
+            "# TYPE app_resolves_total counter",
+            f"app_resolves_total{{{labels}}} 3",
+            "# HELP app_cache_hits_total Number of cached instances reused.",
+            "# TYPE app_cache_hits_total counter",
+            f"app_cache_hits_total{{{labels}}} 2",
+            "# HELP app_instances_created_total Number of instances created.",
+            "# TYPE app_instances_created_total counter",
+            f"app_instances_created_total{{{labels}}} 1",
+            "# HELP app_instances_released_total Number of instances released.",
+            "# TYPE app_instances_released_total counter",
+            f"app_instances_released_total{{{labels}}} 1",
+            "# HELP app_factory_duration_seconds Time spent creating instances, "
+            "excluding dependencies.",
+            "# TYPE app_factory_duration_seconds histogram",
+            f'app_factory_duration_seconds_bucket{{{labels},le="0.1"}} 1',
+            f'app_factory_duration_seconds_bucket{{{labels},le="1.0"}} 1',
+            f'app_factory_duration_seconds_bucket{{{labels},le="+Inf"}} 1',
+            f"app_factory_duration_seconds_sum{{{labels}}} 0.05",
+            f"app_factory_duration_seconds_count{{{labels}}} 1",
+            "# HELP app_lock_wait_duration_seconds Time spent waiting for concurrent "
+            "creations of instances.",
+            "# TYPE app_lock_wait_duration_seconds histogram",
+            f'app_lock_wait_duration_seconds_bucket{{{labels},le="+Inf"}} 0',
+            f"app_lock_wait_duration_seconds_sum{{{labels}}} 0.0",
+            f"app_lock_wait_duration_seconds_count{{{labels}}} 0",
+            "# HELP app_lock_waiters_max Maximum number of concurrent waiters for "
+            "instances creations.",
+            "# TYPE app_lock_waiters_max gauge",
+            f"app_lock_waiters_max{{{labels}}} 0",
+            "# HELP app_open_scopes Number of open scopes.",
+            "# TYPE app_open_scopes gauge",
+            "app_open_scopes 2",
+            "# HELP app_scopes_opened_total Number of scopes created.",
+            "# TYPE app_scopes_opened_total counter",
+            "app_scopes_opened_total 3",
+            "# HELP app_scopes_closed_total Number of scopes closed.",
+            "# TYPE app_scopes_closed_total counter",
+            "app_scopes_closed_total 1",
+            "# HELP app_scopes_leaked_total Number of scopes garbage collected without "
+            "being closed.",
+            "# TYPE app_scopes_leaked_total counter",
+            "app_scopes_leaked_total 0",
+            "# HELP app_scope_lifetime_seconds Time elapsed between scopes creation "
+            "and closing.",
+            "# TYPE app_scope_lifetime_seconds histogram",
+            'app_scope_lifetime_seconds_bucket{le="1.0"} 0',
+            'app_scope_lifetime_seconds_bucket{le="+Inf"} 1',
+            "app_scope_lifetime_seconds_sum 2.5",
+            "app_scope_lifetime_seconds_count 1",
+            "# HELP app_scope_teardown_duration_seconds Time spent closing scopes.",
+            "# TYPE app_scope_teardown_duration_seconds histogram",
+            'app_scope_teardown_duration_seconds_bucket{le="+Inf"} 0',
+            "app_scope_teardown_duration_seconds_sum 0.0",
+            "app_scope_teardown_duration_seconds_count 0",
+            "",
+        ]
+    )